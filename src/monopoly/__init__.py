@@ -1,3 +1,20 @@
+from typing import Any
+
 from monopoly.log import get_logger
 
 logger = get_logger()
+
+
+def __getattr__(name: str) -> Any:
+    # the version is read from the package metadata on first use, which is slow to import
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("monopoly-core")
+        except PackageNotFoundError:
+            value = "unknown"
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
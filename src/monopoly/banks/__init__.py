@@ -1,53 +1,89 @@
+"""
+Bank classes, and the list of banks used for detection.
+
+Banks are imported on first access, so that importing this package does not
+compile the statement configuration of every bank.
+"""
+
 import logging
+from typing import TYPE_CHECKING, Any
 
-from .amex import Amex
-from .bank_of_america import BankOfAmerica
-from .base import BankBase
-from .bmo import BankOfMontreal
-from .canadian_tire import CanadianTire
-from .capitalone import CapitalOneCanada
-from .chase import Chase
-from .cibc import CIBC
-from .citibank import Citibank
-from .dbs import Dbs
-from .detector import BankDetector
-from .hsbc import Hsbc
-from .maybank import Maybank
-from .ocbc import Ocbc
-from .rbc import RoyalBankOfCanada
-from .schwab_bank import Schwab
-from .scotiabank import Scotiabank
-from .standard_chartered import StandardChartered
-from .td_canada_trust import TDCanadaTrust
-from .trust import Trust
-from .uob import Uob
-from .usbank import UsBank
-from .zkb import ZurcherKantonalBank
-
-banks: list[type[BankBase]] = [
-    Amex,
-    BankOfAmerica,
-    BankOfMontreal,
-    CanadianTire,
-    CapitalOneCanada,
-    Chase,
-    CIBC,
-    Citibank,
-    Dbs,
-    Hsbc,
-    Maybank,
-    Ocbc,
-    RoyalBankOfCanada,
-    Schwab,
-    Scotiabank,
-    StandardChartered,
-    TDCanadaTrust,
-    Trust,
-    Uob,
-    UsBank,
-    ZurcherKantonalBank,
-]
+from .registry import BUILTIN_BANKS, load_bank, load_banks
+
+if TYPE_CHECKING:
+    from .amex import Amex
+    from .bank_of_america import BankOfAmerica
+    from .base import BankBase
+    from .bmo import BankOfMontreal
+    from .canadian_tire import CanadianTire
+    from .capitalone import CapitalOneCanada
+    from .chase import Chase
+    from .cibc import CIBC
+    from .citibank import Citibank
+    from .dbs import Dbs
+    from .detector import BankDetector
+    from .hsbc import Hsbc
+    from .maybank import Maybank
+    from .ocbc import Ocbc
+    from .rbc import RoyalBankOfCanada
+    from .schwab_bank import Schwab
+    from .scotiabank import Scotiabank
+    from .standard_chartered import StandardChartered
+    from .td_canada_trust import TDCanadaTrust
+    from .trust import Trust
+    from .uob import Uob
+    from .usbank import UsBank
+    from .zkb import ZurcherKantonalBank
+
+    banks: list[type[BankBase]]
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["BankDetector", "BankBase"] + [bank.__name__ for bank in banks]
+
+def __getattr__(name: str) -> Any:
+    if name == "banks":
+        value: Any = load_banks()
+    elif name in BUILTIN_BANKS:
+        value = load_bank(name)
+    elif name == "BankBase":
+        from .base import BankBase
+
+        value = BankBase
+    elif name == "BankDetector":
+        from .detector import BankDetector
+
+        value = BankDetector
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # cache the value, so that later lookups do not go through this function
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "CIBC",
+    "Amex",
+    "BankBase",
+    "BankDetector",
+    "BankOfAmerica",
+    "BankOfMontreal",
+    "CanadianTire",
+    "CapitalOneCanada",
+    "Chase",
+    "Citibank",
+    "Dbs",
+    "Hsbc",
+    "Maybank",
+    "Ocbc",
+    "RoyalBankOfCanada",
+    "Schwab",
+    "Scotiabank",
+    "StandardChartered",
+    "TDCanadaTrust",
+    "Trust",
+    "Uob",
+    "UsBank",
+    "ZurcherKantonalBank",
+]
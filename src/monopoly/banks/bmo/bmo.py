@@ -22,7 +22,9 @@ class BankOfMontreal(BankBase):
         transaction_pattern=re.compile(
             rf"^(?!.*(?:Closing totals)).*?"
             rf"(?P<transaction_date>{ISO8601.MMM_DD})\s+"
-            rf"{SharedPatterns.DESCRIPTION}\s+"
+            # the description is empty or starts after the whitespace, so that long runs of
+            # whitespace are not split between the date, the description and the amount
+            r"(?P<description>(?:\S.*?)?)\s{2,}"
             rf"(?P<amount>{SharedPatterns.COMMA_FORMAT})\s+"
             rf"(?P<balance>{SharedPatterns.COMMA_FORMAT})$"
         ),
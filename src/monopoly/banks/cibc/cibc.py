@@ -19,6 +19,9 @@ class CIBC(BankBase):
             rf"(?:to\s+)?(?P<date>{DateFormats.MMM}\s+{DateFormats.DD},\s+{DateFormats.YYYY})"
         ),
         transaction_pattern=re.compile(
+            # fail fast on lines without an amount and a balance, instead of
+            # backtracking over every way to split the line into a description
+            r"(?=.*\s\s\d{1,3}(?:,\d{3})*\.\d*[-\s]+-?\$?\d)"
             rf"\s*(?:(?P<transaction_date>{DateFormats.MMM}\s+{DateFormats.D})[-\s]+)?"
             r"(?P<description>(?!(Deposits)).+?)\s{2,}"
             rf"(?P<amount>{SharedPatterns.COMMA_FORMAT})"
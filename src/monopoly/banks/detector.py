@@ -1,32 +1,252 @@
 # monopoly/detectors/bank_detector.py
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, fields
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, TypeVar
 
-from monopoly.identifiers import IdentifierGroup
+from monopoly.identifiers import Identifier, IdentifierGroup, MetadataIdentifier, TextIdentifier
 from monopoly.pdf import PdfDocument
 
 if TYPE_CHECKING:
     from monopoly.banks.base import BankBase
+    from monopoly.banks.registry import BankEntry
+    from monopoly.cache import DetectionCache
 
 logger = logging.getLogger(__name__)
 
+# a bank class, or a bank read from the registry snapshot
+BankT = TypeVar("BankT", bound="type[BankBase] | BankEntry")
+
+# length of the substrings used to index metadata values
+NGRAM_SIZE = 3
+
+# position of an identifier group, as (bank index, group index)
+GroupPosition = tuple[int, int]
+
+
+def _get_ngrams(value: str) -> set[str]:
+    return {value[i : i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)}
+
+
+class TextMatcher:
+    """
+    Finds every one of a set of texts in a document, in a single pass over its pages.
+
+    The texts are compiled into one regex, with shared prefixes merged into a
+    trie, so the cost of a scan depends on the length of the document rather
+    than on the number of texts. The regex is wrapped in a lookahead to find
+    overlapping texts, and matches the longest text at each position. Texts
+    contained within a matched text are also recorded as found.
+    """
+
+    def __init__(self, texts: Iterable[str]):
+        self.texts = sorted({text for text in texts if text})
+        self.pattern = re.compile(f"(?=({self._get_trie_pattern(self.texts)}))") if self.texts else None
+        self.found_within = {text: {other for other in self.texts if other in text} for text in self.texts}
+        # the end of the previous page is kept, to match text that spans a page boundary
+        self.overlap = max((len(text) for text in self.texts), default=1) - 1
+
+    def __contains__(self, text: str) -> bool:
+        return text in self.found_within
+
+    def iter_matches(self, page_texts: Iterable[str]) -> Iterator[set[str]]:
+        """Yield the texts found on each non-empty page, including those that start on the previous page."""
+        if self.pattern is None:
+            return
+        tail = ""
+        for page_text in page_texts:
+            if not page_text:
+                continue
+            text = tail + page_text
+            found: set[str] = set()
+            for match in self.pattern.finditer(text):
+                found.update(self.found_within[match.group(1)])
+            yield found
+            tail = text[-self.overlap :] if self.overlap > 0 else ""
+
+    @staticmethod
+    def _get_trie_pattern(texts: Iterable[str]) -> str:
+        trie: dict = {}
+        for text in texts:
+            node = trie
+            for char in text:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+            if not branches:
+                return ""
+            pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            # a text ends here, but longer texts are preferred
+            return f"(?:{pattern})?" if "" in node else pattern
+
+        return build(trie)
+
+
+class DetectionIndex:
+    """
+    Narrows down the identifier groups that could match a document, using its metadata.
+
+    A metadata identifier only matches if each of its configured values is a
+    substring of the document's metadata, so every n-gram of a configured value
+    must also appear in the document's metadata. Each group is indexed under the
+    rarest n-gram of one of its metadata values, and is only checked if that
+    n-gram is found in the document.
+
+    Groups that cannot be indexed (e.g. groups with only text identifiers) are
+    always candidates, so the candidates are a superset of the matching groups.
+
+    The text identifiers of every bank are compiled into a single matcher.
+    """
+
+    def __init__(self, banks: Sequence["type[BankBase] | BankEntry"]):
+        self.banks = banks
+        self.text_matcher = TextMatcher(
+            identifier.text
+            for bank in banks
+            for group in bank.identifiers
+            for identifier in group
+            if isinstance(identifier, TextIdentifier)
+        )
+        self.unindexed: list[GroupPosition] = []
+        self.index: dict[tuple[str, str], list[GroupPosition]] = defaultdict(list)
+
+        groups = {
+            (bank_index, group_index): group
+            for bank_index, bank in enumerate(banks)
+            for group_index, group in enumerate(bank.identifiers)
+        }
+        metadata_values = {position: self._get_metadata_values(group) for position, group in groups.items()}
+        ngram_counts = Counter(
+            (field, ngram)
+            for values in metadata_values.values()
+            for field, value in values
+            for ngram in _get_ngrams(value)
+        )
+
+        for position, values in metadata_values.items():
+            keys = [(field, ngram) for field, value in values for ngram in sorted(_get_ngrams(value))]
+            if not keys:
+                self.unindexed.append(position)
+                continue
+            self.index[min(keys, key=ngram_counts.__getitem__)].append(position)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Identify the banks, their order and their identifiers, so that cached results can be invalidated."""
+        hash_object = hashlib.sha256()
+        for bank in self.banks:
+            hash_object.update(f"{bank.__module__}.{bank.__qualname__}:{bank.identifiers!r}\n".encode())
+        return hash_object.hexdigest()
+
+    def get_candidates(self, metadata: MetadataIdentifier) -> list[GroupPosition]:
+        """Return the positions of groups that could match the metadata, in bank and group order."""
+        candidates = set(self.unindexed)
+        for field in fields(metadata):
+            for ngram in _get_ngrams(getattr(metadata, field.name)):
+                candidates.update(self.index.get((field.name, ngram), ()))
+        return sorted(candidates)
+
+    @staticmethod
+    def _get_metadata_values(group: IdentifierGroup) -> list[tuple[str, str]]:
+        return [
+            (field.name, value)
+            for identifier in group
+            if isinstance(identifier, MetadataIdentifier)
+            for field in fields(identifier)
+            if len(value := getattr(identifier, field.name)) >= NGRAM_SIZE
+        ]
+
+
+@lru_cache(maxsize=8)
+def get_detection_index(banks: tuple["type[BankBase] | BankEntry", ...]) -> DetectionIndex:
+    """Build the detection index once per process for each list of banks."""
+    return DetectionIndex(banks)
+
 
 class BankDetector:
     def __init__(self, document: PdfDocument):
         self.document = document
         self.metadata_identifier = document.metadata_identifier
+        self.text_matcher: TextMatcher | None = None
+        self.found_texts: set[str] = set()
+        self._text_matches: Iterator[set[str]] | None = None
+        # whether the metadata stage of detection was read from a cache, or None if no cache was used
+        self.cache_hit: bool | None = None
+
+    def detect_bank(self, banks: Sequence[BankT], cache: "DetectionCache | None" = None) -> BankT | None:
+        """
+        Detect the bank by checking its identifier groups against the document.
 
-    def detect_bank(self, banks: list[type["BankBase"]]) -> type["BankBase"] | None:
-        """Detect the bank by checking its identifier groups against the document."""
+        Only the groups returned by the detection index are checked. These are
+        visited in the same order as the banks, so the first bank with a fully
+        matching group is returned, as with a linear scan over every bank.
+
+        If a cache is given, the metadata stage of detection is looked up by the
+        document's metadata: the first group without text identifiers that matches
+        the metadata. Groups with text identifiers are still checked against the
+        document if they come before that group, since the text of documents with
+        the same metadata can differ. The result is the same as without a cache.
+        """
         logger.debug("Found PDF properties: %s", self.metadata_identifier)
-        for bank in banks:
+        index = get_detection_index(tuple(banks))
+        self.set_text_matcher(index.text_matcher)
+        candidates = index.get_candidates(self.metadata_identifier)
+        if cache is None:
+            return self._detect_bank(banks, candidates)
+
+        key = cache.make_key(index.fingerprint, asdict(self.metadata_identifier))
+        if entry := cache.get(key):
+            self.cache_hit = True
+            metadata_match = None if entry["group"] is None else (entry["group"][0], entry["group"][1])
+        else:
+            self.cache_hit = False
+            metadata_match = self._match_metadata(banks, candidates)
+            cache.set(key, {"group": metadata_match})
+
+        # only groups with text identifiers can match before the first group that matches the metadata
+        text_candidates = [
+            position
+            for position in candidates
+            if (metadata_match is None or position < metadata_match) and self._has_text_identifier(banks, position)
+        ]
+        if bank := self._detect_bank(banks, text_candidates):
+            return bank
+        if metadata_match is None:
+            return None
+        bank = banks[metadata_match[0]]
+        logger.debug("Identified statement bank: %s", bank.__name__)
+        return bank
+
+    def _detect_bank(self, banks: Sequence[BankT], candidates: Iterable[GroupPosition]) -> BankT | None:
+        for bank_index, group_index in candidates:
+            bank = banks[bank_index]
+            group = bank.identifiers[group_index]
             # A bank is identified if ANY of its identifier groups is a full match
-            if any(self.identifiers_match(group) for group in bank.identifiers):
+            if self.identifiers_match(group):
                 logger.debug("Identified statement bank: %s", bank.__name__)
                 return bank
         return None
 
+    def _match_metadata(self, banks: Sequence[BankT], candidates: Iterable[GroupPosition]) -> GroupPosition | None:
+        """Return the position of the first group without text identifiers that matches the document's metadata."""
+        for position in candidates:
+            if not self._has_text_identifier(banks, position) and self.identifiers_match(
+                banks[position[0]].identifiers[position[1]]
+            ):
+                return position
+        return None
+
+    def _has_text_identifier(self, banks: Sequence[BankT], position: GroupPosition) -> bool:
+        bank_index, group_index = position
+        return any(self._is_text_identifier(identifier) for identifier in banks[bank_index].identifiers[group_index])
+
     def identifiers_match(self, identifiers: IdentifierGroup) -> bool:
         """
         Check if ALL identifiers in a given group match the document.
@@ -37,5 +257,54 @@ class BankDetector:
             return False
 
         # Polymorphically call .matches() on each identifier in the group.
-        # ALL of them must return True for the group to match.
-        return all(identifier.matches(self) for identifier in identifiers)
+        # ALL of them must return True for the group to match, so metadata
+        # identifiers are checked first to avoid reading the document's text
+        # for groups that can already be ruled out.
+        return all(identifier.matches(self) for identifier in sorted(identifiers, key=self._is_text_identifier))
+
+    @staticmethod
+    def _is_text_identifier(identifier: Identifier) -> bool:
+        return isinstance(identifier, TextIdentifier)
+
+    def set_text_matcher(self, text_matcher: TextMatcher) -> None:
+        """Use a matcher to find text identifiers, discarding texts found by a previous matcher."""
+        if text_matcher is self.text_matcher:
+            return
+        self.text_matcher = text_matcher
+        self.found_texts = set()
+        self._text_matches = None
+
+    def contains_text(self, text: str) -> bool:
+        """
+        Check if a text exists in the document's raw text.
+
+        Texts known to the matcher are looked up in the set of found texts, and
+        further pages are only scanned until the text is found. Every text found
+        along the way is recorded, so the document is scanned at most once for
+        all text identifiers.
+        """
+        if self.text_matcher is None or text not in self.text_matcher:
+            return self._search_text(text)
+
+        if self._text_matches is None:
+            self._text_matches = self.text_matcher.iter_matches(self.document.iter_page_texts())
+        while text not in self.found_texts:
+            found = next(self._text_matches, None)
+            if found is None:
+                return False
+            self.found_texts |= found
+        return True
+
+    def _search_text(self, text: str) -> bool:
+        """Search the document page by page for a single text, stopping once it is found."""
+        overlap = len(text) - 1
+        tail = ""
+        for page_text in self.document.iter_page_texts():
+            # Ensure the document has raw text before checking
+            if not page_text:
+                continue
+            search_text = tail + page_text
+            if text in search_text:
+                return True
+            tail = search_text[-overlap:] if overlap > 0 else ""
+        return False
@@ -21,6 +21,7 @@ class Ocbc(BankBase):
             r"(?P<transaction_date>\d+/\d+)\s+" + SharedPatterns.DESCRIPTION + SharedPatterns.AMOUNT_EXTENDED
         ),
         transaction_date_format="%d/%m",
+        transaction_batch=True,
     )
 
     debit = StatementConfig(
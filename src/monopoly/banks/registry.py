@@ -0,0 +1,130 @@
+"""
+Registry of bank classes, which are only imported when they are first used.
+
+Other packages can register their own banks under the `monopoly.banks` entry
+point group, e.g. in their pyproject.toml:
+
+    [project.entry-points."monopoly.banks"]
+    my_bank = "my_package.banks:MyBank"
+"""
+
+import logging
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from monopoly.banks.base import BankBase
+    from monopoly.identifiers import IdentifierGroup
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "monopoly.banks"
+
+# class name and module of each built-in bank, in the order that banks are detected
+BUILTIN_BANKS: dict[str, str] = {
+    "Amex": "monopoly.banks.amex",
+    "BankOfAmerica": "monopoly.banks.bank_of_america",
+    "BankOfMontreal": "monopoly.banks.bmo",
+    "CanadianTire": "monopoly.banks.canadian_tire",
+    "CapitalOneCanada": "monopoly.banks.capitalone",
+    "Chase": "monopoly.banks.chase",
+    "CIBC": "monopoly.banks.cibc",
+    "Citibank": "monopoly.banks.citibank",
+    "Dbs": "monopoly.banks.dbs",
+    "Hsbc": "monopoly.banks.hsbc",
+    "Maybank": "monopoly.banks.maybank",
+    "Ocbc": "monopoly.banks.ocbc",
+    "RoyalBankOfCanada": "monopoly.banks.rbc",
+    "Schwab": "monopoly.banks.schwab_bank",
+    "Scotiabank": "monopoly.banks.scotiabank",
+    "StandardChartered": "monopoly.banks.standard_chartered",
+    "TDCanadaTrust": "monopoly.banks.td_canada_trust",
+    "Trust": "monopoly.banks.trust",
+    "Uob": "monopoly.banks.uob",
+    "UsBank": "monopoly.banks.usbank",
+    "ZurcherKantonalBank": "monopoly.banks.zkb",
+}
+
+
+class BankEntry:
+    """
+    A built-in bank, as recorded in the registry snapshot.
+
+    An entry has the same names and identifiers as its bank class, so it can be
+    used for detection in place of the class. The bank's module is only
+    imported once `load()` is called.
+    """
+
+    def __init__(self, module: str, qualname: str, name: str, identifiers: list["IdentifierGroup"]):
+        self.__module__ = module
+        self.__qualname__ = qualname
+        self.__name__ = qualname.rpartition(".")[2]
+        self.name = name
+        self.identifiers = identifiers
+
+    def __repr__(self) -> str:
+        return f"<BankEntry {self.__module__}.{self.__qualname__}>"
+
+    def load(self) -> type["BankBase"]:
+        return getattr(import_module(self.__module__), self.__qualname__)
+
+
+def load_bank(class_name: str) -> type["BankBase"]:
+    """Import a built-in bank by its class name."""
+    return getattr(import_module(BUILTIN_BANKS[class_name]), class_name)
+
+
+def load_entry_point_banks() -> list[type["BankBase"]]:
+    """Import the banks registered by other packages, skipping any that fail to load."""
+    from importlib.metadata import entry_points
+
+    from monopoly.banks.base import BankBase
+
+    banks = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            bank = entry_point.load()
+        except Exception:
+            logger.exception("Unable to load bank from entry point %s", entry_point.value)
+            continue
+
+        if not (isinstance(bank, type) and issubclass(bank, BankBase)):
+            logger.warning("Entry point %s is not a subclass of BankBase, skipping", entry_point.value)
+            continue
+        banks.append(bank)
+    return banks
+
+
+def load_banks() -> list[type["BankBase"]]:
+    """Import every built-in bank, followed by the banks registered through entry points."""
+    return [*(load_bank(class_name) for class_name in BUILTIN_BANKS), *load_entry_point_banks()]
+
+
+def get_detection_banks() -> list["type[BankBase] | BankEntry"]:
+    """
+    Return the banks to detect statements with, in detection order.
+
+    If the banks have not been imported yet, the built-in banks are read from the
+    registry snapshot instead, so that only the module of the detected bank is
+    imported and validated.
+    """
+    import monopoly.banks
+
+    if "banks" in vars(monopoly.banks):
+        return list(monopoly.banks.banks)
+    return list(_load_snapshot_banks())
+
+
+def load_detected_bank(bank: "type[BankBase] | BankEntry") -> type["BankBase"]:
+    """Import the class of a detected bank, if it was read from the snapshot."""
+    return bank.load() if isinstance(bank, BankEntry) else bank
+
+
+@cache
+def _load_snapshot_banks() -> tuple["type[BankBase] | BankEntry", ...]:
+    from monopoly.banks.snapshot import load_snapshot
+
+    if (entries := load_snapshot()) is None:
+        return tuple(load_banks())
+    return (*entries, *load_entry_point_banks())
@@ -0,0 +1,137 @@
+"""
+Builds and loads a snapshot of the built-in banks.
+
+The snapshot records the names and identifiers of every built-in bank, so that
+statements can be detected without importing every bank module. Building the
+snapshot imports and validates every bank, and compiles all of their patterns,
+so that invalid configurations are caught at build time:
+
+    python -m monopoly.banks.snapshot
+
+The snapshot must be rebuilt whenever a bank's identifiers change, which is
+checked by `python -m monopoly.banks.snapshot --check`.
+"""
+
+import json
+import logging
+import sys
+from dataclasses import asdict
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from monopoly.banks.registry import BUILTIN_BANKS, BankEntry, load_bank
+from monopoly.constants import ISO8601
+from monopoly.enums import RegexEnum
+from monopoly.identifiers import Identifier, MetadataIdentifier, TextIdentifier
+
+if TYPE_CHECKING:
+    from monopoly.banks.base import BankBase
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PATH = Path(__file__).with_name("snapshot.json")
+SNAPSHOT_VERSION = 1
+IDENTIFIER_TYPES: dict[str, type[Identifier]] = {
+    identifier_type.__name__: identifier_type for identifier_type in (MetadataIdentifier, TextIdentifier)
+}
+PATTERN_FIELDS = (
+    "transaction_pattern",
+    "statement_date_pattern",
+    "header_pattern",
+    "prev_balance_pattern",
+    "filename_fallback_pattern",
+)
+
+
+def compile_patterns(banks: list[type["BankBase"]]) -> None:
+    """
+    Compile every shared date pattern, and every pattern of each bank's statement configs.
+
+    Patterns given as `RegexEnum` members are only compiled on first use, so
+    this raises an error for any invalid pattern, and caches the compiled
+    patterns in the current process.
+    """
+    patterns = [
+        *ISO8601,
+        *(getattr(config, field) for bank in banks for config in bank.statement_configs for field in PATTERN_FIELDS),
+    ]
+    for pattern in patterns:
+        if isinstance(pattern, RegexEnum):
+            _ = pattern.regex
+
+
+def build_snapshot(banks: list[type["BankBase"]]) -> dict[str, Any]:
+    """Record the names and identifiers of each bank, after compiling their patterns."""
+    compile_patterns(banks)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "banks": [
+            {
+                "module": bank.__module__,
+                "qualname": bank.__qualname__,
+                "name": bank.name,
+                "identifiers": [
+                    [{"type": type(identifier).__name__, **asdict(identifier)} for identifier in group]
+                    for group in bank.identifiers
+                ],
+            }
+            for bank in banks
+        ],
+    }
+
+
+def build_builtin_snapshot() -> dict[str, Any]:
+    return build_snapshot([load_bank(class_name) for class_name in BUILTIN_BANKS])
+
+
+@cache
+def load_snapshot(path: Path = SNAPSHOT_PATH) -> tuple[BankEntry, ...] | None:
+    """Read the banks recorded in a snapshot, or None if the snapshot is missing or outdated."""
+    try:
+        with open(path, encoding="utf8") as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError):
+        logger.warning("Unable to read bank snapshot at %s", path)
+        return None
+
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        logger.warning("Ignoring bank snapshot with version %s", snapshot.get("version"))
+        return None
+
+    return tuple(
+        BankEntry(
+            module=bank["module"],
+            qualname=bank["qualname"],
+            name=bank["name"],
+            identifiers=[
+                [IDENTIFIER_TYPES[fields.pop("type")](**fields) for fields in group] for group in bank["identifiers"]
+            ],
+        )
+        for bank in snapshot["banks"]
+    )
+
+
+@click.command()
+@click.option("--check", is_flag=True, help="Exit with an error if the snapshot is outdated, instead of writing it.")
+@click.option("--path", type=click.Path(path_type=Path), default=SNAPSHOT_PATH, help="Location of the snapshot.")
+def main(*, check: bool, path: Path) -> None:
+    """Validate every built-in bank, and write a snapshot of their identifiers."""
+    snapshot = build_builtin_snapshot()
+    content = json.dumps(snapshot, indent=2, ensure_ascii=False) + "\n"
+
+    if check:
+        if not path.exists() or path.read_text(encoding="utf8") != content:
+            click.echo(f"{path} is outdated, run `python -m monopoly.banks.snapshot` to rebuild it", err=True)
+            sys.exit(1)
+        click.echo(f"{path} is up to date")
+        return
+
+    path.write_text(content, encoding="utf8")
+    click.echo(f"Wrote {len(snapshot['banks'])} banks to {path}")
+
+
+if __name__ == "__main__":
+    main()
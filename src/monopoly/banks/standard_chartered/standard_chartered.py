@@ -20,9 +20,10 @@ class StandardChartered(BankBase):
         transaction_pattern=re.compile(
             rf"(?P<transaction_date>{ISO8601.DD_MMM})\s+"
             rf"(?P<posting_date>{ISO8601.DD_MMM})\s+"
-            + SharedPatterns.DESCRIPTION
-            + r"(?:(?P<transaction_ref>Transaction\sRef\s\d+)?)\s+"
-            + SharedPatterns.AMOUNT_EXTENDED
+            # the description is empty or starts after the whitespace, so that long runs of
+            # whitespace are not split between the dates, the description and the amount
+            r"(?P<description>(?:\S.*?)?)"
+            r"(?:\s+(?P<transaction_ref>Transaction\sRef\s\d+)\s+|\s{2,})" + SharedPatterns.AMOUNT_EXTENDED
         ),
         transaction_date_format="%d %b",
     )
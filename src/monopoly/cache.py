@@ -0,0 +1,149 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+import monopoly
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "monopoly"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class CacheSettings(BaseSettings):
+    """
+    Pydantic model that automatically populates cache settings from a .env file.
+
+    Also populates using environment variables, e.g.
+    export MONOPOLY_CACHE=true
+    export MONOPOLY_CACHE_DIR=/tmp/monopoly
+    export MONOPOLY_CACHE_MAX_SIZE=104857600
+    """
+
+    monopoly_cache: bool = False
+    monopoly_cache_dir: Path = DEFAULT_CACHE_DIR
+    monopoly_cache_max_size: int = DEFAULT_MAX_SIZE
+    model_config = SettingsConfigDict(env_file=".env", extra="allow")
+
+
+class DiskCache:
+    """
+    A directory of JSON entries, with least-recently-used eviction.
+
+    Each entry is stored in its own file, so that concurrent worker processes
+    never write to the same file. Reads bump the modification time of an entry,
+    which is used to decide which entries are evicted once `max_size` is exceeded.
+
+    The size of the cache is scanned on the first write, and then tracked as entries
+    are written, so the directory is only scanned again when eviction is needed.
+    Entries written by other processes are counted at the next scan.
+    """
+
+    namespace = "default"
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = Path(directory) / self.namespace
+        self.max_size = max_size
+        self._size: int | None = None
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings | None = None):
+        settings = settings or CacheSettings()
+        return cls(settings.monopoly_cache_dir, settings.monopoly_cache_max_size)
+
+    def get(self, key: str) -> Any | None:
+        path = self._get_path(key)
+        try:
+            with open(path, encoding="utf8") as file:
+                value = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._get_path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        data = json.dumps(value).encode("utf-8")
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temp_path.write_bytes(data)
+            replaced_size = path.stat().st_size if path.exists() else 0
+            temp_path.replace(path)
+        except OSError as err:
+            logger.warning("Unable to write to cache %s: %s", self.directory, err)
+            temp_path.unlink(missing_ok=True)
+            return
+
+        if self._size is None:
+            self.evict()
+            return
+        self._size += len(data) - replaced_size
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits within `max_size`."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            # entries may be evicted concurrently by another worker
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            Path(path).unlink(missing_ok=True)
+            total_size -= size
+        self._size = total_size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._size = None
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+
+class PageCache(DiskCache):
+    """Caches the raw text of extracted pages, keyed by the PDF content and the parser configuration."""
+
+    namespace = "pages"
+
+    @staticmethod
+    def make_key(pdf_bytes: bytes, *args: Any) -> str:
+        """Hash the PDF bytes together with the monopoly version and every setting that affects the extracted text."""
+        hash_object = hashlib.sha256(pdf_bytes)
+        hash_object.update(json.dumps([CACHE_VERSION, monopoly.__version__, *args], default=repr).encode("utf-8"))
+        return hash_object.hexdigest()
+
+
+class DetectionCache(DiskCache):
+    """
+    Caches the metadata stage of bank detection, keyed by a document's metadata and the identifiers of every bank.
+
+    Each entry stores the position of the first identifier group without text
+    identifiers that matches the metadata. Groups with text identifiers are not
+    stored, since documents with the same metadata may differ in text.
+    """
+
+    namespace = "detection"
+
+    @staticmethod
+    def make_key(banks_fingerprint: str, metadata: dict[str, str]) -> str:
+        """Hash the document's metadata, together with a fingerprint of the banks and their identifiers."""
+        value = json.dumps([CACHE_VERSION, banks_fingerprint, metadata], sort_keys=True)
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
@@ -1,17 +1,31 @@
+import csv
+import json
+import os
 import traceback
-from collections.abc import Collection, Iterable
+from collections.abc import Collection, Iterable, Iterator
 from concurrent.futures import ProcessPoolExecutor
-from dataclasses import asdict
+from dataclasses import asdict, astuple, fields
 from functools import partial
+from io import StringIO
 from pathlib import Path
 
 import click
 from tabulate import tabulate
 from tqdm import tqdm
 
-from monopoly.cli.models import Report, Result, RunConfig, TqdmSettings
+from monopoly.cli.models import DetectionResult, Report, Result, RunConfig, TqdmSettings
 from monopoly.log import file_context, setup_logs, worker_log_setup
 
+DETECT_CHUNKSIZE = 32
+
+
+def warm_up_worker(*, verbose: bool) -> None:
+    """Set up logging in a worker process, and read the bank registry snapshot before any statement arrives."""
+    from monopoly.banks.registry import get_detection_banks
+
+    worker_log_setup(verbose=verbose)
+    get_detection_banks()
+
 
 def process_statement(file: Path, config: RunConfig) -> Result | None:
     """Extract, transform, and load transactions from bank statements."""
@@ -68,8 +82,6 @@ def _pprint_gemini_transactions(transactions: list, file: Path) -> None:
 
 
 def _write_gemini_csv(result, output_directory: Path, file: Path, *, preserve_filename: bool) -> Path:
-    import csv
-
     if preserve_filename:
         filename = f"{file.stem}.csv"
     else:
@@ -91,9 +103,12 @@ def _write_gemini_csv(result, output_directory: Path, file: Path, *, preserve_fi
 def _process_with_pipeline(file: Path, config: RunConfig) -> Result | None:
     """Process a statement using the standard regex-based pipeline."""
     # Lazily importing here prevents from CLI from having a "slow" start
-    from monopoly.banks import BankDetector, banks
+    from monopoly.banks import BankDetector
+    from monopoly.banks.registry import get_detection_banks, load_detected_bank
+    from monopoly.cache import DetectionCache, PageCache
+    from monopoly.constants import DETECTION_TEXT_PAGES, TextBackend
     from monopoly.generic import GenericBank
-    from monopoly.pdf import PdfDocument, PdfParser
+    from monopoly.pdf import CompactPdfPage, PdfDocument, PdfPage, PdfParser
     from monopoly.pipeline import Pipeline
 
     try:
@@ -104,15 +119,29 @@ def _process_with_pipeline(file: Path, config: RunConfig) -> Result | None:
             document = PdfParser.apply_ocr(document)
 
         analyzer = BankDetector(document)
-        bank = analyzer.detect_bank(banks) or GenericBank
-        parser = PdfParser(bank, document, ocr_engine=config.ocr_engine)
+        detection_cache = DetectionCache.from_settings() if config.cache else None
+        document.text_page_limit = DETECTION_TEXT_PAGES
+        detected_bank = analyzer.detect_bank(get_detection_banks(), cache=detection_cache)
+        document.text_page_limit = None
+        bank = load_detected_bank(detected_bank) if detected_bank else GenericBank
+        parser = PdfParser(
+            bank,
+            document,
+            ocr_engine=config.ocr_engine,
+            page_workers=config.page_workers,
+            cache=PageCache.from_settings() if config.cache else None,
+            text_backend=TextBackend(config.text_backend) if config.text_backend else None,
+            page_cls=CompactPdfPage if config.compact_pages else PdfPage,
+            prune_pages=config.prune_pages,
+        )
         pipeline = Pipeline(parser)
 
         statement = pipeline.extract(safety_check=config.safety_check)
-        transactions = pipeline.transform(statement)
+        transform = pipeline.transform_batch if statement.uses_transaction_batch else pipeline.transform
+        transactions = transform(statement)
 
         if config.pprint:
-            pprint_transactions(transactions, statement, file)
+            pprint_transactions(statement.transactions, statement, file)
             # don't load to CSV if pprint
             return None
 
@@ -126,7 +155,13 @@ def _process_with_pipeline(file: Path, config: RunConfig) -> Result | None:
             config.output_directory,
             preserve_filename=config.preserve_filename,
         )
-        return Result(file.name, output_file.name)
+        return Result(
+            file.name,
+            output_file.name,
+            detection_cache_hit=analyzer.cache_hit,
+            safety_check_time=pipeline.safety_check_time,
+            pruned_pages=pipeline.handler.pruned_pages,
+        )
 
     # ruff: noqa: BLE001
     except Exception as err:
@@ -160,7 +195,7 @@ def get_results(input_files: Collection[Path], config: RunConfig):
     if config.single_process or len(input_files) == 1:
         return [processor(file) for file in tqdm(input_files, **tqdm_settings)]
 
-    initializer = partial(worker_log_setup, verbose=config.verbose)
+    initializer = partial(warm_up_worker, verbose=config.verbose)
 
     with ProcessPoolExecutor(initializer=initializer) as executor:
         return list(
@@ -185,7 +220,61 @@ def run(input_files: Collection[Path], config: RunConfig):
         # filter out null values to avoid pydantic validation errors,
         # for cases where print_df is True and processing errors occur
         report = Report([res for res in results if res])
-        report.display_report(config.verbose)
+        report.display_report(verbose=config.verbose)
+
+
+def detect_statement(file: Path, text_pages: int) -> DetectionResult:
+    """
+    Detect the bank of a statement, without extracting its transactions.
+
+    Banks are identified by metadata where possible, and text is only read from
+    the first `text_pages` pages when an identifier group requires it.
+    """
+    from monopoly.banks import BankDetector
+    from monopoly.banks.registry import get_detection_banks
+    from monopoly.pdf import PdfDocument
+
+    result = DetectionResult(str(file))
+    try:
+        document = PdfDocument(file)
+        result.encrypted = document.is_encrypted
+        document.unlock_document()
+        result.page_count = document.page_count
+        document.text_page_limit = text_pages
+
+        if bank := BankDetector(document).detect_bank(get_detection_banks()):
+            result.bank = bank.name
+
+    except Exception as err:
+        result.error = f"{type(err).__name__}: {err!s}"
+    return result
+
+
+def get_detection_results(
+    input_files: Collection[Path], *, text_pages: int, single_process: bool, verbose: bool
+) -> Iterator[DetectionResult]:
+    """Yield the detection result of each file in order, as soon as it is available."""
+    detector = partial(detect_statement, text_pages=text_pages)
+
+    if single_process or len(input_files) == 1:
+        yield from map(detector, input_files)
+        return
+
+    initializer = partial(warm_up_worker, verbose=verbose)
+
+    # large batches of files are sent to each worker at once, since detection is much
+    # cheaper than the overhead of dispatching a single file to the pool
+    chunksize = max(1, min(DETECT_CHUNKSIZE, len(input_files) // ((os.cpu_count() or 1) * 4)))
+    with ProcessPoolExecutor(initializer=initializer) as executor:
+        yield from executor.map(detector, input_files, chunksize=chunksize)
+
+
+def format_detection_result(result: DetectionResult, output_format: str) -> str:
+    if output_format == "csv":
+        buffer = StringIO()
+        csv.writer(buffer, lineterminator="").writerow(astuple(result))
+        return buffer.getvalue()
+    return json.dumps(asdict(result))
 
 
 def get_statement_paths(files: Iterable[Path]) -> set[Path]:
@@ -201,7 +290,29 @@ def get_statement_paths(files: Iterable[Path]) -> set[Path]:
     return matched_files
 
 
-@click.command()
+class DefaultGroup(click.Group):
+    """
+    A group of commands that falls back to `default_command` if no command is given.
+
+    This keeps `monopoly FILES` working alongside subcommands like `monopoly detect`.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if not args or args[0] not in self.commands:
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultGroup, default_command="convert")
+def monopoly():
+    """Monopoly converts your bank statements from PDF to CSV."""
+
+
+@monopoly.command()
 @click.version_option(package_name="monopoly-core")
 @click.argument(
     "files",
@@ -253,6 +364,47 @@ def get_statement_paths(files: Iterable[Path]) -> set[Path]:
     type=click.Choice(["tesseract", "gemini"], case_sensitive=False),
     help="Apply OCR to extract text from scanned documents. Use 'tesseract' (default) or 'gemini'.",
 )
+@click.option(
+    "--page-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Extract text from long statements across multiple processes.",
+)
+@click.option(
+    "--backend",
+    "text_backend",
+    default=None,
+    type=click.Choice(["pdftotext", "pymupdf"], case_sensitive=False),
+    help="Override the engine used to extract text from statements.",
+)
+@click.option(
+    "--prune",
+    "prune_pages",
+    is_flag=True,
+    help=(
+        "Skip pages without any statement information, like terms and conditions. "
+        "Only applies to banks that opt in with `prune_pages=True` in their PDF config, "
+        "since pages are kept by looking for amounts with a decimal point."
+    ),
+)
+@click.option(
+    "--compact-pages",
+    is_flag=True,
+    help="Store page text more compactly, to reduce memory use on very long statements.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help=(
+        "Reuse text extracted from, and banks detected for, previously processed statements. "
+        "Can also be enabled with MONOPOLY_CACHE=true."
+    ),
+)
+@click.option(
+    "--clear-cache",
+    is_flag=True,
+    help="Remove all cached statement text and detected banks before processing.",
+)
 @click.option(
     "--parser",
     type=click.Choice(["gemini"], case_sensitive=False),
@@ -261,16 +413,32 @@ def get_statement_paths(files: Iterable[Path]) -> set[Path]:
 )
 @click.pass_context
 @setup_logs
-def monopoly(ctx: click.Context, files: list[Path], **kwargs):
+def convert(ctx: click.Context, files: list[Path], *, clear_cache: bool, **kwargs):
     """
     Monopoly converts your bank statements from PDF to CSV.
 
-    A file or directory can be passed in via the FILES argument
+    A file or directory can be passed in via the FILES argument.
+    Run `monopoly detect --help` to identify banks without processing statements.
     """
+    if clear_cache:
+        from monopoly.cache import DetectionCache, PageCache
+
+        for cache in (PageCache.from_settings(), DetectionCache.from_settings()):
+            cache.clear()
+            click.echo(f"Cleared cache at {cache.directory}")
+
+        if not files:
+            return
+
     if files:
         matched_files = get_statement_paths(files)
 
         if matched_files:
+            if kwargs["cache"] is None:
+                from monopoly.cache import CacheSettings
+
+                kwargs["cache"] = CacheSettings().monopoly_cache
+
             run(matched_files, RunConfig(**kwargs))
 
         else:
@@ -283,6 +451,62 @@ def monopoly(ctx: click.Context, files: list[Path], **kwargs):
         show_welcome_message()
 
 
+@monopoly.command()
+@click.argument(
+    "files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, resolve_path=True, path_type=Path),
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    default="json",
+    type=click.Choice(["json", "csv"], case_sensitive=False),
+    help="Output one JSON object or CSV row per file. Defaults to JSON.",
+)
+@click.option(
+    "--text-pages",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of pages to read for banks that are identified by text. Defaults to the first page.",
+)
+@click.option(
+    "-s",
+    "--single-process",
+    is_flag=True,
+    help="Runs detection in a single process. Useful for debugging.",
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    help="Increases logging verbosity.",
+)
+@click.pass_context
+@setup_logs
+def detect(ctx: click.Context, files: list[Path], *, output_format: str, text_pages: int, **kwargs):
+    """
+    Detect the bank of each statement, without processing it.
+
+    Prints the detected bank, page count and encryption state of each file,
+    as soon as it is available.
+    """
+    matched_files = sorted(get_statement_paths(files))
+    if not matched_files:
+        click.echo(click.style("Could not find .pdf files", fg="yellow", bold=True), err=True)
+        ctx.exit(1)
+
+    if output_format == "csv":
+        click.echo(",".join(field.name for field in fields(DetectionResult)))
+
+    for result in get_detection_results(
+        matched_files, text_pages=text_pages, single_process=kwargs["single_process"], verbose=kwargs["verbose"]
+    ):
+        click.echo(format_detection_result(result, output_format))
+
+
 def show_welcome_message():
     art = r"""
      __  __                               _
@@ -325,6 +549,10 @@ def show_welcome_message():
             "monopoly . --parser gemini",
             "uses Google Gemini to extract transactions",
         ),
+        (
+            "monopoly detect .",
+            "detects the bank of each statement, without processing it",
+        ),
         (
             "monopoly --help",
             "show more options and other usage information",
@@ -14,6 +14,22 @@ class RunConfig:
     parser: str | None = None
     verbose: bool = False
     preserve_filename: bool = False
+    page_workers: int | None = None
+    cache: bool = False
+    text_backend: str | None = None
+    compact_pages: bool = False
+    prune_pages: bool = False
+
+
+@dataclass
+class DetectionResult:
+    """Stores the bank detected for a statement, without processing it."""
+
+    file: str
+    bank: str | None = None
+    page_count: int | None = None
+    encrypted: bool | None = None
+    error: str | None = None
 
 
 @dataclass
@@ -35,6 +51,9 @@ class Result:
     source_file_name: str
     target_file_name: str | None = None
     error_info: dict[str, str] = field(default_factory=dict)
+    detection_cache_hit: bool | None = None
+    safety_check_time: float | None = None
+    pruned_pages: int = 0
 
 
 @dataclass
@@ -62,10 +81,23 @@ class Report:
     def number_errored(self) -> int:
         return len(self.errored_results)
 
+    @property
+    def detection_cache_hits(self) -> int:
+        return sum(r.detection_cache_hit is True for r in self.results)
+
+    @property
+    def detection_cache_misses(self) -> int:
+        return sum(r.detection_cache_hit is False for r in self.results)
+
     def display_report(self, *_, verbose=False) -> None:
         """Parse all results, displaying the number of successfully processed statements and any errors."""
         for res in self.processed_results:
-            click.echo(f"{res.source_file_name} -> {res.target_file_name}")
+            message = f"{res.source_file_name} -> {res.target_file_name}"
+            if verbose and res.safety_check_time is not None:
+                message += f" (safety check: {res.safety_check_time * 1000:.2f}ms)"
+            if verbose and res.pruned_pages:
+                message += f" ({res.pruned_pages} page(s) pruned)"
+            click.echo(message)
 
         if self.number_errored > 0:
             error_msg = f"{self.number_errored} statement(s) had errors while processing"
@@ -73,6 +105,9 @@ class Report:
         if self.number_processed > 0:
             changed_msg = f"{self.number_processed} statement(s) processed"
             click.echo(click.style(changed_msg, bold=True))
+        if verbose and self.detection_cache_hits + self.detection_cache_misses > 0:
+            cache_msg = f"Detection cache: {self.detection_cache_hits} hit(s), {self.detection_cache_misses} miss(es)"
+            click.echo(cache_msg)
 
         for res in self.errored_results:
             error_msg = res.error_info["message"]
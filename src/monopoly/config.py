@@ -2,7 +2,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from re import Pattern
 
-from monopoly.constants import EntryType
+from monopoly.constants import EntryType, TextBackend
 from monopoly.enums import RegexEnum
 from monopoly.identifiers import IdentifierGroup
 
@@ -68,6 +68,12 @@ class StatementConfig:
     - `safety_check` controls whether the safety check for banks. Use
     for banks that don't provide total amount (or total debit/credit)
     in the statement. Enabled by default.
+    - `safety_check_tolerance` is the number of cents that the transaction totals may
+    differ by from a number in the statement, and still pass the safety check. Use for
+    banks that round their totals differently from their transactions. Defaults to 0.
+    - `transaction_batch` builds the transactions as columns in NumPy arrays, which the
+    safety check, date conversion and CSV output use without creating an object for each
+    transaction. Falls back to a list if the `numpy` extra is not installed. Disabled by default.
     - `filename_fallback_pattern` is an optional regex pattern that extracts the statement
     date from the filename when it cannot be found in the PDF content. The pattern should
     have two capture groups: (1) month abbreviation and (2) year (e.g., r"_([A-Za-z]{3})(\d{4})")
@@ -85,6 +91,8 @@ class StatementConfig:
     transaction_bound: int | None = None
     prev_balance_pattern: Pattern[str] | RegexEnum | None = None
     safety_check: bool = True
+    safety_check_tolerance: int = 0
+    transaction_batch: bool = False
     transaction_auto_polarity: bool = True
     filename_fallback_pattern: Pattern[str] | None = None
 
@@ -104,9 +112,18 @@ class PdfConfig:
     - `remove_vertical_text`: Whether to remove vertical text from the PDF. This
     helps to avoid issues with pdftotext's layout mode. For performance reasons,
     this defaults to False.
+    - `text_backend`: The engine used to extract layout-preserved text. pdftotext
+    is used by default, while pymupdf reconstructs the layout from the words on
+    each page, without re-serializing the document.
+    - `prune_pages`: Whether pages without any amounts, headers, statement dates or
+    previous balances are skipped before parsing. Should only be enabled for banks
+    whose transaction amounts always contain a decimal point. Disabled by default,
+    and only applied by the CLI when it is run with `--prune`.
     """
 
     page_range: tuple[int | None, int | None] = (None, None)
     page_bbox: tuple[float, float, float, float] | None = None
     ocr_identifiers: Sequence[IdentifierGroup] | None = None
     remove_vertical_text: bool = False
+    text_backend: TextBackend = TextBackend.PDFTOTEXT
+    prune_pages: bool = False
@@ -1,4 +1,5 @@
 from .date import ISO8601
+from .pdf import DETECTION_TEXT_PAGES, TextBackend
 from .statement import (
     Columns,
     EntryType,
@@ -6,8 +7,10 @@ from .statement import (
 )
 
 __all__ = [
+    "DETECTION_TEXT_PAGES",
     "ISO8601",
     "Columns",
     "EntryType",
     "SharedPatterns",
+    "TextBackend",
 ]
@@ -0,0 +1,16 @@
+"""Store PDF-related enums and constants."""
+
+from enum import auto
+
+from monopoly.enums import AutoEnum
+
+# bank identifier texts (e.g. a bank's name or website) are printed on the first pages of a statement,
+# so bank detection in the convert pipeline reads no further
+DETECTION_TEXT_PAGES = 3
+
+
+class TextBackend(AutoEnum):
+    """Engines that can be used to extract the layout-preserved text of a page."""
+
+    PDFTOTEXT = auto()
+    PYMUPDF = auto()
@@ -5,6 +5,8 @@ from typing import Any
 
 from strenum import StrEnum
 
+from monopoly.regex_engine import compile_pattern
+
 
 # pylint: disable=unused-argument,no-self-argument
 class AutoEnum(StrEnum):
@@ -36,7 +38,7 @@ class RegexEnum(Enum):
 
     @cached_property
     def regex(self):
-        return re.compile(self.value)
+        return compile_pattern(self.value)
 
     def __str__(self):
         return self.value
@@ -22,6 +22,7 @@ class ExampleBank(BankBase):
             r"(?P<transaction_date>\d+/\d+)\s*" + SharedPatterns.DESCRIPTION + SharedPatterns.AMOUNT_EXTENDED
         ),
         transaction_date_format="%d/%m",
+        transaction_batch=True,
     )
 
     identifiers = [
@@ -1,10 +1,13 @@
 import logging
+from collections.abc import Sequence
 from functools import cached_property
 
 from monopoly.config import StatementConfig
 from monopoly.constants import EntryType
-from monopoly.pdf import PdfParser
+from monopoly.pdf import PdfPage, PdfParser
+from monopoly.regex_engine import compile_pattern
 from monopoly.statements import BaseStatement, CreditStatement, DebitStatement
+from monopoly.statements.page_filter import PageFilter
 
 logger = logging.getLogger(__name__)
 
@@ -17,36 +20,72 @@ class StatementHandler:
     """
 
     def __init__(self, parser: PdfParser):
+        self.parser = parser
         self.bank = parser.bank
-        self.pages = parser.pages
         self.file_path = parser.document.file_path
+        self.pruned_pages = 0
+
+    @cached_property
+    def pages(self) -> list[PdfPage]:
+        pages = self.parser.pages
+        if not (self.parser.prune_pages and self.bank.pdf_config.prune_pages):
+            return pages
+
+        page_filter = PageFilter(self.bank.statement_configs)
+        relevant_pages = [page for page in pages if page_filter.is_relevant(page)]
+        self.pruned_pages = len(pages) - len(relevant_pages)
+        logger.debug("Pruned %s of %s pages without statement information", self.pruned_pages, len(pages))
+        return relevant_pages
 
     def get_header(self, config: StatementConfig) -> str | None:
-        pattern = config.header_pattern
+        pattern = compile_pattern(config.header_pattern)
 
-        for page in self.pages:
+        # headers are usually on the first page, so avoid extracting the rest of the document
+        for page in self.parser.iter_pages():
             for line in page.lines:
                 if match := pattern.search(line):
                     return match.group().lower()
         return None
 
+    def find_header(self, configs: Sequence[StatementConfig]) -> tuple[StatementConfig, str] | None:
+        """
+        Return the first config with a header in the statement, along with the header.
+
+        This is the same as calling `get_header` for each config in turn, but the header
+        patterns are searched together in a single pass over the lines. Once a config's
+        header is found, only the configs before it are searched, and the search stops
+        when none are left, so pages are not extracted further than they need to be.
+        """
+        patterns = [compile_pattern(config.header_pattern) for config in configs]
+        found: tuple[int, str] | None = None
+        for page in self.parser.iter_pages():
+            for line in page.lines:
+                for index, pattern in enumerate(patterns[: found[0] if found else None]):
+                    if match := pattern.search(line):
+                        found = (index, match.group().lower())
+                        break
+                if found and found[0] == 0:
+                    return configs[0], found[1]
+        return (configs[found[0]], found[1]) if found else None
+
     @cached_property
     def statement(self):
         return self._get_statement()
 
     def _get_statement(self) -> BaseStatement:
-        pages = self.pages
         bank_name = self.bank.name
 
-        for config in self.bank.statement_configs:
-            if header := self.get_header(config):
-                match config.statement_type:
-                    case EntryType.DEBIT:
-                        logger.debug("Statement type detected: %s", EntryType.DEBIT)
-                        return DebitStatement(pages, bank_name, config, header, self.file_path)
-                    case EntryType.CREDIT:
-                        logger.debug("Statement type detected: %s", EntryType.CREDIT)
-                        return CreditStatement(pages, bank_name, config, header, self.file_path)
+        if found := self.find_header(self.bank.statement_configs):
+            config, header = found
+            # the rest of the document is only extracted once the header is found
+            pages = self.pages
+            match config.statement_type:
+                case EntryType.DEBIT:
+                    logger.debug("Statement type detected: %s", EntryType.DEBIT)
+                    return DebitStatement(pages, bank_name, config, header, self.file_path)
+                case EntryType.CREDIT:
+                    logger.debug("Statement type detected: %s", EntryType.CREDIT)
+                    return CreditStatement(pages, bank_name, config, header, self.file_path)
 
         msg = "Could not find header in statement"
         raise RuntimeError(msg)
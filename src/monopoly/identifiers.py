@@ -58,11 +58,13 @@ class TextIdentifier(Identifier):
     text: str = ""
 
     def matches(self, detector: "BankDetector") -> bool:
-        """Check if the identifier's text exists in the document's raw text."""
-        # Ensure the document has raw text before checking
-        if not detector.document.raw_text:
-            return False
-        return self.text in detector.document.raw_text
+        """
+        Check if the identifier's text exists in the document's raw text.
+
+        The detector scans the document once for the text identifiers of every
+        bank, and only reads as many pages as are needed to find the text.
+        """
+        return detector.contains_text(self.text)
 
 
 IdentifierGroup = list[Identifier]
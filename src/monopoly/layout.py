@@ -0,0 +1,51 @@
+"""Reconstructs the layout-preserved text of a page from the positions of its words."""
+
+from statistics import median
+
+from pymupdf import Page
+
+# index of each field in the tuples returned by `page.get_text("words")`
+X0, Y0, X1, Y1, WORD = range(5)
+
+
+def get_layout_text(page: Page) -> str:
+    """
+    Return the text of a page, with words placed in fixed-width columns.
+
+    This approximates the output of `pdftotext -layout`: words on the same
+    baseline are joined into one line, and the horizontal position of each word
+    is converted into a column using the median character width of the page.
+    Consecutive words are always separated by at least one space.
+    """
+    words = page.get_text("words", clip=page.rect)
+    if not words:
+        return ""
+
+    char_width = median((word[X1] - word[X0]) / len(word[WORD]) for word in words)
+    left = page.rect.x0
+
+    lines = []
+    for row in _group_rows(words):
+        line = ""
+        for word in sorted(row, key=lambda word: word[X0]):
+            column = round((word[X0] - left) / char_width)
+            if line:
+                column = max(column, len(line) + 1)
+            line = line.ljust(column) + word[WORD]
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def _group_rows(words: list[tuple]) -> list[list[tuple]]:
+    """Group words into rows, where the vertical midpoint of each word falls within the row's first word."""
+    rows: list[list[tuple]] = []
+    row_top = row_bottom = 0.0
+
+    for word in sorted(words, key=lambda word: (word[Y0] + word[Y1]) / 2):
+        midpoint = (word[Y0] + word[Y1]) / 2
+        if rows and row_top <= midpoint <= row_bottom:
+            rows[-1].append(word)
+            continue
+        rows.append([word])
+        row_top, row_bottom = word[Y0], word[Y1]
+    return rows
@@ -1,23 +1,43 @@
 import logging
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import cached_property
 from io import BytesIO
+from itertools import accumulate, chain
 from pathlib import Path
-from typing import TYPE_CHECKING
+from time import perf_counter
+from typing import TYPE_CHECKING, overload
 
 import pdftotext
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pymupdf import TEXTFLAGS_TEXT, Document, Page
 
+from monopoly.constants import TextBackend
 from monopoly.identifiers import MetadataIdentifier
+from monopoly.layout import get_layout_text
 
 if TYPE_CHECKING:
     from monopoly.banks import BankBase
+    from monopoly.cache import PageCache
 
 logger = logging.getLogger(__name__)
 
 MIN_OCR_TEXT_LENGTH = 10
+PARALLEL_PAGE_THRESHOLD = 50
+MIN_PAGES_PER_CHUNK = 10
+
+# certain statements require garbage collection, so that duplicate objects
+# do not cause pdftotext to fail due to missing xrefs/null values
+# however, setting `garbage=2` may cause issues with other statements
+# so an initial attempt should be made to run using `garbage=0`
+GARBAGE_LEVELS = (0, 2)
+
+# garbage level that worked for a given PDF producer, so that
+# subsequent files from the same producer skip the failing attempt
+_producer_garbage_levels: dict[str, int] = {}
 
 
 class MissingOCRError(Exception):
@@ -43,10 +63,62 @@ class PdfPage:
     raw_text: str
 
     @cached_property
-    def lines(self) -> list[str]:
+    def lines(self) -> Sequence[str]:
         return self.raw_text.split("\n")
 
 
+class PageLines(Sequence[str]):
+    """
+    A read-only sequence of the lines in a page's text.
+
+    Only the start offset of each line is stored, and lines are sliced out of
+    the text when accessed, so the page's text is not duplicated in memory.
+    """
+
+    __slots__ = ("_offsets", "_text")
+
+    def __init__(self, text: str):
+        self._text = text
+        # the final offset marks the end of the last line, as if the text ended with a newline
+        self._offsets = array("I", accumulate((len(line) + 1 for line in text.split("\n")), initial=0))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self._get_line(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "line index out of range"
+            raise IndexError(msg)
+        return self._get_line(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self._get_line(i)
+
+    def _get_line(self, index: int) -> str:
+        return self._text[self._offsets[index] : self._offsets[index + 1] - 1]
+
+
+@dataclass
+class CompactPdfPage(PdfPage):
+    """A `PdfPage` that stores its text once, with an index of line offsets instead of a list of lines."""
+
+    @cached_property
+    def lines(self) -> PageLines:
+        return PageLines(self.raw_text)
+
+
 class WrongPasswordError(Exception):
     """Exception raised when an incorrect password is provided."""
 
@@ -82,6 +154,8 @@ class PdfDocument(Document):
 
         args = {"filename": self.file_path, "stream": self.file_bytes}
         super().__init__(**args)
+        self.text_page_limit: int | None = None
+        self._page_texts: list[str] = []
 
     @cached_property
     def metadata_identifier(self):
@@ -119,26 +193,107 @@ class PdfDocument(Document):
     @cached_property
     def raw_text(self) -> str:
         """Extracts and returns the text from the PDF."""
-        return "".join(page.get_text() for page in self)
+        return "".join(self.iter_page_texts())
+
+    def iter_page_texts(self) -> Iterator[str]:
+        """
+        Yield the text of each page, extracting each page at most once.
+
+        Callers that only need to find a string can stop early, without
+        extracting the remaining pages of the document. If `text_page_limit`
+        is set, only that many pages are read.
+        """
+        page_count = self.page_count
+        if self.text_page_limit is not None:
+            page_count = min(page_count, self.text_page_limit)
+
+        page_num = 0
+        while page_num < page_count:
+            if page_num == len(self._page_texts):
+                self._page_texts.append(self[page_num].get_text())
+            yield self._page_texts[page_num]
+            page_num += 1
+
+    def clear_page_texts(self) -> None:
+        """Forget the extracted page texts, e.g. after pages are selected, deleted or redacted."""
+        self._page_texts.clear()
+        self.__dict__.pop("raw_text", None)
+
+    def select(self, *args, **kwargs) -> None:
+        super().select(*args, **kwargs)
+        self.clear_page_texts()
+
+    def delete_page(self, *args, **kwargs) -> None:
+        super().delete_page(*args, **kwargs)
+        self.clear_page_texts()
+
+    def delete_pages(self, *args, **kwargs) -> None:
+        super().delete_pages(*args, **kwargs)
+        self.clear_page_texts()
+
+    def get_source_bytes(self) -> bytes:
+        """Return the bytes that the document was opened from, without re-serializing it."""
+        if self.file_path:
+            return Path(self.file_path).read_bytes()
+        if isinstance(self.file_bytes, BytesIO):
+            return self.file_bytes.getvalue()
+        return self.file_bytes or b""
+
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> list[str]:
+    """Extract the layout-preserved text of pages `start` to `stop` (exclusive)."""
+    pdf = pdftotext.PDF(BytesIO(pdf_bytes), physical=True)
+    return [pdf[page_num] for page_num in range(start, stop)]
 
 
 class PdfParser:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         bank: type["BankBase"],
         document: PdfDocument,
         ocr_engine: str | None = None,
+        page_workers: int | None = None,
+        parallel_page_threshold: int = PARALLEL_PAGE_THRESHOLD,
+        cache: "PageCache | None" = None,
+        text_backend: TextBackend | None = None,
+        page_cls: type[PdfPage] = PdfPage,
+        *,
+        prune_pages: bool = True,
     ):
         """
         Class responsible for parsing PDFs and returning raw text.
 
         The page_range variable determines which pages are extracted.
-        All pages are extracted by default.
+        All pages are extracted by default. Pages are extracted lazily when read
+        through `iter_pages()`, while `pages` extracts every page.
+
+        If `page_workers` is set, documents with at least `parallel_page_threshold`
+        pages are split into chunks that are extracted concurrently.
+
+        If a `cache` is passed, previously extracted text is reused for identical
+        documents and parser configurations. Password protected documents are never cached.
+
+        `text_backend` overrides the text extraction engine set in the bank's PDF config.
+
+        `page_cls` sets the type of the returned pages, e.g. `CompactPdfPage`
+        to reduce the memory used by long statements.
+
+        If `prune_pages` is disabled, pages without any statement information
+        (e.g. terms and conditions) are passed to the statement parser, even for
+        banks that enable pruning in their PDF config.
         """
         self.bank = bank
         self.document = document
         self.metadata_identifier = document.metadata_identifier
         self.ocr_engine = ocr_engine
+        self.page_workers = page_workers
+        self.parallel_page_threshold = parallel_page_threshold
+        self.cache = cache
+        self._text_backend = text_backend
+        self.page_cls = page_cls
+        self.prune_pages = prune_pages
+        self._extracted_pages: list[PdfPage] = []
+        self._page_source: Iterator[PdfPage] | None = None
 
     @property
     def pdf_config(self):
@@ -152,19 +307,76 @@ class PdfParser:
     def page_bbox(self):
         return self.pdf_config.page_bbox
 
+    @cached_property
+    def text_backend(self) -> TextBackend:
+        return self._text_backend or self.pdf_config.text_backend
+
     @cached_property
     def ocr_available(self) -> bool:
         """Check if the document matches any of the specified OCR identifier groups."""
+        # imported here, since the detector depends on this module
+        from monopoly.banks.detector import BankDetector
+
         if not (identifier_groups := self.pdf_config.ocr_identifiers):
             return False
 
-        return any(all(identifier.matches(self) for identifier in group) for group in identifier_groups)
+        detector = BankDetector(self.document)
+        return any(all(identifier.matches(detector) for identifier in group) for group in identifier_groups)
 
     @cached_property
-    def pages(self):
-        return self._get_pages()
+    def pages(self) -> list[PdfPage]:
+        return list(self.iter_pages())
+
+    def iter_pages(self) -> Iterator[PdfPage]:
+        """
+        Yield pages one at a time, extracting text only as far as the caller iterates.
+
+        Extracted pages are kept, so that later calls (and `pages`) replay them
+        instead of extracting them again.
+        """
+        page_num = 0
+        while True:
+            if page_num < len(self._extracted_pages):
+                yield self._extracted_pages[page_num]
+                page_num += 1
+                continue
+
+            if self._page_source is None:
+                self._page_source = self._generate_pages()
+
+            page = next(self._page_source, None)
+            if page is None:
+                return
+            self._extracted_pages.append(page)
+
+    def _generate_pages(self) -> Iterator[PdfPage]:
+        if not self.cache or self.document.needs_pass:
+            yield from self._iter_pages()
+            return
+
+        cache_key = self.cache.make_key(
+            self.document.get_source_bytes(),
+            self.page_range,
+            self.page_bbox,
+            self.pdf_config.remove_vertical_text,
+            self.ocr_engine,
+            self.text_backend,
+        )
+        if (page_texts := self.cache.get(cache_key)) is not None:
+            logger.debug("Loaded %s pages from cache", len(page_texts))
+            yield from (self.page_cls(page_text) for page_text in page_texts)
+            return
+
+        page_texts = []
+        for page in self._iter_pages():
+            page_texts.append(page.raw_text)
+            yield page
+        self.cache.set(cache_key, page_texts)
 
     def _get_pages(self) -> list[PdfPage]:
+        return list(self._iter_pages())
+
+    def _iter_pages(self) -> Iterator[PdfPage]:
         logger.debug("Extracting text from PDF")
         document = self.document
 
@@ -174,45 +386,146 @@ class PdfParser:
             gemini = GeminiOcr()
             pages = gemini.extract_pages(document)
             num_pages = list(range(len(pages)))
-            return [pages[i] for i in num_pages[self.page_range]]
+            yield from (pages[i] for i in num_pages[self.page_range])
+            return
+
+        page_numbers = list(range(document.page_count))[self.page_range]
+
+        match self.text_backend:
+            case TextBackend.PYMUPDF:
+                yield from self._iter_pymupdf_pages(page_numbers)
+            case _:
+                yield from self._iter_pdftotext_pages(page_numbers)
+
+    def _iter_pymupdf_pages(self, page_numbers: list[int]) -> Iterator[PdfPage]:
+        """Reconstruct the layout of each page from the open document, without re-serializing it."""
+        if not self._is_unmodified(page_numbers):
+            self._modify_document(page_numbers)
+        yield from self._read_pages(get_layout_text(page) for page in self.document)
+
+    def _iter_pdftotext_pages(self, page_numbers: list[int]) -> Iterator[PdfPage]:
+        document = self.document
+
+        if self._is_unmodified(page_numbers):
+            try:
+                logger.debug("Document does not need to be modified, extracting from source")
+                extracted_pages = self._read_pages(self._extract_text(document.get_source_bytes()))
+            except pdftotext.Error:
+                logger.debug("Unable to extract text from source, re-serializing document")
+            else:
+                yield from extracted_pages
+                return
 
-        num_pages = list(range(document.page_count))
-        document.select(num_pages[self.page_range])
+        self._modify_document(page_numbers)
+
+        producer = document.metadata_identifier.producer
+        for garbage in self._get_garbage_levels(producer):
+            try:
+                extracted_pages = self._read_pages(self._extract_text(document.tobytes(garbage=garbage)))
+            except pdftotext.Error:
+                continue
+            _producer_garbage_levels[producer] = garbage
+            yield from extracted_pages
+            return
+        msg = "Unable to retrieve pages"
+        raise RuntimeError(msg)
+
+    def _modify_document(self, page_numbers: list[int]) -> None:
+        """Select, crop and remove vertical text from pages in place, according to the PDF config."""
+        document = self.document
+        document.select(page_numbers)
 
         if cropbox := self.page_bbox:
             logger.debug("Will crop pages with crop box %s and remove vertical text", cropbox)
 
-        pages = []
         for page in document:
             if self.page_bbox:
                 page.set_cropbox(cropbox)
 
             if self.pdf_config.remove_vertical_text:
+                start = perf_counter()
                 self._remove_vertical_text(page)
+                logger.debug(
+                    "Removed vertical text from page %s in %.2fms", page.number, (perf_counter() - start) * 1000
+                )
 
-            pages.append(page)
+        # cropping and redaction change the text of the pages
+        document.clear_page_texts()
 
-        # certain statements requsire garbage collection, so that duplicate objects
-        # do not cause pdftotext to fail due to missing xrefs/null values
-        # however, setting `garbage=2` may cause issues with other statements
-        # so an initial attempt should be made to run using `garbage=0`
-        garbage_values = [0, 2]
+    def _is_unmodified(self, page_numbers: list[int]) -> bool:
+        """Check if the document can be passed to pdftotext as-is, without cropping, redaction or page selection."""
+        document = self.document
+        return not (
+            self.page_bbox
+            or self.pdf_config.remove_vertical_text
+            or document.needs_pass
+            or document.is_dirty
+            or page_numbers != list(range(document.page_count))
+        )
 
-        for garbage in garbage_values:
-            try:
-                pdf_byte_stream = BytesIO(document.tobytes(garbage=garbage))
-                pdf = pdftotext.PDF(pdf_byte_stream, physical=True)
+    @staticmethod
+    def _get_garbage_levels(producer: str) -> list[int]:
+        """Return garbage levels to attempt, starting with the last level that worked for this producer."""
+        if (known_level := _producer_garbage_levels.get(producer)) is None:
+            return list(GARBAGE_LEVELS)
+        return [known_level, *(level for level in GARBAGE_LEVELS if level != known_level)]
 
-                # assume PDF is missing OCR if text is less than 10 chars on every page
-                if all(len(page) < MIN_OCR_TEXT_LENGTH for page in pdf):
-                    msg = "No selectable text found"
-                    raise MissingOCRError(msg)
+    def _read_pages(self, page_texts: Iterable[str]) -> Iterator[PdfPage]:
+        """
+        Return an iterator over the pages of `page_texts`.
 
-                return [PdfPage(page) for page in pdf]
-            except pdftotext.Error:
-                continue
-        msg = "Unable to retrieve pages"
-        raise RuntimeError(msg)
+        Pages are read eagerly up to the first page with text, so that extraction errors
+        and documents without any selectable text are raised here rather than midway
+        through iteration. The remaining pages are extracted as they are consumed.
+        """
+        page_texts = iter(page_texts)
+
+        # assume PDF is missing OCR if text is less than 10 chars on every page
+        leading_pages = []
+        for page in page_texts:
+            leading_pages.append(page)
+            if len(page) >= MIN_OCR_TEXT_LENGTH:
+                break
+        else:
+            msg = "No selectable text found"
+            raise MissingOCRError(msg)
+
+        return (self.page_cls(page) for page in chain(leading_pages, page_texts))
+
+    def _extract_text(self, pdf_bytes: bytes) -> Iterator[str]:
+        """
+        Extract the text of every page, in page order.
+
+        Pages are rendered lazily by pdftotext as the iterator is consumed.
+        Long documents are instead split into contiguous page chunks and extracted
+        across a process pool, since pdftotext holds the GIL while it renders a page.
+        Each worker loads the same bytes, so the output is identical to a serial run.
+        `pdf_bytes` must be the current state of `self.document`, whose page count is used.
+        """
+        page_count = self.document.page_count
+
+        if not self.page_workers or page_count < self.parallel_page_threshold:
+            return iter(pdftotext.PDF(BytesIO(pdf_bytes), physical=True))
+
+        chunks = self._get_page_chunks(page_count)
+        logger.debug("Extracting %s pages in %s chunks", page_count, len(chunks))
+
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(_extract_page_range, pdf_bytes, start, stop) for start, stop in chunks]
+            return iter([page for future in futures for page in future.result()])
+
+    def _get_page_chunks(self, page_count: int) -> list[tuple[int, int]]:
+        """Split `page_count` pages into contiguous (start, stop) ranges, one per worker."""
+        num_chunks = max(1, min(self.page_workers or 1, page_count // MIN_PAGES_PER_CHUNK))
+        chunk_size, remainder = divmod(page_count, num_chunks)
+
+        chunks = []
+        start = 0
+        for i in range(num_chunks):
+            stop = start + chunk_size + (1 if i < remainder else 0)
+            chunks.append((start, stop))
+            start = stop
+        return chunks
 
     @staticmethod
     def _remove_vertical_text(page: Page):
@@ -229,12 +542,21 @@ class PdfParser:
         '10 NOV 9.80',
         ```
 
+        Most pages do not contain any vertical text, so the page's text trace
+        (which is much cheaper to build than a text dict) is checked first, and
+        the page is left untouched if none of its spans are rotated.
+
         Note:
         ----
             The 'dir' key represents the tuple (cosine, sine) for the angle.
             If line["dir"] != (1, 0), the text of its spans is rotated.
 
         """
+        has_vertical_text = any(span["dir"] != (1, 0) for span in page.get_texttrace())
+        # annotated pages may already contain redactions, which apply_redactions also applies
+        if not has_vertical_text and page.first_annot is None:
+            return page
+
         for block in page.get_text("dict", flags=TEXTFLAGS_TEXT)["blocks"]:
             for line in block["lines"]:
                 writing_direction = line["dir"]
@@ -1,8 +1,11 @@
 import csv
 import logging
 import re
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from pydantic import SecretStr
 
@@ -13,6 +16,9 @@ from monopoly.pdf import PdfParser
 from monopoly.statements import BaseStatement, Transaction
 from monopoly.write import generate_name
 
+if TYPE_CHECKING:
+    from monopoly.statements.transaction_batch import TransactionBatch
+
 logger = logging.getLogger(__name__)
 
 START_OF_YEAR_MONTHS = (1, 2)
@@ -30,6 +36,8 @@ class Pipeline:
     ):
         self.passwords = passwords
         self.handler = self.create_handler(parser)
+        # seconds spent on the safety check, once it has run
+        self.safety_check_time: float | None = None
 
     @staticmethod
     def create_handler(parser: PdfParser) -> StatementHandler:
@@ -47,18 +55,28 @@ class Pipeline:
         """
         statement = self.handler.statement
 
-        if not statement.transactions:
+        if statement.uses_transaction_batch:
+            transaction_count = len(statement.get_transaction_batch())
+        else:
+            transaction_count = len(statement.transactions or [])
+
+        if not transaction_count:
             msg = "No transactions found - statement extraction failed"
             raise ValueError(msg)
 
-        logger.debug("%s transactions found", len(statement.transactions))
+        logger.debug("%s transactions found", transaction_count)
 
         if not statement.statement_date:
             msg = "No statement date found"
             raise ValueError(msg)
 
         if safety_check and statement.config.safety_check:
-            statement.perform_safety_check()
+            start = perf_counter()
+            try:
+                statement.perform_safety_check()
+            finally:
+                self.safety_check_time = perf_counter() - start
+                logger.debug("Safety check took %.2fms", self.safety_check_time * 1000)
 
         return statement
 
@@ -67,11 +85,39 @@ class Pipeline:
         logger.debug("Running transformation functions on DataFrame")
 
         transactions = statement.transactions
+        convert_date = Pipeline.get_date_converter(statement)
+
+        logger.debug("Transforming dates to ISO 8601")
+
+        for tx in transactions:
+            tx.date = convert_date(tx.date)
+
+        # the batch, if any, still holds the untransformed dates
+        statement.transaction_batch = None
+        return transactions
+
+    @staticmethod
+    def transform_batch(statement: BaseStatement) -> "TransactionBatch":
+        """
+        Transform transactions as columns, without creating a transaction for each row.
+
+        Each distinct date is converted once. Requires the `numpy` extra.
+        """
+        logger.debug("Transforming dates to ISO 8601")
+        batch = statement.get_transaction_batch().map_dates(Pipeline.get_date_converter(statement))
+
+        statement.transaction_batch = batch
+        # converted again from the transformed batch, if needed
+        statement.__dict__.pop("transactions", None)
+        return batch
+
+    @staticmethod
+    def get_date_converter(statement: BaseStatement) -> Callable[[str], str]:
         statement_date = statement.statement_date
         date_order = statement.config.transaction_date_order
         date_format = statement.config.transaction_date_format
 
-        def convert_date(tx: Transaction) -> str:
+        def convert_date(date: str) -> str:
             """
             Convert date to ISO 8601 format with cross-year logic.
 
@@ -83,25 +129,25 @@ class Pipeline:
             the transaction appears to be from a late-month (e.g., December), it may belong
             to the previous year and is adjusted accordingly.
             """
-            has_year = bool(_YYYY_RE.search(tx.date))
+            has_year = bool(_YYYY_RE.search(date))
             needs_year = not has_year and "y" not in date_format.lower()
             fmt = date_format
             parsed_date = None
 
             if needs_year:
-                tx.date = f"{tx.date} {statement_date.year}"
+                date = f"{date} {statement_date.year}"
                 fmt += " %Y"
 
             try:
-                parsed_date = datetime.strptime(tx.date, fmt).astimezone()
+                parsed_date = datetime.strptime(date, fmt).astimezone()
             except ValueError:
-                logger.debug("strptime failed for %s with format %s", tx.date, fmt)
+                logger.debug("strptime failed for %s with format %s", date, fmt)
                 from dateparser import parse
 
-                parsed_date = parse(tx.date, settings=date_order.settings)
+                parsed_date = parse(date, settings=date_order.settings)
 
             if not parsed_date:
-                msg = f"Could not convert date: {tx.date}"
+                msg = f"Could not convert date: {date}"
                 raise RuntimeError(msg)
 
             # Detect cross-year case: e.g., statement is from Jan/Feb, but tx is Dec
@@ -112,16 +158,11 @@ class Pipeline:
 
             return parsed_date.date().isoformat()
 
-        logger.debug("Transforming dates to ISO 8601")
-
-        for tx in transactions:
-            tx.date = convert_date(tx)
-
-        return transactions
+        return convert_date
 
     @staticmethod
     def load(
-        transactions: list[Transaction],
+        transactions: "list[Transaction] | TransactionBatch",
         statement: BaseStatement,
         output_directory: Path | str,
         *,
@@ -149,14 +190,17 @@ class Pipeline:
             # header
             writer.writerow(statement.columns)
 
-            for transaction in transactions:
-                writer.writerow(
-                    [
-                        transaction.date,
-                        transaction.description,
-                        transaction.amount,
-                        transaction.balance or 0,
-                    ]
-                )
+            if not isinstance(transactions, list):
+                writer.writerows(transactions.rows())
+            else:
+                for transaction in transactions:
+                    writer.writerow(
+                        [
+                            transaction.date,
+                            transaction.description,
+                            transaction.amount,
+                            transaction.balance or 0,
+                        ]
+                    )
 
         return output_path
@@ -0,0 +1,252 @@
+"""
+Selects the regex engine used to run the patterns of statement configs.
+
+Patterns are always compiled with `re`. A linear-time engine such as RE2 can be
+enabled to run them instead: RE2 finds the match and its groups without backtracking,
+and returns them in a match object with the same interface as a `re` match.
+Patterns that RE2 cannot express, such as lookarounds, run on `re` in full, so they
+are not sped up, however much they backtrack.
+"""
+
+import logging
+import re
+from collections.abc import Iterator
+from functools import cache
+from typing import Any, Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+# the ASCII characters matched by `\s` in `re`, which also include the information separators
+ASCII_WHITESPACE = r"\t\n\v\f\r\x1c-\x1f "
+
+# escapes whose meaning is the same in RE2 for ASCII strings
+RE2_ESCAPES = set("AbBdDwWafnrtvx") | set(r"\.^$*+?{}[]()|-/&~#%'\"<>=!:;,@` ")
+
+# flags that RE2 supports, as inline flags
+RE2_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+# named groups, non-capturing groups and groups with scoped flags, e.g. `(?i:jan|feb)`
+RE2_GROUP = re.compile(r"\(\?(?:P<|[ims]*(?:-[ims]+)?:)")
+
+
+class RegexSettings(BaseSettings):
+    """
+    Pydantic model that automatically populates the regex engine from a .env file.
+
+    Also populates using environment variables, e.g.
+    export MONOPOLY_REGEX_ENGINE=re2
+    """
+
+    monopoly_regex_engine: Literal["re", "re2"] = "re"
+    model_config = SettingsConfigDict(env_file=".env", extra="allow")
+
+
+class RegexEngine:
+    """The default engine, which runs every pattern on `re`."""
+
+    name = "re"
+
+    def compile(self, pattern: re.Pattern) -> Any:
+        return pattern
+
+
+class Re2Match:
+    """
+    A match found by RE2, with the interface of a `re` match.
+
+    Groups can be looked up by name in `span`, `start` and `end`, as they can in `re`.
+    Any other attribute is delegated to the RE2 match.
+    """
+
+    def __init__(self, regex: re.Pattern, match: Any):
+        self.re = regex
+        self.match = match
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.match, name)
+
+    def __getitem__(self, group: int | str) -> str | None:
+        return self.match[group]
+
+    def __repr__(self) -> str:
+        return f"<Re2Match object; span={self.span()}, match={self.group()!r}>"
+
+    def _index(self, group: int | str) -> int:
+        return group if isinstance(group, int) else self.re.groupindex[group]
+
+    def span(self, group: int | str = 0) -> tuple[int, int]:
+        return self.match.span(self._index(group))
+
+    def start(self, group: int | str = 0) -> int:
+        return self.match.start(self._index(group))
+
+    def end(self, group: int | str = 0) -> int:
+        return self.match.end(self._index(group))
+
+
+class Re2Pattern:
+    """
+    A pattern that runs on RE2, and produces matches with the interface of `re` matches.
+
+    RE2 only runs on ASCII strings, where the character classes of both engines agree,
+    and other strings are matched by the `re` pattern. Any other attribute is delegated
+    to the `re` pattern.
+    """
+
+    def __init__(self, regex: re.Pattern, matcher: Any):
+        self.regex = regex
+        self.matcher = matcher
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.regex, name)
+
+    def __repr__(self) -> str:
+        return f"Re2Pattern({self.regex!r})"
+
+    def _wrap(self, match: Any) -> Re2Match | None:
+        return Re2Match(self.regex, match) if match else None
+
+    def search(self, string: str) -> Any:
+        if not string.isascii():
+            return self.regex.search(string)
+        return self._wrap(self.matcher.search(string))
+
+    def match(self, string: str) -> Any:
+        if not string.isascii():
+            return self.regex.match(string)
+        return self._wrap(self.matcher.match(string))
+
+    def fullmatch(self, string: str) -> Any:
+        if not string.isascii():
+            return self.regex.fullmatch(string)
+        return self._wrap(self.matcher.fullmatch(string))
+
+    def finditer(self, string: str) -> Iterator[Any]:
+        if not string.isascii():
+            return self.regex.finditer(string)
+        return (Re2Match(self.regex, match) for match in self.matcher.finditer(string))
+
+    def findall(self, string: str) -> list[Any]:
+        if string.isascii() and not self.matcher.search(string):
+            return []
+        return self.regex.findall(string)
+
+
+class Re2Engine(RegexEngine):
+    """Runs patterns on RE2, for patterns that RE2 can express."""
+
+    name = "re2"
+
+    def __init__(self):
+        import re2
+
+        self.re2 = re2
+        self.options = re2.Options()
+        self.options.log_errors = False
+
+    def compile(self, pattern: re.Pattern) -> Any:
+        translated = translate(pattern)
+        if translated is None:
+            logger.debug("Pattern %r uses syntax that RE2 does not support, using re", pattern.pattern)
+            return pattern
+        try:
+            matcher = self.re2.compile(translated, self.options)
+        except self.re2.error as err:
+            logger.debug("Pattern %r cannot be compiled by RE2, using re: %s", pattern.pattern, err)
+            return pattern
+        return Re2Pattern(pattern, matcher)
+
+
+ENGINES: dict[str, type[RegexEngine]] = {
+    RegexEngine.name: RegexEngine,
+    Re2Engine.name: Re2Engine,
+}
+
+
+@cache
+def get_engine(name: str | None = None) -> RegexEngine:
+    """Return the engine with the given name, or the engine set by `MONOPOLY_REGEX_ENGINE`."""
+    name = name or RegexSettings().monopoly_regex_engine
+    if name not in ENGINES:
+        msg = f"Unknown regex engine {name!r}, expected one of {list(ENGINES)}"
+        raise ValueError(msg)
+    try:
+        return ENGINES[name]()
+    except ImportError:
+        logger.warning("Regex engine %s is not installed, using re", name)
+        return RegexEngine()
+
+
+def compile_pattern(pattern: Any, engine: RegexEngine | None = None) -> Any:
+    """Compile a pattern with the configured engine, falling back to `re` if the engine cannot run it."""
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    # e.g. `RegexEnum` members, which compile their own pattern
+    if not isinstance(pattern, re.Pattern):
+        return pattern
+    return _compile_pattern(engine or get_engine(), pattern)
+
+
+@cache
+def _compile_pattern(engine: RegexEngine, pattern: re.Pattern) -> Any:
+    compiled = engine.compile(pattern)
+    engine_name = engine.name if compiled is not pattern else RegexEngine.name
+    logger.debug("Running pattern %r on %s", pattern.pattern, engine_name)
+    return compiled
+
+
+def translate(pattern: re.Pattern) -> str | None:  # noqa: C901, PLR0912
+    """
+    Translate a pattern into RE2 syntax, for matching ASCII strings.
+
+    Returns None if the pattern uses syntax that has no equivalent in RE2, such as
+    lookarounds, backreferences, conditionals or verbose mode.
+    """
+    if not isinstance(pattern.pattern, str) or pattern.flags & re.VERBOSE:
+        return None
+
+    source = pattern.pattern
+    flags = "".join(flag for value, flag in RE2_FLAGS.items() if pattern.flags & value)
+    output = [f"(?{flags})"] if flags else []
+    in_class = False
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            escape = source[i + 1 : i + 2]
+            if escape == "s":
+                output.append(ASCII_WHITESPACE if in_class else f"[{ASCII_WHITESPACE}]")
+            elif escape == "S" and not in_class:
+                output.append(f"[^{ASCII_WHITESPACE}]")
+            elif escape == "Z" and not in_class:
+                output.append(r"\z")
+            elif escape in RE2_ESCAPES:
+                output.append(source[i : i + 2])
+            else:
+                return None
+            i += 2
+            continue
+
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            # a closing bracket at the start of a set is a literal
+            start = i + 2 if source[i + 1 : i + 2] == "^" else i + 1
+            if source[start : start + 1] == "]":
+                output.append(source[i : start + 1])
+                i = start + 1
+                continue
+        elif source.startswith("{,", i) or (source.startswith("(?", i) and not RE2_GROUP.match(source, i)):
+            # `{,n}` quantifiers, lookarounds, backreferences, conditionals and scoped flags
+            return None
+        elif char == "$" and not pattern.flags & re.MULTILINE:
+            # `$` also matches before a trailing newline in `re`
+            output.append(r"(?:\n?\z)")
+            i += 1
+            continue
+        output.append(char)
+        i += 1
+    return "".join(output)
@@ -1,21 +1,27 @@
 import logging
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from monopoly.config import MultilineConfig, StatementConfig
 from monopoly.constants import Columns, SharedPatterns
 from monopoly.pdf import PdfPage
+from monopoly.regex_engine import compile_pattern
 from monopoly.statements.date_resolver import DateResolver
-from monopoly.statements.number_extractor import NumberExtractor
+from monopoly.statements.number_extractor import CentIndex, NumberExtractor
 from monopoly.statements.transaction import (
     RawTransaction,
     Transaction,
+    build_transactions,
 )
 
+if TYPE_CHECKING:
+    from monopoly.statements.transaction_batch import TransactionBatch
+
 # pylint: disable=bad-classmethod-argument
 logger = logging.getLogger(__name__)
 
@@ -25,25 +31,66 @@ MIN_BREAK_GAP = 20  # Minimum gap between words and numbers to trigger break
 @dataclass
 class MatchContext:
     line: str
-    lines: list[str]
+    lines: Sequence[str]
     idx: int
     description: str
     multiline_config: MultilineConfig | None = None
+    # the lines of the page that are transactions, if they are already known
+    transaction_lines: set[int] | None = None
+    # shared by the descriptions built on the same page
+    line_features: "LineFeatures | None" = None
 
 
-class DescriptionBuilder:
+class LineFeatures:
     """
-    Handles extraction and building of multiline descriptions.
+    The features of a page's lines that multiline descriptions are built from.
 
-    Regex patterns are pre-compiled as class attributes to avoid re-compilation loop overhead.
+    For each line, the start position of its first word (-1 if the line is blank), and the
+    end of its first word span and start of its first number span. Each is computed once per
+    line, the first time a description walks over it.
     """
 
     WORDS_PATTERN: ClassVar[re.Pattern] = re.compile(r"\s[A-Za-z]+")
     NUMBERS_PATTERN: ClassVar[re.Pattern] = re.compile(SharedPatterns.AMOUNT)
 
+    def __init__(self, lines: Sequence[str]):
+        self.lines = lines
+        self._start_positions: dict[int, int] = {}
+        self._spans: dict[int, tuple[int | None, int | None]] = {}
+
+    def start_pos(self, idx: int) -> int:
+        if idx not in self._start_positions:
+            line = self.lines[idx]
+            stripped = line.strip()
+            self._start_positions[idx] = line.find(stripped.split(" ")[0]) if stripped else -1
+        return self._start_positions[idx]
+
+    def spans(self, idx: int) -> tuple[int | None, int | None]:
+        """Return where the line's first words end, and where its first number starts."""
+        if idx not in self._spans:
+            line = self.lines[idx]
+            words_match = self.WORDS_PATTERN.search(line)
+            nums_match = self.NUMBERS_PATTERN.search(line)
+            self._spans[idx] = (
+                words_match.end() if words_match else None,
+                nums_match.start() if nums_match else None,
+            )
+        return self._spans[idx]
+
+
+class DescriptionBuilder:
+    """
+    Handles extraction and building of multiline descriptions.
+
+    Lines are walked by index instead of copying the rest of the page, their features are
+    looked up from the page's `LineFeatures`, and lines are only searched for transactions
+    if the context does not already know which lines they are.
+    """
+
     def __init__(self, ctx: MatchContext, pattern: re.Pattern):
         self.pattern = pattern
         self.ctx = ctx
+        self.line_features = ctx.line_features if ctx.line_features is not None else LineFeatures(ctx.lines)
         self.cfg = ctx.multiline_config
         self.description = ctx.description
         self.desc_pos = ctx.line.find(ctx.description)
@@ -59,37 +106,36 @@ class DescriptionBuilder:
             self._include_previous_line()
 
         # Handle subsequent lines
-        for next_line in self.ctx.lines[self.ctx.idx + 1 :]:
-            if self._should_break(next_line):
+        lines = self.ctx.lines
+        for idx in range(self.ctx.idx + 1, len(lines)):
+            next_line = lines[idx]
+            if self._should_break(next_line, idx):
                 break
             self.description += f" {next_line.strip()}"
 
         return self.description
 
-    def _should_break(self, line: str) -> bool:
+    def _should_break(self, line: str, idx: int) -> bool:
         """Determine if processing should stop at the current line."""
         # cfg is guaranteed to be not None here because build() returns early if cfg is None
         if self.cfg is None:
             return True
 
-        if not line.strip() or self.pattern.search(line):
+        next_pos = self.line_features.start_pos(idx)
+        if next_pos == -1 or self._is_transaction(line, idx):
             return True
 
-        next_pos = self._get_start_pos(line)
-        if next_pos != -1 and not self._is_within_margin(self.desc_pos, next_pos, self.cfg.description_margin):
+        if not self._is_within_margin(self.desc_pos, next_pos, self.cfg.description_margin):
             return True
 
-        words_match = self.WORDS_PATTERN.search(line)
-        nums_match = self.NUMBERS_PATTERN.search(line)
-
         # Heuristic: Exclude footer lines containing detached numbers/words
-        if words_match and nums_match:
-            words_end = words_match.end()
-            nums_start = nums_match.start()
-            if nums_start > words_end and (nums_start - words_end) > MIN_BREAK_GAP:
-                return True
+        words_end, nums_start = self.line_features.spans(idx)
+        return words_end is not None and nums_start is not None and (nums_start - words_end) > MIN_BREAK_GAP
 
-        return False
+    def _is_transaction(self, line: str, idx: int) -> bool:
+        if self.ctx.transaction_lines is not None:
+            return idx in self.ctx.transaction_lines
+        return bool(self.pattern.search(line))
 
     def _include_previous_line(self) -> None:
         """Attempt to prepend the previous line."""
@@ -145,24 +191,48 @@ class BaseStatement:
         self.pages = pages
         self.header = header
         self.file_path = file_path
+        # the batch that the transactions are converted from, if `transaction_batch` is enabled in the config
+        self.transaction_batch: TransactionBatch | None = None
 
     @cached_property
     def pattern(self):
-        pattern = self.config.transaction_pattern
-        if isinstance(pattern, str):
-            pattern = re.compile(pattern)
-        return pattern
+        return compile_pattern(self.config.transaction_pattern)
+
+    @cached_property
+    def uses_transaction_batch(self) -> bool:
+        """Check if transactions are built as a batch, falling back to a list if numpy is not installed."""
+        if not self.config.transaction_batch:
+            return False
+        try:
+            import monopoly.statements.transaction_batch  # noqa: F401
+        except ImportError:
+            logger.warning("numpy not installed, building transactions as a list")
+            return False
+        return True
 
     def get_transactions(self) -> list[Transaction] | None:
-        transactions: list[Transaction] = []
+        if self.transaction_batch is not None or self.uses_transaction_batch:
+            # converted from the batch, for callers that need a transaction object for each row
+            return self.get_transaction_batch().to_transactions() or None
+
+        raw_transactions = self.get_raw_transactions()
+        if not raw_transactions:
+            return None
+
+        transactions = build_transactions(raw_transactions, auto_polarity=self.config.transaction_auto_polarity)
+        return self.post_process_transactions(transactions)
+
+    def get_raw_transactions(self) -> list[RawTransaction]:
+        raw_transactions: list[RawTransaction] = []
 
         for page_num, page in enumerate(self.pages):
             lines = page.lines
-            for line_num, line in enumerate(lines):
-                raw_match = self.pattern.search(line)
-                if not raw_match:
-                    continue
-
+            matches = [
+                (line_num, raw_match) for line_num, line in enumerate(lines) if (raw_match := self.pattern.search(line))
+            ]
+            transaction_lines = {line_num for line_num, _ in matches}
+            line_features = LineFeatures(lines)
+            for line_num, raw_match in matches:
                 if self._check_bound(raw_match):
                     continue
 
@@ -178,23 +248,16 @@ class BaseStatement:
                 )
                 raw_transaction = self.pre_process_match(raw_transaction)
                 context = MatchContext(
-                    line=line,
-                    lines=page.lines,
+                    line=lines[line_num],
+                    lines=lines,
                     idx=line_num,
                     description=raw_transaction.description,
                     multiline_config=self.config.multiline_config,
+                    transaction_lines=transaction_lines,
+                    line_features=line_features,
                 )
-                processed_match = self.process_match(raw_transaction, context)
-                transaction = Transaction(
-                    **processed_match.as_dict(),
-                    auto_polarity=self.config.transaction_auto_polarity,
-                )
-                transactions.append(transaction)
-
-        if not transactions:
-            return None
-
-        return self.post_process_transactions(transactions)
+                raw_transactions.append(self.process_match(raw_transaction, context))
+        return raw_transactions
 
     def _check_bound(self, match: re.Match):
         if (bound := self.config.transaction_bound) and match.span(Columns.AMOUNT)[0] >= bound:
@@ -213,6 +276,9 @@ class BaseStatement:
     def post_process_transactions(self, transactions: list[Transaction]) -> list[Transaction]:
         return transactions
 
+    def post_process_batch(self, batch: "TransactionBatch") -> "TransactionBatch":
+        return batch
+
     def process_match(self, match: RawTransaction, context: MatchContext) -> RawTransaction:
         if not (config := context.multiline_config):
             return match
@@ -254,6 +320,27 @@ class BaseStatement:
     def transactions(self):
         return self.get_transactions()
 
+    def get_transaction_batch(self) -> "TransactionBatch":
+        """
+        Return the transactions as columns, which requires the `numpy` extra.
+
+        If `transaction_batch` is enabled in the config, the batch is built from the
+        parsed matches without creating a transaction for each row, and kept. Otherwise,
+        or if the transactions were set directly, it is built from the transactions.
+        """
+        from monopoly.statements.transaction_batch import TransactionBatch
+
+        if self.transaction_batch is not None:
+            return self.transaction_batch
+        if not self.uses_transaction_batch or "transactions" in self.__dict__:
+            return TransactionBatch.from_transactions(self.transactions or [])
+
+        batch = TransactionBatch.from_raw(
+            self.get_raw_transactions(), auto_polarity=self.config.transaction_auto_polarity
+        )
+        self.transaction_batch = self.post_process_batch(batch) if len(batch) else batch
+        return self.transaction_batch
+
     @cached_property
     def statement_date(self) -> datetime:
         resolver = DateResolver(self.pages, self.config, self.file_path)
@@ -264,14 +351,22 @@ class BaseStatement:
         msg = "Subclasses must implement perform_safety_check method"
         raise NotImplementedError(msg)
 
-    def get_all_numbers_from_document(self) -> set[float]:
+    def get_cent_index_from_document(self) -> CentIndex:
         """
-        Iterate over each page in a statement, and retrieves all decimal numbers in each page.
+        Return every decimal number in the statement and the sum of its subtotals, in cents.
 
         This is used by child classes with implementations of perform_safety_check().
         """
-        extractor = NumberExtractor(self.pages)
-        return extractor.get_all_numbers()
+        return NumberExtractor(self.pages).get_all_cents()
+
+    def get_cent_totals(self) -> tuple[int, int]:
+        """Return the sums of the positive and the negative transaction amounts, in cents."""
+        if self.uses_transaction_batch:
+            batch_cents = self.get_transaction_batch().cents
+            return int(batch_cents[batch_cents > 0].sum()), int(batch_cents[batch_cents < 0].sum())
+
+        cents = [round(transaction.amount * 100) for transaction in self.transactions]
+        return sum(amount for amount in cents if amount > 0), sum(amount for amount in cents if amount < 0)
 
 
 class SafetyCheckError(Exception):
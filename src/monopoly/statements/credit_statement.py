@@ -1,5 +1,6 @@
 import logging
 import re
+from typing import TYPE_CHECKING
 
 from monopoly.constants import EntryType
 from monopoly.statements.debit_statement import DebitStatement
@@ -7,6 +8,9 @@ from monopoly.statements.transaction import RawTransaction, Transaction
 
 from .base import BaseStatement, SafetyCheckError
 
+if TYPE_CHECKING:
+    from monopoly.statements.transaction_batch import TransactionBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,17 +20,27 @@ class CreditStatement(BaseStatement):
     statement_type = EntryType.CREDIT
 
     def post_process_transactions(self, transactions) -> list[Transaction]:
-        previous_month_balances = self.get_prev_month_balances()
-        if previous_month_balances:
-            first_transaction_date = next(iter(transactions)).date
-            for prev_month_balance in previous_month_balances:
-                groupdict = prev_month_balance.groupdict()
-                groupdict["transaction_date"] = first_transaction_date
-                raw_transaction = RawTransaction(**groupdict)
-                prev_month_transaction = Transaction(**raw_transaction.as_dict())
-                transactions.insert(0, prev_month_transaction)
+        first_transaction_date = next(iter(transactions)).date
+        for raw_transaction in self.get_prev_month_raw_transactions(first_transaction_date):
+            transactions.insert(0, Transaction(**raw_transaction.as_dict()))
         return transactions
 
+    def post_process_batch(self, batch: "TransactionBatch") -> "TransactionBatch":
+        from monopoly.statements.transaction_batch import TransactionBatch
+
+        if raw_transactions := self.get_prev_month_raw_transactions(str(batch.dates[0])):
+            return TransactionBatch.from_raw(reversed(raw_transactions)).concat(batch)
+        return batch
+
+    def get_prev_month_raw_transactions(self, transaction_date: str) -> list[RawTransaction]:
+        """Return the previous month's balances as raw transactions, dated with the first transaction's date."""
+        raw_transactions = []
+        for prev_month_balance in self.get_prev_month_balances():
+            groupdict = prev_month_balance.groupdict()
+            groupdict["transaction_date"] = transaction_date
+            raw_transactions.append(RawTransaction(**groupdict))
+        return raw_transactions
+
     def pre_process_match(self, raw_transaction: RawTransaction) -> RawTransaction:
         """Pre-process transactions by adding a debit or credit polarity identifier to the group dict."""
         raw_transaction = super().pre_process_match(raw_transaction)
@@ -57,15 +71,13 @@ class CreditStatement(BaseStatement):
 
         Returns `False` if the total does not exist in the document.
         """
-        numbers = self.get_all_numbers_from_document()
-        transactions = self.transactions
-
-        total_amount = round(sum(t.amount for t in transactions), 2)
-        total_amount_found = total_amount in numbers
+        numbers = self.get_cent_index_from_document()
+        tolerance = self.config.safety_check_tolerance
+        total_cents = sum(self.get_cent_totals())
 
         # if sum of debit and credit is the same as the total amount
         # then the statement is safe
-        if abs(total_amount) in numbers or total_amount_found:
+        if numbers.contains(abs(total_cents), tolerance):
             return True
 
         # attempt a debit-statement style safety for banks that have
@@ -74,5 +86,5 @@ class CreditStatement(BaseStatement):
         if DebitStatement.perform_safety_check(self):
             return True
 
-        msg = f"Total amount {total_amount} cannot be found in credit statement"
+        msg = f"Total amount {total_cents / 100} cannot be found in credit statement"
         raise SafetyCheckError(msg)
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
 
@@ -19,7 +20,7 @@ class DateResolver:
 
     def __init__(
         self,
-        pages: list[PdfPage],
+        pages: Iterable[PdfPage],
         config: StatementConfig,
         file_path: Path | None = None,
     ):
@@ -37,21 +38,15 @@ class DateResolver:
             msg = f"Pattern must be one of {allowed_patterns}, not {type(pattern)}"
             raise TypeError(msg)
 
-        for page in self.pages:
-            lines = page.lines
-
-            for i, line in enumerate(lines):
-                text = self._get_search_text(lines, i, line)
-
-                if match := pattern.search(text):
-                    date_string = self._construct_date_string(match)
-                    statement_date = parse(
-                        date_string=date_string,
-                        settings=self.config.statement_date_order.settings,
-                    )
-                    if statement_date:
-                        return statement_date
-                    logger.info("Unable to parse statement date %s", date_string)
+        for match in self._iter_matches():
+            date_string = self._construct_date_string(match)
+            statement_date = parse(
+                date_string=date_string,
+                settings=self.config.statement_date_order.settings,
+            )
+            if statement_date:
+                return statement_date
+            logger.info("Unable to parse statement date %s", date_string)
 
         # Fallback: Try extracting date from filename
         if filename_date := self._extract_date_from_filename():
@@ -61,7 +56,22 @@ class DateResolver:
         msg = "Statement date not found"
         raise ValueError(msg)
 
-    def _get_search_text(self, lines: list[str], i: int, line: str) -> str:
+    def has_statement_date(self) -> bool:
+        """Check if any page contains text matching the statement date pattern, without parsing it."""
+        return next(self._iter_matches(), None) is not None
+
+    def _iter_matches(self) -> Iterator[re.Match]:
+        pattern = self.config.statement_date_pattern
+        for page in self.pages:
+            lines = page.lines
+
+            for i, line in enumerate(lines):
+                text = self._get_search_text(lines, i, line)
+
+                if match := pattern.search(text):
+                    yield match
+
+    def _get_search_text(self, lines: Sequence[str], i: int, line: str) -> str:
         """Get text to search, optionally combining multiple lines and removing whitespace."""
         if not self.multiline_config:
             return line
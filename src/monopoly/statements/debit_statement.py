@@ -1,13 +1,25 @@
 import logging
 import re
+from dataclasses import dataclass
+from functools import cached_property
 
 from monopoly.constants import EntryType
+from monopoly.regex_engine import compile_pattern
 from monopoly.statements.transaction import RawTransaction
 
 from .base import BaseStatement, SafetyCheckError
 
 logger = logging.getLogger(__name__)
 
+WITHDRAWAL_NAMES = ["withdraw", "debit", r"from\ your\ account"]
+DEPOSIT_NAMES = ["deposit", "credit", r"to\ your\ account"]
+
+
+@dataclass
+class ColumnPositions:
+    withdrawal: int | None
+    deposit: int | None
+
 
 class DebitStatement(BaseStatement):
     """A dataclass representation of a debit statement."""
@@ -16,7 +28,7 @@ class DebitStatement(BaseStatement):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._column_pos_cache: dict[tuple[str, int], int | None] = {}
+        self._column_positions: dict[int, ColumnPositions] = {}
 
     def pre_process_match(self, raw_transaction: RawTransaction) -> RawTransaction:
         """Pre-process transactions by adding a debit or credit polarity identifier to the group dict."""
@@ -65,37 +77,26 @@ class DebitStatement(BaseStatement):
         return "CR" if withdrawal_diff > deposit_diff else "DR"
 
     def get_withdrawal_pos(self, page_number: int) -> int | None:
-        common_names = ["withdraw", "debit", r"from\ your\ account"]
-        for name in common_names:
-            if pos := self.get_column_pos(name, page_number=page_number):
-                return pos
-        logger.debug("%s column not found in header on page %s", common_names, page_number)
-        return False
+        return self.get_column_positions(page_number).withdrawal
 
     def get_deposit_pos(self, page_number: int) -> int | None:
-        common_names = ["deposit", "credit", r"to\ your\ account"]
-        for name in common_names:
-            if pos := self.get_column_pos(name, page_number=page_number):
-                return pos
-        logger.debug("%s column not found in header on page %s", common_names, page_number)
-        return False
-
-    def get_column_pos(self, column_type: str, page_number: int) -> int | None:
-        cache_key = (column_type, page_number)
-        if cache_key in self._column_pos_cache:
-            return self._column_pos_cache[cache_key]
-
-        pattern = re.compile(rf"{column_type}[\w()$]*", re.IGNORECASE)
-        result = None
-        if match := pattern.search(self.header):
-            result = self.get_header_pos(match.group(), page_number)
-
-        self._column_pos_cache[cache_key] = result
-        return result
-
-    def get_header_pos(self, column_name: str, page_number: int) -> int:
+        return self.get_column_positions(page_number).deposit
+
+    @cached_property
+    def column_names(self) -> dict[str, str]:
+        """Map each common column name to the full column name in the statement header, if it has one."""
+        column_names = {}
+        for name in WITHDRAWAL_NAMES + DEPOSIT_NAMES:
+            if match := re.search(rf"{name}[\w()$]*", self.header, re.IGNORECASE):
+                column_names[name] = match.group()
+        return column_names
+
+    def get_column_positions(self, page_number: int) -> ColumnPositions:
         """
-        Return position of the 'WITHDRAWAL' or 'DEPOSIT' header for a particular page.
+        Return the positions of the 'WITHDRAWAL' and 'DEPOSIT' headers for a particular page.
+
+        The header lines of a page are found once, and both positions are resolved
+        together, so that each transaction only needs to look them up.
 
         An assumption is made here that numbers are right aligned, meaning
         that if an amount matches with the end of the withdrawal string position,
@@ -108,36 +109,47 @@ class DebitStatement(BaseStatement):
         16 OCT       item                                     123.12
         ```
         """
-        header_pattern = self.config.header_pattern
-        lines = self.pages[page_number].lines
-        for line in lines:
-            if match := header_pattern.search(line):
-                header = match.string.lower()
-                header_start_pos = header.find(column_name.lower())
-                if header_start_pos == -1:
-                    continue
+        if (positions := self._column_positions.get(page_number)) is None:
+            header_lines = [line.lower() for line in self.get_header_lines(page_number)]
+            positions = ColumnPositions(
+                withdrawal=self._find_column(WITHDRAWAL_NAMES, header_lines, page_number),
+                deposit=self._find_column(DEPOSIT_NAMES, header_lines, page_number),
+            )
+            self._column_positions[page_number] = positions
+        return positions
+
+    def _find_column(self, common_names: list[str], header_lines: list[str], page_number: int) -> int | None:
+        for name in common_names:
+            if column_name := self.column_names.get(name):
+                return self._get_header_pos(column_name, header_lines, page_number)
+        logger.debug("%s column not found in header on page %s", common_names, page_number)
+        return False
+
+    @staticmethod
+    def _get_header_pos(column_name: str, header_lines: list[str], page_number: int) -> int:
+        for line in header_lines:
+            header_start_pos = line.find(column_name.lower())
+            if header_start_pos != -1:
                 return header_start_pos + len(column_name)
 
         logger.debug("Debit header %s cannot be found on page %s", column_name, page_number)
         return -1
 
+    def get_header_lines(self, page_number: int) -> list[str]:
+        header_pattern = compile_pattern(self.config.header_pattern)
+        return [line for line in self.pages[page_number].lines if header_pattern.search(line)]
+
     def perform_safety_check(self: BaseStatement) -> bool:
         """Check that debit and credit transaction sums exist as a number within the statement."""
-        transactions = self.transactions
-
-        numbers = self.get_all_numbers_from_document()
+        numbers = self.get_cent_index_from_document()
+        tolerance = self.config.safety_check_tolerance
+        debit_cents, credit_cents = self.get_cent_totals()
 
-        # add a zero, for cases where the debit statement
+        # a zero sum is accepted, for cases where the debit statement
         # either is completely debit or credit transactions
-        numbers.update([0])
-
-        debit_amounts = [transaction.amount for transaction in transactions if transaction.amount > 0]
-        credit_amounts = [transaction.amount for transaction in transactions if transaction.amount < 0]
-
-        debit_sum = round(abs(sum(debit_amounts)), 2)
-        credit_sum = round(abs(sum(credit_amounts)), 2)
-
-        result = all([debit_sum in numbers, credit_sum in numbers])
+        result = all(
+            abs(cents) <= tolerance or numbers.contains(abs(cents), tolerance) for cents in (debit_cents, credit_cents)
+        )
         if not result:
             raise SafetyCheckError(self.failed_safety_message)
 
@@ -1,11 +1,60 @@
 """Number extraction logic for statement safety checks."""
 
 import re
+from bisect import bisect_left
+from collections.abc import Iterable
 from functools import cached_property
 
 from monopoly.constants import Columns, SharedPatterns
 from monopoly.pdf import PdfPage
 
+NUMBER_PATTERN = re.compile(r"[\d.,]+")
+DECIMAL_PATTERN = re.compile(r"\d+\.\d+$")
+# amounts with at most two significant digits after the decimal point, which may be empty or missing
+CENTS_PATTERN = re.compile(r"(\d+)(?:\.(\d{0,2})0*)?$")
+SUBTOTAL_PATTERN = re.compile(rf"(?:sub\stotal.*?)\s+{SharedPatterns.AMOUNT}", re.IGNORECASE)
+
+
+def to_cents(number: str) -> int | None:
+    """
+    Convert an amount, e.g. "1,234.50", "1,234." or "1,234", to an exact number of cents.
+
+    Returns `None` for amounts with fractions of a cent, since these can never be
+    equal to a sum of transactions.
+    """
+    if match := CENTS_PATTERN.match(number.replace(",", "").strip()):
+        whole, fraction = match.groups()
+        return int(whole) * 100 + int((fraction or "").ljust(2, "0"))
+    return None
+
+
+class CentIndex:
+    """
+    The amounts found in a statement, in cents.
+
+    Amounts are looked up exactly in a set, or within a tolerance in a sorted list.
+    """
+
+    def __init__(self, cents: Iterable[int]):
+        self.cents = set(cents)
+
+    def __contains__(self, amount: int) -> bool:
+        return amount in self.cents
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    @cached_property
+    def sorted_cents(self) -> list[int]:
+        return sorted(self.cents)
+
+    def contains(self, amount: int, tolerance: int = 0) -> bool:
+        """Check if an amount, give or take `tolerance` cents, was found in the statement."""
+        if not tolerance:
+            return amount in self.cents
+        idx = bisect_left(self.sorted_cents, amount - tolerance)
+        return idx < len(self.sorted_cents) and self.sorted_cents[idx] <= amount + tolerance
+
 
 class NumberExtractor:
     """Extracts decimal numbers from statement pages for safety validation."""
@@ -15,49 +64,40 @@ class NumberExtractor:
 
     @cached_property
     def _number_pattern(self) -> re.Pattern:
-        return re.compile(r"[\d.,]+")
-
-    @cached_property
-    def _decimal_pattern(self) -> re.Pattern:
-        return re.compile(r"\d+\.\d+$")
+        return NUMBER_PATTERN
 
     @cached_property
     def _subtotal_pattern(self) -> re.Pattern:
-        return re.compile(rf"(?:sub\stotal.*?)\s+{SharedPatterns.AMOUNT}", re.IGNORECASE)
+        return SUBTOTAL_PATTERN
 
-    def get_all_numbers(self) -> set[float]:
-        """Extract all decimal numbers from all pages plus subtotal sums."""
-        numbers: set[float] = set()
-        for page in self.pages:
-            numbers.update(self._get_decimal_numbers(page.lines))
-        numbers.add(self._get_subtotal_sum())
-        return numbers
-
-    def _get_decimal_numbers(self, lines: list[str]) -> set[float]:
+    def get_all_cents(self) -> CentIndex:
         """
-        Return all decimal numbers from a list of lines.
+        Extract all decimal numbers from all pages plus the subtotal sum as cents, in one pass over the lines.
 
         This is used to perform a safety check, to make sure no transactions have been missed.
+        The subtotal sum is useful for statements that don't give a total figure over
+        several cards/months in a single statement.
         """
         numbers: set[str] = set()
-        for line in lines:
-            numbers.update(self._number_pattern.findall(line))
-        numbers = {number.replace(",", "") for number in numbers}
-        return {float(number) for number in numbers if self._decimal_pattern.match(number)}
+        subtotals: list[str] = []
+        for page in self.pages:
+            for line in page.lines:
+                numbers.update(self._number_pattern.findall(line))
+                if match := self._subtotal_pattern.search(line):
+                    subtotals.append(match.groupdict()[Columns.AMOUNT])
+        return self.to_cent_index(numbers, subtotals)
 
-    def _get_subtotal_sum(self) -> float:
+    @staticmethod
+    def to_cent_index(numbers: Iterable[str], subtotals: Iterable[str]) -> CentIndex:
         """
-        Retrieve the subtotals from a document, and calculates the total.
+        Convert the numbers and subtotals found in a statement to cents.
 
-        Useful for statements that don't give a total figure over
-        several cards/months in a single statement.
+        Only numbers with a decimal point are kept, while subtotals are summed however they are written.
         """
-        subtotals: list[str] = []
-        for page in self.pages:
-            subtotals.extend(
-                match.groupdict()[Columns.AMOUNT]
-                for line in page.lines
-                if (match := self._subtotal_pattern.search(line))
-            )
-        cleaned_subtotals = [float(amount.replace(",", "")) for amount in subtotals]
-        return sum(cleaned_subtotals)
+        index = CentIndex(
+            cents
+            for number in numbers
+            if DECIMAL_PATTERN.match(number.replace(",", "")) and (cents := to_cents(number)) is not None
+        )
+        index.cents.add(sum(cents for subtotal in subtotals if (cents := to_cents(subtotal)) is not None))
+        return index
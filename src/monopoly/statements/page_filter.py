@@ -0,0 +1,43 @@
+"""Page filtering logic, used to skip boilerplate pages before parsing."""
+
+import re
+from collections.abc import Iterable
+
+from monopoly.config import StatementConfig
+from monopoly.pdf import PdfPage
+from monopoly.regex_engine import compile_pattern
+from monopoly.statements.date_resolver import DateResolver
+
+# every amount matched by a transaction pattern, and every decimal number
+# collected for the safety check, contains one of these tokens
+AMOUNT_TOKEN_PATTERN = re.compile(r"\d,*\.|\.\d")
+
+
+class PageFilter:
+    """
+    Identifies pages that cannot contain any statement information.
+
+    A page is relevant if it contains an amount-looking token, or if any line matches
+    the header, statement date or previous balance pattern of a statement config.
+    Pages with amounts are kept after a single scan of the page's text, so the
+    per-line checks only run on pages such as terms and conditions or marketing inserts.
+    """
+
+    def __init__(self, statement_configs: Iterable[StatementConfig]):
+        self.statement_configs = list(statement_configs)
+
+    def is_relevant(self, page: PdfPage) -> bool:
+        if AMOUNT_TOKEN_PATTERN.search(page.raw_text):
+            return True
+
+        lines = page.lines
+        for config in self.statement_configs:
+            line_patterns = [
+                compile_pattern(pattern) for pattern in (config.header_pattern, config.prev_balance_pattern) if pattern
+            ]
+            if any(pattern.search(line) for pattern in line_patterns for line in lines):
+                return True
+
+            if DateResolver([page], config).has_statement_date():
+                return True
+        return False
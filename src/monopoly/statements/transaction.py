@@ -1,14 +1,38 @@
 import json
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from pydantic import Field, field_validator, model_validator
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 from pydantic_core import ArgsKwargs
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from monopoly.constants import Columns
 
+# characters that are removed from amounts before they are converted to floats
+NON_NUMERIC_PATTERN = re.compile(r"[^\d\.\-]")
+
+
+class TransactionSettings(BaseSettings):
+    """
+    Pydantic model that automatically populates transaction settings from a .env file.
+
+    Also populates using environment variables, e.g.
+    export MONOPOLY_STRICT_TRANSACTIONS=true
+    """
+
+    monopoly_strict_transactions: bool = False
+    model_config = SettingsConfigDict(env_file=".env", extra="allow")
+
+
+@lru_cache(maxsize=1)
+def get_transaction_settings() -> TransactionSettings:
+    """Read the transaction settings once, instead of re-reading the .env file for every statement."""
+    return TransactionSettings()
+
 
 # ruff: noqa: N805
 @dataclass
@@ -93,7 +117,7 @@ class Transaction:
         if value is None:
             return "0"
         if isinstance(value, str):
-            return re.sub(r"[^\d\.\-]", "", value)
+            return NON_NUMERIC_PATTERN.sub("", value)
         return str(value)
 
     # pylint: disable=bad-classmethod-argument
@@ -125,3 +149,74 @@ class Transaction:
 
     def __str__(self):
         return json.dumps(self.as_raw_dict(show_polarity=True))
+
+    @classmethod
+    def from_raw(cls, raw_transaction: RawTransaction, *, auto_polarity: bool = True) -> "Transaction":
+        """
+        Create a transaction from trusted parser output, without running the validators.
+
+        Fields are normalized the same way as the validators would, and the transaction
+        is equal to one created with validation. Values that the parser does not produce,
+        e.g. a missing date or an amount that is not an ASCII string, are validated as usual.
+        """
+        description = raw_transaction.description
+        amount = raw_transaction.amount
+        date = raw_transaction.transaction_date
+        polarity = raw_transaction.polarity
+        if not (
+            isinstance(description, str)
+            and isinstance(date, str)
+            and (polarity is None or isinstance(polarity, str))
+            and _is_trusted_number(amount)
+            and _is_trusted_number(raw_transaction.balance)
+        ):
+            return cls(**raw_transaction.as_dict(), auto_polarity=auto_polarity)
+
+        try:
+            amount_value = _to_float(amount)
+            balance_value = _to_float(raw_transaction.balance)
+        except ValueError:
+            # raises the same validation error as a validated transaction
+            return cls(**raw_transaction.as_dict(), auto_polarity=auto_polarity)
+
+        if amount.startswith("(") and amount.endswith(")"):
+            polarity = "CR"
+        if amount_value != 0 and auto_polarity:
+            amount_value = abs(amount_value) if polarity in ("CR", "+") else -abs(amount_value)
+
+        transaction = cls.__new__(cls)
+        transaction.__dict__.update(
+            description=" ".join(description.split()),
+            amount=amount_value,
+            date=date,
+            polarity=polarity,
+            balance=balance_value,
+            auto_polarity=auto_polarity,
+        )
+        return transaction
+
+
+def _is_trusted_number(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and value.isascii())
+
+
+def _to_float(value: str | None) -> float:
+    if value is None:
+        return 0.0
+    return float(NON_NUMERIC_PATTERN.sub("", value))
+
+
+def build_transactions(
+    raw_transactions: Iterable[RawTransaction], *, auto_polarity: bool = True, strict: bool | None = None
+) -> list[Transaction]:
+    """
+    Create transactions from parser output.
+
+    Transactions skip validation unless `strict` is set, which defaults to
+    the `MONOPOLY_STRICT_TRANSACTIONS` setting.
+    """
+    if strict is None:
+        strict = get_transaction_settings().monopoly_strict_transactions
+    if strict:
+        return [Transaction(**raw.as_dict(), auto_polarity=auto_polarity) for raw in raw_transactions]
+    return [Transaction.from_raw(raw, auto_polarity=auto_polarity) for raw in raw_transactions]
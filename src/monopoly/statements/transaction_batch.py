@@ -0,0 +1,237 @@
+"""
+Columnar transactions, with dates, amounts and balances held in NumPy arrays.
+
+A batch lets sums and debit/credit splits run over whole columns, and can be
+taken by consumers that work with arrays without converting each transaction.
+Requires the `numpy` extra.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    msg = "numpy is not installed. Install it with: pip install monopoly-core[numpy]"
+    raise ImportError(msg) from None
+
+from monopoly.statements.transaction import (
+    RawTransaction,
+    Transaction,
+    build_transactions,
+)
+
+# the same characters as NON_NUMERIC_PATTERN, keeping the newlines that separate amounts
+_NON_NUMERIC_LINE_PATTERN = re.compile(r"[^\d\.\-\n]")
+
+
+@dataclass(frozen=True, eq=False)
+class TransactionBatch:
+    """
+    Transactions stored as columns, one array per field.
+
+    Descriptions are interned: each distinct description is stored once in
+    `description_values`, and `description_codes` holds its index for each transaction.
+    """
+
+    dates: np.ndarray
+    description_codes: np.ndarray
+    description_values: tuple[str, ...]
+    amounts: np.ndarray
+    balances: np.ndarray
+    polarities: np.ndarray
+    auto_polarity: np.ndarray
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> "TransactionBatch":
+        transactions = list(transactions)
+        interned: dict[str, int] = {}
+        codes = [interned.setdefault(t.description, len(interned)) for t in transactions]
+
+        return cls(
+            dates=np.array([t.date for t in transactions], dtype=np.str_),
+            description_codes=np.array(codes, dtype=np.int32),
+            description_values=tuple(interned),
+            amounts=np.array([t.amount for t in transactions], dtype=np.float64),
+            balances=np.array([t.balance for t in transactions], dtype=np.float64),
+            polarities=np.array([t.polarity for t in transactions], dtype=object),
+            auto_polarity=np.array([t.auto_polarity for t in transactions], dtype=np.bool_),
+        )
+
+    @classmethod
+    def from_raw(cls, raw_transactions: Iterable[RawTransaction], *, auto_polarity: bool = True) -> "TransactionBatch":
+        """
+        Create a batch from parser output, converting and signing the amounts a column at a time.
+
+        The batch is equal to one created from the transactions that `build_transactions`
+        would return. Values that the parser does not produce, e.g. a missing date or an
+        amount that is not an ASCII string, are validated as usual.
+        """
+        raw_transactions = list(raw_transactions)
+        descriptions = [raw.description for raw in raw_transactions]
+        amount_strings = [raw.amount for raw in raw_transactions]
+        dates = [raw.transaction_date for raw in raw_transactions]
+        polarity_values = [raw.polarity for raw in raw_transactions]
+        balance_strings = [raw.balance for raw in raw_transactions]
+
+        amounts = _to_floats(amount_strings)
+        balances = _to_floats(["0" if balance is None else balance for balance in balance_strings])
+        if not (
+            amounts is not None
+            and balances is not None
+            and _is_str_column(descriptions)
+            and _is_str_column(dates)
+            and _is_str_column(polarity_values, optional=True)
+        ):
+            # raises the same validation error as a validated transaction
+            return cls.from_transactions(build_transactions(raw_transactions, auto_polarity=auto_polarity))
+
+        polarities = np.array(polarity_values, dtype=object)
+        enclosed = [i for i, amount in enumerate(amount_strings) if amount[:1] == "(" and amount[-1:] == ")"]
+        polarities[enclosed] = "CR"
+
+        if auto_polarity:
+            is_credit = (polarities == "CR") | (polarities == "+")
+            signed = np.where(is_credit, np.abs(amounts), -np.abs(amounts))
+            # zero amounts keep their sign, as they do in a transaction
+            amounts = np.where(amounts == 0, amounts, signed)
+
+        # descriptions repeat, so each distinct one is normalized once
+        raw_interned: dict[str, int] = {}
+        raw_codes = np.array([raw_interned.setdefault(d, len(raw_interned)) for d in descriptions], dtype=np.int32)
+        interned: dict[str, int] = {}
+        normalized_codes = np.array(
+            [interned.setdefault(" ".join(d.split()), len(interned)) for d in raw_interned], dtype=np.int32
+        )
+
+        return cls(
+            dates=np.array(dates, dtype=np.str_),
+            description_codes=normalized_codes[raw_codes] if len(raw_codes) else raw_codes,
+            description_values=tuple(interned),
+            amounts=amounts,
+            balances=balances,
+            polarities=polarities,
+            auto_polarity=np.full(len(raw_transactions), auto_polarity, dtype=np.bool_),
+        )
+
+    def concat(self, other: "TransactionBatch") -> "TransactionBatch":
+        """Return a batch with the transactions of this batch, followed by those of `other`."""
+        interned = {description: code for code, description in enumerate(self.description_values)}
+        other_codes = np.array(
+            [interned.setdefault(description, len(interned)) for description in other.description_values],
+            dtype=np.int32,
+        )
+        return TransactionBatch(
+            dates=np.concatenate([self.dates, other.dates]),
+            description_codes=np.concatenate([self.description_codes, other_codes[other.description_codes]]),
+            description_values=tuple(interned),
+            amounts=np.concatenate([self.amounts, other.amounts]),
+            balances=np.concatenate([self.balances, other.balances]),
+            polarities=np.concatenate([self.polarities, other.polarities]),
+            auto_polarity=np.concatenate([self.auto_polarity, other.auto_polarity]),
+        )
+
+    def map_dates(self, func: Callable[[str], str]) -> "TransactionBatch":
+        """Return a batch with `func` applied to each date, calling it once for each distinct date."""
+        if not len(self):
+            return self
+        unique_dates, inverse = np.unique(self.dates, return_inverse=True)
+        mapped_dates = np.array([func(date) for date in unique_dates.tolist()], dtype=np.str_)
+        return replace(self, dates=mapped_dates[inverse])
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @property
+    def descriptions(self) -> np.ndarray:
+        """Return the description of each transaction."""
+        return np.array(self.description_values, dtype=object)[self.description_codes]
+
+    @property
+    def debits(self) -> np.ndarray:
+        """Return a mask of the transactions with a positive amount."""
+        return self.amounts > 0
+
+    @property
+    def credits(self) -> np.ndarray:
+        """Return a mask of the transactions with a negative amount."""
+        return self.amounts < 0
+
+    @property
+    def cents(self) -> np.ndarray:
+        """Return the amount of each transaction in cents."""
+        return np.rint(self.amounts * 100).astype(np.int64)
+
+    def total(self) -> float:
+        return float(self.amounts.sum())
+
+    def debit_total(self) -> float:
+        return float(self.amounts[self.debits].sum())
+
+    def credit_total(self) -> float:
+        return float(self.amounts[self.credits].sum())
+
+    def rows(self) -> Iterator[list[Any]]:
+        """Yield the date, description, amount and balance of each transaction, e.g. for a CSV writer."""
+        descriptions = self.description_values
+        for date, code, amount, balance in zip(
+            self.dates.tolist(),
+            self.description_codes.tolist(),
+            self.amounts.tolist(),
+            self.balances.tolist(),
+            strict=True,
+        ):
+            yield [date, descriptions[code], amount, balance or 0]
+
+    def to_transactions(self) -> list[Transaction]:
+        """Convert the batch back to transactions, which are equal to the ones it was created from."""
+        descriptions = self.description_values
+        transactions = []
+        for date, code, amount, balance, polarity, auto_polarity in zip(
+            self.dates.tolist(),
+            self.description_codes.tolist(),
+            self.amounts.tolist(),
+            self.balances.tolist(),
+            self.polarities.tolist(),
+            self.auto_polarity.tolist(),
+            strict=True,
+        ):
+            # the values were validated or normalized when the batch was created
+            transaction = Transaction.__new__(Transaction)
+            transaction.__dict__.update(
+                description=descriptions[code],
+                amount=amount,
+                date=date,
+                polarity=polarity,
+                balance=balance,
+                auto_polarity=auto_polarity,
+            )
+            transactions.append(transaction)
+        return transactions
+
+
+def _is_str_column(values: list[Any], *, optional: bool = False) -> bool:
+    allowed = {str, type(None)} if optional else {str}
+    return set(map(type, values)) <= allowed
+
+
+def _to_floats(values: list[Any]) -> np.ndarray | None:
+    """
+    Convert amount strings to floats, the same way that a transaction's validators do.
+
+    Returns `None` for values that would not skip validation in a transaction.
+    """
+    if not _is_str_column(values):
+        return None
+    text = "\n".join(values)
+    if not text.isascii():
+        return None
+    cleaned = _NON_NUMERIC_LINE_PATTERN.sub("", text).split("\n")
+    if len(cleaned) != len(values):
+        return None
+    try:
+        return np.fromiter(map(float, cleaned), dtype=np.float64, count=len(cleaned))
+    except ValueError:
+        return None
@@ -0,0 +1,74 @@
+"""
+Compares the per-file cost of bank detection as the list of banks grows.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+from time import perf_counter
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+
+from monopoly.banks import BankDetector, banks
+from monopoly.identifiers import MetadataIdentifier, TextIdentifier
+from monopoly.pdf import PdfDocument
+
+RUNS = 200
+BANK_COUNTS = (len(banks), 200, 2000)
+
+
+def make_synthetic_banks(count: int) -> list[type]:
+    """Create banks with unique metadata, in the same shape as the configured banks."""
+    return [
+        type(
+            f"SyntheticBank{i}",
+            (),
+            {
+                "identifiers": [
+                    [
+                        MetadataIdentifier(creator=f"Statement Engine {i:05}", producer=f"Renderer {i:05}"),
+                        TextIdentifier(f"Synthetic Bank {i:05}"),
+                    ]
+                ]
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def linear_detect_bank(detector: BankDetector, bank_list):
+    for bank in bank_list:
+        if any(detector.identifiers_match(group) for group in bank.identifiers):
+            return bank
+    return None
+
+
+def time_per_file(detect) -> float:
+    start = perf_counter()
+    for _ in range(RUNS):
+        detect()
+    return (perf_counter() - start) / RUNS
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("bank_count", BANK_COUNTS)
+def test_bank_detection(bank_count):
+    # the configured banks come last, so that every synthetic bank is visited by a linear scan
+    bank_list = [*make_synthetic_banks(bank_count - len(banks)), *banks]
+    document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    detector = BankDetector(document)
+    detector.metadata_identifier = MetadataIdentifier(
+        creator="Statement Engine 99999", producer="Renderer 99999", title="Unknown statement"
+    )
+    # warm the text of the document and the detection index, which are built once
+    expected = linear_detect_bank(detector, bank_list)
+    assert detector.detect_bank(bank_list) is expected
+
+    linear_time = time_per_file(lambda: linear_detect_bank(detector, bank_list))
+    indexed_time = time_per_file(lambda: detector.detect_bank(bank_list))
+    print(
+        f"\nbanks={bank_count:<5}"
+        f" linear={linear_time * 1e6:9.1f}us"
+        f" indexed={indexed_time * 1e6:9.1f}us"
+        f" speedup={linear_time / indexed_time:6.1f}x"
+    )
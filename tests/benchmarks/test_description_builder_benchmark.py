@@ -0,0 +1,85 @@
+"""
+Measures how multiline description building scales with the number of transactions on a page.
+
+Descriptions are built for every transaction of a synthetic page with about 1,000
+transactions, and of a page twice as long. Reads of the page's lines are counted, including
+the lines copied by slicing the page: if building a description only walks the lines it uses,
+about twice as many lines are read on the longer page, whereas copying the rest of the page
+for each transaction would read about four times as many. Each line's features should also
+be computed at most once. Counts are asserted rather than timings, since timings vary with
+the load of the machine, and the best timings are printed for reference.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+from dataclasses import replace
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+from test_utils.statements import synthesize_statement
+from test_utils.timing import best_time
+
+from monopoly.banks import Dbs, Ocbc
+from monopoly.statements.base import DescriptionBuilder, LineFeatures, MatchContext
+
+TRANSACTION_COUNT = 1_000
+TRANSACTION_RATIO = 0.7
+# a linear walk reads about 2x as many lines on a page twice as long, and a quadratic walk about 4x
+MAX_SCALING = 2.5
+
+
+class CountingLines(list):
+    """A list of lines that counts how many lines are read from it, by index or by slice."""
+
+    reads = 0
+
+    def __getitem__(self, key):
+        item = super().__getitem__(key)
+        self.reads += len(item) if isinstance(key, slice) else 1
+        return item
+
+
+def build_descriptions(config, transaction_count: int) -> tuple[int, int, int, float]:
+    """
+    Build every description on a synthetic page.
+
+    Return the number of lines on the page, the number of lines read by the description
+    builder, the number of lines read to compute line features, and the best time.
+    """
+    lines_per_page = round(transaction_count / TRANSACTION_RATIO)
+    page = synthesize_statement(config, page_count=1, lines_per_page=lines_per_page).pages[0]
+    multiline_config = replace(config.multiline_config, multiline_descriptions=True)
+    pattern = config.transaction_pattern
+    lines = CountingLines(page.lines)
+    feature_lines = CountingLines(page.lines)
+    matches = [(idx, match) for idx, line in enumerate(lines) if (match := pattern.search(line))]
+    transaction_lines = {idx for idx, _ in matches}
+
+    def build():
+        line_features = LineFeatures(feature_lines)
+        for idx, match in matches:
+            description = match.group("description")
+            context = MatchContext(
+                lines[idx], lines, idx, description, multiline_config, transaction_lines, line_features
+            )
+            DescriptionBuilder(context, pattern).build()
+
+    build()
+    return len(lines), lines.reads, feature_lines.reads, best_time(build)
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("config", [Dbs.debit, Ocbc.debit], ids=["dbs-debit", "ocbc-debit"])
+def test_description_builder_scaling(request, config):
+    _, single_reads, _, single_time = build_descriptions(config, TRANSACTION_COUNT)
+    line_count, double_reads, feature_reads, double_time = build_descriptions(config, TRANSACTION_COUNT * 2)
+
+    print(
+        f"\n{request.node.callspec.id:<12} {TRANSACTION_COUNT} transactions={single_time * 1000:7.2f}ms"
+        f" {TRANSACTION_COUNT * 2} transactions={double_time * 1000:7.2f}ms"
+        f" time scaling={double_time / single_time:4.2f}x"
+        f" lines read={single_reads}/{double_reads} ({double_reads / single_reads:4.2f}x)"
+    )
+    assert double_reads / single_reads < MAX_SCALING
+    # each line's start position and spans are computed at most once
+    assert feature_reads <= 2 * line_count
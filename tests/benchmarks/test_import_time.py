@@ -0,0 +1,28 @@
+"""
+Tracks the import time of `monopoly.banks` and the cold-start latency of the CLI.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+from test_utils.timing import best_time
+
+# budgets in seconds, for the best of several runs in a fresh interpreter
+test_cases = [
+    ("import monopoly.banks", ["-c", "import monopoly.banks"], 0.15),
+    ("from monopoly.banks import banks", ["-c", "from monopoly.banks import banks"], 1.5),
+    ("monopoly --help", ["-c", "from monopoly.cli import monopoly; monopoly(['--help'])"], 0.5),
+]
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("name, args, budget", test_cases, ids=[name for name, _, _ in test_cases])
+def test_import_time(name, args, budget):
+    timing = best_time(lambda: subprocess.run([sys.executable, *args], capture_output=True, check=True))
+
+    print(f"\n{name:<34} best={timing * 1000:7.1f}ms budget={budget * 1000:7.1f}ms")
+    assert timing < budget
@@ -0,0 +1,105 @@
+"""
+Measures the parsing throughput of each bank's statement configs on synthetic statements.
+
+Throughput is compared against a stored baseline, and a statement config fails if
+any stage is slower than `REGRESSION_THRESHOLD` times its baseline. Each result is
+scaled by a calibration workload that is timed alongside it, so that a slower or busier
+machine is not reported as a regression. For precise comparisons, update the baseline
+on the same machine before making changes.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks/test_parsing_throughput.py -s`.
+Update the baseline with `MONOPOLY_BENCHMARK_UPDATE=1`.
+"""
+
+import copy
+import json
+import os
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+from test_utils.statements import create_statement, get_bank_configs, synthesize_statement
+from test_utils.timing import best_time
+
+from monopoly.pipeline import Pipeline
+from monopoly.statements.base import DescriptionBuilder, MatchContext
+
+RUNS = 7
+REGRESSION_THRESHOLD = 0.5
+BASELINE_PATH = Path(__file__).parent / "baselines" / "parsing_throughput.json"
+
+test_cases = get_bank_configs()
+results: dict[str, dict[str, int]] = {}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def update_baseline():
+    yield
+    if os.getenv("MONOPOLY_BENCHMARK_UPDATE") and results:
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        baseline.update(results)
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+
+
+def lines_per_second(line_count: int, run) -> int:
+    """Return the best throughput over several runs, to reduce noise."""
+    return round(line_count / best_time(run, RUNS))
+
+
+def calibrate() -> int:
+    """Return the throughput of a fixed pure Python workload, as a measure of the machine's speed."""
+    return lines_per_second(100_000, lambda: sum(len(str(i)) for i in range(100_000)))
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("config", test_cases.values(), ids=test_cases.keys())
+def test_parsing_throughput(request, config):
+    case_id = request.node.callspec.id
+    synthetic = synthesize_statement(config, page_count=10)
+    statement = create_statement(config, synthetic)
+    transactions = statement.get_transactions()
+    assert transactions, f"no transactions were parsed from {synthetic.transaction_count} transaction lines"
+
+    # exercise multiline descriptions for every config, since each line is checked against the next lines
+    multiline_config = replace(config.multiline_config, multiline_descriptions=True)
+    contexts = [
+        MatchContext(line, page.lines, idx, match.group("description"), multiline_config)
+        for page in synthetic.pages
+        for idx, line in enumerate(page.lines)
+        if (match := statement.pattern.search(line))
+    ]
+
+    def build_descriptions():
+        for context in contexts:
+            DescriptionBuilder(context, statement.pattern).build()
+
+    def transform():
+        statement.transactions = [copy.copy(transaction) for transaction in transactions]
+        Pipeline.transform(statement)
+
+    statement.statement_date = datetime(2024, 12, 31)
+    line_count = synthetic.line_count
+    throughput = {
+        "calibration": calibrate(),
+        "get_transactions": lines_per_second(
+            line_count, lambda: create_statement(config, synthetic).get_transactions()
+        ),
+        "description_builder": lines_per_second(line_count, build_descriptions),
+        "transform": lines_per_second(line_count, transform),
+    }
+    results[case_id] = throughput
+
+    baseline = json.loads(BASELINE_PATH.read_text()).get(case_id, {}) if BASELINE_PATH.exists() else {}
+    speed = throughput["calibration"] / baseline["calibration"] if baseline else 1.0
+    regressions = []
+    for stage, value in throughput.items():
+        if stage == "calibration":
+            continue
+        ratio = value / baseline[stage] / speed if stage in baseline else float("nan")
+        print(f"\n{case_id:<32} {stage:<20} {value:12,.0f} lines/s  vs baseline={ratio:5.2f}x")
+        if ratio < REGRESSION_THRESHOLD:
+            regressions.append(stage)
+    assert not regressions, f"{case_id} regressed in {regressions}"
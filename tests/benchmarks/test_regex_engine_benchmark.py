@@ -0,0 +1,48 @@
+"""
+Compares the time each bank's transaction patterns take to search statement lines on `re` and RE2.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+from collections import defaultdict
+from time import perf_counter
+
+import pytest
+from test_utils.lines import generate_adversarial_lines, generate_realistic_lines
+from test_utils.patterns import get_bank_patterns
+from test_utils.skip import skip_unless_benchmark
+
+from monopoly.regex_engine import RegexEngine, Re2Pattern, compile_pattern, get_engine
+
+test_cases = {
+    "realistic": generate_realistic_lines(2000),
+    "adversarial": generate_adversarial_lines(60),
+}
+
+
+def time_search(pattern, lines: list[str]) -> float:
+    start = perf_counter()
+    for line in lines:
+        pattern.search(line)
+    return perf_counter() - start
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("lines", test_cases.values(), ids=test_cases.keys())
+def test_regex_engine(lines):
+    pytest.importorskip("re2")
+    engines = (RegexEngine(), get_engine("re2"))
+
+    timings: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
+    on_re2: dict[str, int] = defaultdict(int)
+    for transaction_pattern in get_bank_patterns():
+        for i, engine in enumerate(engines):
+            compiled = compile_pattern(transaction_pattern.pattern, engine)
+            timings[transaction_pattern.bank][i] += time_search(compiled, lines)
+        on_re2[transaction_pattern.bank] += isinstance(compiled, Re2Pattern)
+
+    for bank, (re_time, re2_time) in timings.items():
+        print(
+            f"\n{bank:<20} re={re_time * 1000:8.1f}ms re2={re2_time * 1000:8.1f}ms"
+            f" speedup={re_time / re2_time:6.2f}x patterns on re2={on_re2[bank]}"
+        )
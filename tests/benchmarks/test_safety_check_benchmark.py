@@ -0,0 +1,31 @@
+"""
+Measures the time to collect the numbers of a statement for the safety check, as an index of exact cents.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+from test_utils.statements import get_bank_configs, synthesize_statement
+from test_utils.timing import best_time
+
+from monopoly.statements.number_extractor import NumberExtractor
+
+test_cases = get_bank_configs()
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("config", test_cases.values(), ids=test_cases.keys())
+def test_safety_check_numbers(request, config):
+    synthetic = synthesize_statement(config, page_count=20)
+    extractor = NumberExtractor(synthetic.pages)
+
+    amount_count = len(extractor.get_all_cents())
+    cents_time = best_time(extractor.get_all_cents)
+
+    print(
+        f"\n{request.node.callspec.id:<32} lines={synthetic.line_count:<6}"
+        f" amounts={amount_count:<6}"
+        f" cents={cents_time * 1000:7.2f}ms"
+        f" per line={cents_time / synthetic.line_count * 1e6:5.2f}us"
+    )
@@ -0,0 +1,64 @@
+"""
+Compares the throughput and output of each text backend, per bank.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+from pathlib import Path
+
+import pytest
+from test_utils.skip import skip_if_encrypted, skip_unless_benchmark
+from test_utils.timing import RUNS, best_time
+from test_utils.transactions import get_transactions_as_dict, read_transactions_from_csv
+
+from monopoly.banks import banks
+from monopoly.constants import TextBackend
+from monopoly.pdf import PdfDocument, PdfParser
+from monopoly.pipeline import Pipeline
+
+fixture_directory = Path(__file__).parents[1] / "integration" / "banks"
+test_cases = [
+    (bank, statement_type)
+    for bank in banks
+    for statement_type in ("credit", "debit")
+    if (fixture_directory / bank.name / statement_type / "input.pdf").exists()
+]
+
+
+def extract(bank, test_directory: Path, text_backend: TextBackend):
+    """Return the best extraction time over several runs, along with the parsed transactions."""
+    # each run extracts the pages of a new parser, since pages are cached
+    parsers = [
+        PdfParser(bank, PdfDocument(test_directory / "input.pdf"), text_backend=text_backend) for _ in range(RUNS)
+    ]
+    remaining = iter(parsers)
+    timing = best_time(lambda: next(remaining).pages)
+    parser = parsers[-1]
+    pages = parser.pages
+
+    try:
+        transactions = get_transactions_as_dict(Pipeline(parser).extract().transactions)
+    except (RuntimeError, ValueError):
+        transactions = []
+    return timing, [page.raw_text for page in pages], transactions
+
+
+@skip_unless_benchmark
+@skip_if_encrypted
+@pytest.mark.parametrize("bank, statement_type", test_cases, ids=lambda value: getattr(value, "name", value))
+def test_text_backends(bank, statement_type):
+    test_directory = fixture_directory / bank.name / statement_type
+    expected_transactions = read_transactions_from_csv(test_directory, "raw.csv")
+
+    baseline_time, baseline_pages, baseline_transactions = extract(bank, test_directory, TextBackend.PDFTOTEXT)
+    assert baseline_transactions == expected_transactions
+
+    pymupdf_time, pymupdf_pages, pymupdf_transactions = extract(bank, test_directory, TextBackend.PYMUPDF)
+    print(
+        f"\n{bank.name:<20} {statement_type:<7}"
+        f" pdftotext={baseline_time * 1000:7.1f}ms"
+        f" pymupdf={pymupdf_time * 1000:7.1f}ms"
+        f" speedup={baseline_time / pymupdf_time:4.2f}x"
+        f" identical_text={pymupdf_pages == baseline_pages}"
+        f" correct_transactions={pymupdf_transactions == expected_transactions}"
+    )
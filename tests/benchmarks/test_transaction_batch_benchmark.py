@@ -0,0 +1,59 @@
+"""
+Compares the time to build transactions from parser output and compute the safety
+check sums over them, with and without a transaction batch.
+
+With a batch, the amounts are converted and signed a column at a time, and the
+sums run over the columns that the transactions were built from.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+import random
+
+import pytest
+from test_utils.skip import skip_unless_benchmark
+from test_utils.timing import best_time
+
+from monopoly.statements.transaction import RawTransaction, build_transactions
+
+np = pytest.importorskip("numpy")
+
+from monopoly.statements.transaction_batch import TransactionBatch  # noqa: E402
+
+
+def list_totals(raw_transactions: list[RawTransaction]) -> tuple[int, int]:
+    cents = [round(t.amount * 100) for t in build_transactions(raw_transactions)]
+    return sum(amount for amount in cents if amount > 0), sum(amount for amount in cents if amount < 0)
+
+
+def batch_totals(raw_transactions: list[RawTransaction]) -> tuple[int, int]:
+    batch = TransactionBatch.from_raw(raw_transactions)
+    batch.to_transactions()
+    cents = batch.cents
+    return int(cents[cents > 0].sum()), int(cents[cents < 0].sum())
+
+
+@skip_unless_benchmark
+@pytest.mark.parametrize("transaction_count", [100, 10_000, 100_000])
+def test_transaction_batch_totals(transaction_count):
+    rng = random.Random(0)
+    raw_transactions = [
+        RawTransaction(
+            transaction_date="01/01",
+            description=f"SHOP {i % 50}",
+            amount=f"{rng.uniform(0, 5000):,.2f}",
+            polarity=rng.choice([None, "CR"]),
+        )
+        for i in range(transaction_count)
+    ]
+    assert batch_totals(raw_transactions) == list_totals(raw_transactions)
+
+    list_time = best_time(lambda: list_totals(raw_transactions))
+    batch_time = best_time(lambda: batch_totals(raw_transactions))
+
+    print(
+        f"\ntransactions={transaction_count:<7}"
+        f" list={list_time * 1000:8.3f}ms"
+        f" batch={batch_time * 1000:8.3f}ms"
+        f" speedup={list_time / batch_time:5.2f}x"
+    )
@@ -0,0 +1,41 @@
+"""
+Compares the time for a fresh worker process to detect its first statement.
+
+The registry snapshot only saves importing the modules of the banks that are not
+detected, so the difference is small (about 1.1x): most of a worker's start-up is
+spent importing pymupdf and pydantic, which detection needs either way. Timings
+are printed for reference, and nothing is asserted on them.
+
+Run with `MONOPOLY_BENCHMARK=1 pytest tests/benchmarks -s`.
+"""
+
+import subprocess
+import sys
+
+from test_utils.skip import skip_unless_benchmark
+from test_utils.timing import best_time
+
+DETECT_STATEMENT = """
+from monopoly.banks import BankDetector
+from monopoly.pdf import PdfDocument
+
+document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+BankDetector(document).detect_bank(banks)
+"""
+test_cases = {
+    "import every bank": "from monopoly.banks import banks" + DETECT_STATEMENT,
+    "registry snapshot": "from monopoly.banks.registry import get_detection_banks; banks = get_detection_banks()"
+    + DETECT_STATEMENT,
+}
+
+
+def time_fresh_process(code: str) -> float:
+    return best_time(lambda: subprocess.run([sys.executable, "-c", code], capture_output=True, check=True))
+
+
+@skip_unless_benchmark
+def test_worker_warmup():
+    timings = {name: time_fresh_process(code) for name, code in test_cases.items()}
+    baseline = timings["import every bank"]
+    for name, timing in timings.items():
+        print(f"\n{name:<20} {timing * 1000:7.1f}ms speedup={baseline / timing:4.2f}x")
@@ -10,6 +10,7 @@ from monopoly.constants import EntryType
 from monopoly.handler import StatementHandler
 from monopoly.pdf import PdfDocument, PdfPage, PdfParser
 from monopoly.statements import BaseStatement, CreditStatement, DebitStatement
+from monopoly.statements.transaction import get_transaction_settings
 
 
 @pytest.fixture
@@ -19,6 +20,18 @@ def mock_env():
         yield
 
 
+@pytest.fixture
+def set_strict_transactions(monkeypatch):
+    """Sets MONOPOLY_STRICT_TRANSACTIONS, which is otherwise only read once per process"""
+
+    def set_strict(strict: str):
+        monkeypatch.setenv("MONOPOLY_STRICT_TRANSACTIONS", strict)
+        get_transaction_settings.cache_clear()
+
+    yield set_strict
+    get_transaction_settings.cache_clear()
+
+
 @pytest.fixture
 def pdf_document():
     yield PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
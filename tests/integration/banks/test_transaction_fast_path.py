@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+from test_utils.skip import skip_if_encrypted
+
+from monopoly.banks import banks
+from monopoly.examples.example_bank import ExampleBank
+from monopoly.pdf import PdfDocument, PdfParser
+from monopoly.pipeline import Pipeline
+
+banks_by_name = {bank.name: bank for bank in [*banks, ExampleBank]}
+fixtures = sorted(Path(__file__).parent.glob("*/*/input.pdf"))
+
+
+def get_transactions(path: Path, set_strict_transactions, *, strict: bool):
+    set_strict_transactions(str(strict).lower())
+    parser = PdfParser(banks_by_name[path.parts[-3]], PdfDocument(path))
+    return Pipeline(parser).handler.statement.get_transactions()
+
+
+@skip_if_encrypted
+@pytest.mark.parametrize("path", fixtures, ids=lambda path: f"{path.parts[-3]}-{path.parts[-2]}")
+def test_fast_path_matches_validation(path: Path, set_strict_transactions):
+    expected = get_transactions(path, set_strict_transactions, strict=True)
+    transactions = get_transactions(path, set_strict_transactions, strict=False)
+
+    assert [(t.amount, t.description) for t in transactions] == [(t.amount, t.description) for t in expected]
+    assert transactions == expected
+    # the statement hash is generated from the representation of its transactions
+    assert str(transactions) == str(expected)
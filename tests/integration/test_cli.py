@@ -1,3 +1,5 @@
+import csv
+import json
 import os
 import re
 from pathlib import Path
@@ -9,6 +11,10 @@ from monopoly.cli import (
     monopoly,
     pprint_transactions,
 )
+from monopoly.banks import BankDetector
+from monopoly.constants import DETECTION_TEXT_PAGES
+from monopoly.examples.example_bank import ExampleBank
+from monopoly.pipeline import Pipeline
 from monopoly.statements.transaction import Transaction
 
 
@@ -52,6 +58,39 @@ def test_display_report(mock_results, capsys):
     assert "statement2.pdf -- Traceback (most recent call last)" in printed_output
 
 
+def test_display_report_detection_cache(mock_results, capsys):
+    mock_results[0].detection_cache_hit = True
+    report = Report(results=[*mock_results, Result("statement3.pdf", "processed3.csv", detection_cache_hit=False)])
+
+    report.display_report()
+    assert "Detection cache" not in capsys.readouterr().out
+
+    report.display_report(verbose=True)
+    assert "Detection cache: 1 hit(s), 1 miss(es)" in capsys.readouterr().out.split("\n")
+
+
+def test_display_report_safety_check_time(mock_results, capsys):
+    mock_results[0].safety_check_time = 0.0125
+    report = Report(results=mock_results)
+
+    report.display_report()
+    assert "statement1.pdf -> processed1.csv" in capsys.readouterr().out.split("\n")
+
+    report.display_report(verbose=True)
+    assert "statement1.pdf -> processed1.csv (safety check: 12.50ms)" in capsys.readouterr().out.split("\n")
+
+
+def test_display_report_pruned_pages(mock_results, capsys):
+    mock_results[0].pruned_pages = 3
+    report = Report(results=mock_results)
+
+    report.display_report()
+    assert "statement1.pdf -> processed1.csv" in capsys.readouterr().out.split("\n")
+
+    report.display_report(verbose=True)
+    assert "statement1.pdf -> processed1.csv (3 page(s) pruned)" in capsys.readouterr().out.split("\n")
+
+
 def test_help_command(cli_runner: CliRunner) -> None:
     help_results = cli_runner.invoke(monopoly, args="--help")
     assert help_results.exit_code == 0
@@ -129,6 +168,36 @@ def test_monopoly_pprint(cli_runner: CliRunner):
     assert "| 2023-07-18 | CASH REBATE                       |     1.38 |" in output
 
 
+def test_monopoly_limits_detection_text_pages(cli_runner: CliRunner, monkeypatch):
+    monkeypatch.setattr("monopoly.banks.banks", [ExampleBank])
+    detect_bank = BankDetector.detect_bank
+    text_page_limits = []
+
+    def record_text_page_limit(detector, *args, **kwargs):
+        text_page_limits.append(detector.document.text_page_limit)
+        return detect_bank(detector, *args, **kwargs)
+
+    monkeypatch.setattr(BankDetector, "detect_bank", record_text_page_limit)
+    cli_runner.invoke(monopoly, ["src/monopoly/examples/example_statement.pdf", "--pprint", "--single-process"])
+
+    assert text_page_limits == [DETECTION_TEXT_PAGES]
+
+
+@pytest.mark.parametrize("args, expected", [([], False), (["--prune"], True)])
+def test_monopoly_prune_is_opt_in(cli_runner: CliRunner, monkeypatch, args: list[str], expected: bool):
+    monkeypatch.setattr("monopoly.banks.banks", [ExampleBank])
+    prune_pages = []
+
+    def record_prune_pages(pipeline, *args, **kwargs):
+        prune_pages.append(pipeline.handler.parser.prune_pages)
+        raise RuntimeError
+
+    monkeypatch.setattr(Pipeline, "extract", record_prune_pages)
+    cli_runner.invoke(monopoly, ["src/monopoly/examples/example_statement.pdf", "--single-process", *args])
+
+    assert prune_pages == [expected]
+
+
 def test_monopoly_no_pdf(cli_runner: CliRunner):
     with cli_runner.isolated_filesystem():
         with open("file.txt", "w") as f:
@@ -177,3 +246,39 @@ def test_pprint_transactions(capsys, statement):
         "\n"
     )
     assert captured.out == expected_output
+
+
+def test_detect(cli_runner: CliRunner, monkeypatch):
+    monkeypatch.setattr("monopoly.banks.banks", [ExampleBank])
+    result = cli_runner.invoke(
+        monopoly, ["detect", "src/monopoly/examples/example_statement.pdf", "tests/integration/fixtures", "-s"]
+    )
+
+    assert result.exit_code == 0
+    detected = {Path(row["file"]).name: row for row in map(json.loads, result.output.splitlines())}
+    assert detected["example_statement.pdf"] == {
+        "file": str(Path("src/monopoly/examples/example_statement.pdf").resolve()),
+        "bank": "example",
+        "page_count": 4,
+        "encrypted": False,
+        "error": None,
+    }
+    assert detected["4_pages_blank.pdf"]["bank"] is None
+    assert detected["protected.pdf"]["encrypted"] is True
+
+
+def test_detect_csv(cli_runner: CliRunner, monkeypatch):
+    monkeypatch.setattr("monopoly.banks.banks", [ExampleBank])
+    result = cli_runner.invoke(monopoly, ["detect", "src/monopoly/examples/example_statement.pdf", "--format", "csv"])
+
+    assert result.exit_code == 0
+    rows = list(csv.DictReader(result.output.splitlines()))
+    assert rows == [
+        {
+            "file": str(Path("src/monopoly/examples/example_statement.pdf").resolve()),
+            "bank": "example",
+            "page_count": "4",
+            "encrypted": "False",
+            "error": "",
+        }
+    ]
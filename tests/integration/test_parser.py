@@ -1,7 +1,13 @@
 from pathlib import Path
+from unittest.mock import patch
 
+import pdftotext
+from pymupdf import Document
 from pytest import raises
 
+from monopoly.constants import TextBackend
+from monopoly.examples.example_bank import ExampleBank
+from monopoly.handler import StatementHandler
 from monopoly.pdf import MissingOCRError, PdfDocument, PdfParser
 
 fixture_directory = Path(__file__).parent / "fixtures"
@@ -30,3 +36,141 @@ def test_get_pages_invalid_returns_error(parser: PdfParser):
 
     with raises(ValueError, match="bad page number"):
         parser._get_pages()
+
+
+def test_get_page_chunks(parser: PdfParser):
+    parser.page_workers = 4
+    chunks = parser._get_page_chunks(45)
+
+    assert chunks == [(0, 12), (12, 23), (23, 34), (34, 45)]
+
+
+def test_get_page_chunks_small_document(parser: PdfParser):
+    parser.page_workers = 8
+    assert parser._get_page_chunks(15) == [(0, 15)]
+
+
+def test_parallel_extraction_matches_serial(parser: PdfParser):
+    document = Document()
+    for page_num in range(24):
+        page = document.new_page()
+        page.insert_text((72, 72), f"01 OCT  COFFEE SHOP {page_num}   {page_num}.50")
+    pdf_bytes = document.tobytes()
+    parser.document = PdfDocument(file_bytes=pdf_bytes)
+
+    serial_pages = list(parser._extract_text(pdf_bytes))
+
+    parser.page_workers = 2
+    parser.parallel_page_threshold = 20
+    parallel_pages = list(parser._extract_text(pdf_bytes))
+
+    assert len(parallel_pages) == 24
+    assert parallel_pages == serial_pages
+
+
+def test_get_pages_unmodified_document_skips_serialization(parser: PdfParser):
+    parser.document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+
+    with patch.object(PdfDocument, "tobytes") as mock_tobytes:
+        pages = parser._get_pages()
+
+    mock_tobytes.assert_not_called()
+    assert len(pages) == 4
+
+
+def test_get_pages_remembers_garbage_level(parser: PdfParser, monkeypatch):
+    monkeypatch.setattr("monopoly.pdf._producer_garbage_levels", {})
+    pdf_document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    parser.document = pdf_document
+    parser.page_range = slice(0, -1)
+    producer = pdf_document.metadata_identifier.producer
+
+    page_texts = parser._extract_text(pdf_document.tobytes())
+    with patch.object(parser, "_extract_text", side_effect=[pdftotext.Error("bad xref"), page_texts]):
+        parser._get_pages()
+
+    assert parser._get_garbage_levels(producer) == [2, 0]
+
+
+def test_iter_pages_extracts_lazily(parser: PdfParser):
+    parser.document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+
+    first_page = next(parser.iter_pages())
+    assert len(parser._extracted_pages) == 1
+
+    pages = parser.pages
+    assert len(pages) == 4
+    assert pages[0] is first_page
+    assert list(parser.iter_pages()) == pages
+
+
+def test_handler_finds_header_before_extracting_every_page():
+    document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    parser = PdfParser(ExampleBank, document, text_backend=TextBackend.PYMUPDF)
+    handler = StatementHandler(parser)
+    find_header = handler.find_header
+    extracted_page_counts = []
+
+    def record_extracted_pages(configs):
+        found = find_header(configs)
+        extracted_page_counts.append(len(parser._extracted_pages))
+        return found
+
+    with patch.object(handler, "find_header", side_effect=record_extracted_pages):
+        statement = handler.statement
+
+    assert extracted_page_counts == [1]
+    assert len(statement.pages) == 4
+
+
+def test_remove_vertical_text():
+    document = Document()
+    page = document.new_page()
+    page.insert_text((72, 72), "HEALTHY HARVEST CAFE 9.80")
+    page.insert_text((500, 400), "Co Reg No: 123456", rotate=90)
+
+    PdfParser._remove_vertical_text(page)
+
+    assert "HEALTHY HARVEST CAFE" in page.get_text()
+    assert "Co Reg No" not in page.get_text()
+
+
+def test_remove_vertical_text_skips_horizontal_pages():
+    document = Document()
+    page = document.new_page()
+    page.insert_text((72, 72), "HEALTHY HARVEST CAFE 9.80")
+
+    with patch.object(type(page), "apply_redactions") as mock_apply_redactions:
+        PdfParser._remove_vertical_text(page)
+
+    mock_apply_redactions.assert_not_called()
+
+
+def test_pymupdf_backend_reads_open_document(parser: PdfParser):
+    parser.document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    parser.page_range = slice(0, -1)
+    parser.text_backend = TextBackend.PYMUPDF
+
+    with patch.object(PdfParser, "_extract_text") as mock_extract_text:
+        pages = parser._get_pages()
+
+    mock_extract_text.assert_not_called()
+    assert len(pages) == 3
+    assert "STATEMENT DATE" in pages[0].raw_text
+
+
+def test_modify_document_clears_page_texts(parser: PdfParser):
+    parser.document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    assert "STATEMENT DATE" in parser.document.raw_text
+
+    parser.page_bbox = (0, 0, 1, 1)
+    parser._modify_document([0])
+
+    assert "STATEMENT DATE" not in parser.document.raw_text
+
+
+def test_text_backend_defaults_to_pdf_config(parser: PdfParser):
+    assert parser.text_backend == TextBackend.PDFTOTEXT
+
+    override = PdfParser(parser.bank, parser.document, text_backend=TextBackend.PYMUPDF)
+    assert override.text_backend == TextBackend.PYMUPDF
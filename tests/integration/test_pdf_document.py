@@ -96,3 +96,17 @@ def test_plain_text_passwords_raises_error(pdf_document: PdfDocument):
         with patch("monopoly.pdf.PdfPasswords", return_value=mock_pdf_passwords_instance):
             pdf_document = PdfDocument(passwords=None, file_path=fixture_directory / "protected.pdf")
             pdf_document.unlock_document()
+
+
+def test_page_texts_are_cleared_when_pages_change():
+    pdf_document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    page_texts = list(pdf_document.iter_page_texts())
+    assert pdf_document.raw_text == "".join(page_texts)
+
+    pdf_document.select([1, 2])
+    assert list(pdf_document.iter_page_texts()) == page_texts[1:3]
+    assert pdf_document.raw_text == "".join(page_texts[1:3])
+
+    pdf_document.delete_page(0)
+    assert list(pdf_document.iter_page_texts()) == [page_texts[2]]
+    assert pdf_document.raw_text == page_texts[2]
@@ -1,10 +1,12 @@
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
 from monopoly.banks import Dbs
+from monopoly.constants import TextBackend
 from monopoly.examples.example_bank import ExampleBank
-from monopoly.pdf import PdfDocument, PdfParser
+from monopoly.pdf import CompactPdfPage, PdfDocument, PdfParser
 from monopoly.pipeline import Pipeline
 
 
@@ -60,3 +62,48 @@ def test_pipeline_bytes_etl(pdf_file_bytes):
     statement = pipeline.extract(pages)
     transactions = pipeline.transform(statement)
     assert len(transactions) == 53
+
+
+def test_pipeline_with_compact_pages():
+    document = PdfDocument(Path("src/monopoly/examples/example_statement.pdf"))
+    parser = PdfParser(ExampleBank, document, page_cls=CompactPdfPage)
+    pipeline = Pipeline(parser)
+
+    transactions = pipeline.extract().transactions
+    assert all(isinstance(page, CompactPdfPage) for page in parser.pages)
+    assert len(transactions) == 53
+
+
+def test_pipeline_safety_check_time():
+    statement = Mock(transactions=[Mock()], statement_date="2024-01-01", uses_transaction_batch=False)
+    with patch.object(Pipeline, "create_handler", return_value=Mock(statement=statement)):
+        pipeline = Pipeline(Mock())
+    assert pipeline.safety_check_time is None
+
+    pipeline.extract()
+    statement.perform_safety_check.assert_called_once()
+    assert pipeline.safety_check_time > 0
+
+
+def test_pipeline_with_transaction_batch(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    assert ExampleBank.credit.transaction_batch
+
+    results = []
+    for transaction_batch in (False, True):
+        monkeypatch.setattr(ExampleBank.credit, "transaction_batch", transaction_batch)
+        document = PdfDocument(Path("src/monopoly/examples/example_statement.pdf"))
+        pipeline = Pipeline(PdfParser(ExampleBank, document, text_backend=TextBackend.PYMUPDF))
+        statement = pipeline.extract()
+        if transaction_batch:
+            transactions = pipeline.transform_batch(statement)
+        else:
+            transactions = pipeline.transform(statement)
+
+        output_directory = tmp_path / str(transaction_batch)
+        output_directory.mkdir()
+        output_path = pipeline.load(transactions, statement, output_directory, preserve_filename=False)
+        results.append((statement.transactions, output_path.name, output_path.read_text(encoding="utf8")))
+
+    assert results[0] == results[1]
+    assert len(results[1][0]) == 53
@@ -0,0 +1,73 @@
+"""Synthetic statement lines, used to fuzz and benchmark transaction patterns."""
+
+import random
+
+DATES = [
+    "01 Jan",
+    "01 JAN",
+    "1 Jan",
+    "01/02",
+    "01-02",
+    "01.02",
+    "01/02/24",
+    "01/02/2024",
+    "01 Jan 24",
+    "01 Jan 2024",
+    "Jan 01",
+    "Jan 01, 2024",
+    "January 01, 2024",
+]
+DESCRIPTIONS = [
+    "PAYMENT - THANK YOU",
+    "GRAB *FOOD 1234 SINGAPORE SG",
+    "AMAZON.COM*AB12C3 SEATTLE WA",
+    "FAST TRANSFER  OTHR  REF 123456",
+    "Interest Charged",
+    "NETFLIX.COM 866-579-7172 CA",
+    "Balance Brought Forward",
+]
+AMOUNTS = ["1.00", "12.34", "1,234.56", "(12.34)", "12.34 CR", "-99.99", "1,234.56 DR", "1,234,567.89"]
+
+
+def generate_realistic_lines(count: int, seed: int = 0) -> list[str]:
+    """Generate lines shaped like transactions, with one or two dates, and an optional balance."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        dates = rng.sample(DATES, rng.choice((1, 2)))
+        columns = [*dates, rng.choice(DESCRIPTIONS), rng.choice(AMOUNTS)]
+        if rng.random() < 0.5:
+            columns.append(rng.choice(AMOUNTS))
+        gaps = [" " * rng.randint(1, 30) for _ in columns]
+        lines.append(" " * rng.randint(0, 10) + "".join(column + gap for column, gap in zip(columns, gaps)).rstrip())
+    return lines
+
+
+def generate_adversarial_lines(length: int) -> list[str]:
+    """
+    Generate lines that are known to cause heavy backtracking in transaction patterns.
+
+    These resemble badly extracted text, e.g. a date followed by a long run of
+    whitespace, or long runs of numbers without a valid amount at the end.
+    """
+    lines = []
+    for date in ("01 Jan", "01/02", "01/02/2024", "Jan 01", "01 JAN 01 JAN"):
+        padding = " " * (length - len(date))
+        lines.extend(
+            [
+                date + padding,
+                date + padding[:-1] + "x",
+                date + padding[:-5] + " 1.00",
+            ]
+        )
+    lines.extend(
+        [
+            ("01 Jan " + " 1" * length)[:length],
+            ("01 Jan " + " 1,234.56" * length)[:length],
+            ("01 Jan desc " + ",123" * length)[:length],
+            ("01 Jan desc " + "(1.00 " * length)[:length],
+            ("01 Jan " * length)[:length],
+            ("01 Jan " + "word " * length)[:length] + " 12",
+        ]
+    )
+    return lines
@@ -0,0 +1,48 @@
+"""Collects the transaction patterns of every bank, and every pattern that the generic parser can generate."""
+
+import re
+from dataclasses import dataclass
+
+from monopoly.banks import banks
+from monopoly.constants import EntryType
+from monopoly.constants.date import ISO8601
+from monopoly.generic import DatePatternAnalyzer
+from monopoly.generic.patterns import DatePattern
+
+
+@dataclass
+class TransactionPattern:
+    bank: str
+    statement_type: str
+    pattern: re.Pattern
+
+    @property
+    def id(self) -> str:
+        return f"{self.bank}-{self.statement_type}"
+
+
+def get_bank_patterns() -> list[TransactionPattern]:
+    patterns = []
+    for bank in banks:
+        for i, config in enumerate(bank.statement_configs):
+            pattern = getattr(config.transaction_pattern, "regex", config.transaction_pattern)
+            patterns.append(TransactionPattern(bank.name, f"{config.statement_type}-{i}", pattern))
+    return patterns
+
+
+def get_generic_patterns() -> list[TransactionPattern]:
+    """Create the transaction pattern for each date format, number of date columns and statement type."""
+    patterns = []
+    for date_regex in ISO8601:
+        for span_count in (1, 2):
+            for statement_type in (EntryType.DEBIT, EntryType.CREDIT):
+                analyzer = DatePatternAnalyzer.__new__(DatePatternAnalyzer)
+                analyzer.pattern = DatePattern(date_regex)
+                analyzer.spans = [(0, 0)] * span_count
+                analyzer.get_statement_type = lambda statement_type=statement_type: statement_type
+                analyzer.is_transaction_date_first = lambda: True
+                pattern = analyzer.create_transaction_pattern()
+                patterns.append(
+                    TransactionPattern("generic", f"{statement_type}-{date_regex.name.lower()}-{span_count}", pattern)
+                )
+    return patterns
@@ -1,4 +1,5 @@
 import logging
+import os
 from functools import wraps
 
 import pytest
@@ -22,3 +23,9 @@ def skip_if_encrypted(func=None):
         return func(*args, **kwargs)
 
     return wrapper if func else skip_if_encrypted
+
+
+skip_unless_benchmark = pytest.mark.skipif(
+    not os.getenv("MONOPOLY_BENCHMARK"),
+    reason="Benchmarks are only run when MONOPOLY_BENCHMARK is set",
+)
@@ -0,0 +1,296 @@
+"""
+Synthesizes statement pages for a bank from its statement config.
+
+Lines are generated by walking the parse tree of the config's patterns, so that
+every transaction line is matched by the bank's own transaction pattern. Named
+groups such as dates, descriptions and amounts are filled with realistic values
+where the group accepts them, so that parsed transactions can also be transformed.
+"""
+
+import random
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from test_utils.lines import AMOUNTS, DESCRIPTIONS
+
+from monopoly.banks import banks
+from monopoly.config import StatementConfig
+from monopoly.constants import EntryType
+from monopoly.pdf import PdfPage
+from monopoly.statements import BaseStatement, CreditStatement, DebitStatement
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10
+    import sre_constants
+    import sre_parse
+
+DATE_FORMATS = [
+    "%d %b",
+    "%d%b",
+    "%d %B",
+    "%d/%m",
+    "%d-%m",
+    "%d.%m",
+    "%m/%d",
+    "%m-%d",
+    "%b %d",
+    "%b%d",
+    "%b. %d",
+    "%B %d",
+    "%d %b %y",
+    "%d %b %Y",
+    "%d/%m/%y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%d.%m.%y",
+    "%d.%m.%Y",
+    "%m/%d/%y",
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d-%b-%y",
+    "%d %b, %Y",
+]
+# days that are also valid months, so that dates parse regardless of the date order
+DATES = [date(2024, month, day) for month, day in ((1, 5), (3, 12), (6, 1), (9, 9), (11, 3), (12, 10))]
+POLARITIES = ["CR", "DR", "+", "-"]
+CONTINUATION_LINES = ["REF 0012345678", "SINGAPORE SG", "FX RATE 1.3456"]
+NOISE_LINES = [
+    "",
+    "Page 1 of 3",
+    "Please examine this statement immediately",
+    "-" * 80,
+    "Customer Service Hotline: 1800 111 1111",
+    "Important information about your account",
+]
+
+IDENTIFIER_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+CLASS_CANDIDATES = IDENTIFIER_CHARS + "0123456789 .,-/*()&'"
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: str.isdigit,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda char: not char.isdigit(),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+    sre_constants.CATEGORY_WORD: lambda char: char.isalnum() or char == "_",
+    sre_constants.CATEGORY_NOT_WORD: lambda char: not (char.isalnum() or char == "_"),
+}
+MAX_EXTRA_REPEATS = 3
+
+
+def as_pattern(pattern: Any) -> re.Pattern:
+    """Return the `re` pattern of a config pattern, which may be a `RegexEnum` member."""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return re.compile(str(pattern))
+
+
+def get_group_sources(source: str) -> dict[str, str]:
+    """Return the source of each named group in a pattern."""
+    groups = {}
+    stack: list[tuple[str | None, int]] = []
+    in_class = False
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            i += 2 if source.startswith(("[]", "[^"), i) else 1
+            continue
+        elif char == "(":
+            if named := re.match(r"\(\?P<(\w+)>", source[i:]):
+                stack.append((named.group(1), i + named.end()))
+            else:
+                stack.append((None, i + 1))
+        elif char == ")" and stack:
+            name, start = stack.pop()
+            if name:
+                groups[name] = source[start:i]
+        i += 1
+    return groups
+
+
+def get_value_pool(name: str, date_format: str) -> list[str]:
+    if "date" in name:
+        formats = [date_format] if date_format else DATE_FORMATS
+        return [value.strftime(fmt) for fmt in formats for value in DATES] + [
+            value.strftime(fmt).upper() for fmt in DATE_FORMATS for value in DATES
+        ]
+    if name in {"amount", "balance"}:
+        return AMOUNTS
+    if name == "description":
+        return DESCRIPTIONS
+    if name == "polarity":
+        return POLARITIES
+    return []
+
+
+class LineGenerator:
+    """Generates lines that match a pattern, filling named groups with realistic values where possible."""
+
+    def __init__(self, pattern: re.Pattern, rng: random.Random, date_format: str = ""):
+        self.pattern = pattern
+        self.rng = rng
+        self.tree = sre_parse.parse(pattern.pattern, pattern.flags)
+        self.group_names = {index: name for name, index in pattern.groupindex.items()}
+        self.values: dict[str, list[str]] = {}
+        for name, source in get_group_sources(pattern.pattern).items():
+            try:
+                group_pattern = re.compile(source, pattern.flags)
+            except re.error:
+                continue
+            pool = get_value_pool(name, date_format)
+            self.values[name] = [value for value in pool if group_pattern.fullmatch(value)]
+        self.emitted: dict[int, str] = {}
+
+    def generate(self, attempts: int = 500, required_groups: tuple[str, ...] = ()) -> str | None:
+        """Generate a line that matches the pattern, and captures each of the required groups that it has."""
+        required_groups = tuple(name for name in required_groups if name in self.pattern.groupindex)
+        for _ in range(attempts):
+            self.emitted = {}
+            line = self._emit(self.tree)
+            if (match := self.pattern.search(line)) and all(match.group(name) for name in required_groups):
+                return line
+        return None
+
+    def _emit(self, items) -> str:
+        return "".join(self._emit_item(op, av) for op, av in items)
+
+    def _emit_item(self, op, av) -> str:
+        match op:
+            case sre_constants.LITERAL:
+                return chr(av)
+            case sre_constants.NOT_LITERAL:
+                return "x" if chr(av) != "x" else "y"
+            case sre_constants.ANY:
+                # wildcards usually stand in for the gaps between columns
+                return " "
+            case sre_constants.IN:
+                return self._emit_class(av)
+            case sre_constants.BRANCH:
+                return self._emit(self.rng.choice(av[1]))
+            case sre_constants.SUBPATTERN:
+                group, _, _, items = av
+                if values := self.values.get(self.group_names.get(group, "")):
+                    value = self.rng.choice(values)
+                else:
+                    value = self._emit(items)
+                if group:
+                    self.emitted[group] = value
+                return value
+            case sre_constants.MAX_REPEAT | sre_constants.MIN_REPEAT | sre_constants.POSSESSIVE_REPEAT:
+                low, high, items = av
+                count = self.rng.randint(low, min(high, low + MAX_EXTRA_REPEATS))
+                return "".join(self._emit(items) for _ in range(count))
+            case sre_constants.GROUPREF:
+                return self.emitted.get(av, "")
+            case sre_constants.GROUPREF_EXISTS:
+                group, yes, no = av
+                return self._emit(yes if group in self.emitted else no or [])
+            case sre_constants.ATOMIC_GROUP:
+                return self._emit(av)
+        # anchors and lookarounds do not consume characters
+        return ""
+
+    def _emit_class(self, items) -> str:
+        negate = bool(items) and items[0][0] == sre_constants.NEGATE
+        candidates = [char for char in CLASS_CANDIDATES if self._in_class(char, items) != negate]
+        return self.rng.choice(candidates) if candidates else ""
+
+    @staticmethod
+    def _in_class(char: str, items) -> bool:
+        for op, av in items:
+            if op == sre_constants.LITERAL and char == chr(av):
+                return True
+            if op == sre_constants.RANGE and av[0] <= ord(char) <= av[1]:
+                return True
+            if op == sre_constants.CATEGORY and CATEGORIES.get(av, lambda _: False)(char):
+                return True
+        return False
+
+
+def get_continuation_line(transaction_pattern: re.Pattern, previous_line: str, rng: random.Random) -> str:
+    """Create a line that continues the description of the previous line, if it is a transaction."""
+    indent = 0
+    if (match := transaction_pattern.search(previous_line)) and "description" in transaction_pattern.groupindex:
+        indent = match.start("description")
+    return " " * indent + rng.choice(CONTINUATION_LINES)
+
+
+@dataclass
+class SyntheticStatement:
+    pages: list[PdfPage]
+    header: str
+    line_count: int
+    transaction_count: int
+
+
+def get_bank_configs() -> dict[str, StatementConfig]:
+    """Return the statement configs of every bank, keyed by an id such as `dbs-debit-0`."""
+    return {
+        f"{bank.name}-{config.statement_type}-{i}": config
+        for bank in banks
+        for i, config in enumerate(bank.statement_configs)
+    }
+
+
+def create_statement(config: StatementConfig, synthetic: SyntheticStatement) -> BaseStatement:
+    """Create a debit or credit statement from synthetic pages, depending on the config's statement type."""
+    statement_cls = DebitStatement if config.statement_type == EntryType.DEBIT else CreditStatement
+    return statement_cls(synthetic.pages, "synthetic", config, synthetic.header)
+
+
+def synthesize_statement(
+    config: StatementConfig, page_count: int = 5, lines_per_page: int = 60, seed: int = 0
+) -> SyntheticStatement:
+    """
+    Create pages with a header, followed by transaction lines, multiline descriptions and noise.
+
+    Raises a ValueError if no lines can be generated for the config's transaction or header pattern.
+    """
+    rng = random.Random(seed)
+    transaction_pattern = as_pattern(config.transaction_pattern)
+    header_pattern = as_pattern(config.header_pattern)
+
+    header = LineGenerator(header_pattern, rng).generate()
+    transactions = LineGenerator(transaction_pattern, rng, config.transaction_date_format)
+    if header is None or transactions.generate() is None:
+        msg = f"Unable to generate lines for {transaction_pattern.pattern!r}"
+        raise ValueError(msg)
+
+    noise_lines = [line for line in NOISE_LINES + CONTINUATION_LINES if not transaction_pattern.search(line)]
+    pages = []
+    transaction_count = 0
+    for page_number in range(page_count):
+        lines = [rng.choice(noise_lines), header]
+        if page_number == 0:
+            # transactions without a date take the date of the previous transaction
+            lines.append(transactions.generate(required_groups=("transaction_date",)) or "")
+            transaction_count += 1
+        while len(lines) < lines_per_page:
+            roll = rng.random()
+            if roll < 0.7:
+                line = transactions.generate()
+                transaction_count += line is not None
+                lines.append(line or "")
+            elif roll < 0.85:
+                lines.append(get_continuation_line(transaction_pattern, lines[-1], rng))
+            else:
+                lines.append(rng.choice(noise_lines))
+        pages.append(PdfPage("\n".join(lines)))
+    match = header_pattern.search(header)
+    return SyntheticStatement(
+        pages=pages,
+        header=match.group().lower() if match else header,
+        line_count=page_count * lines_per_page,
+        transaction_count=transaction_count,
+    )
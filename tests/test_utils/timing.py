@@ -0,0 +1,15 @@
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+RUNS = 5
+
+
+def best_time(func: Callable[[], Any], runs: int = RUNS) -> float:
+    """Return the best time in seconds over several runs of `func`, to reduce noise."""
+    timings = []
+    for _ in range(runs):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return min(timings)
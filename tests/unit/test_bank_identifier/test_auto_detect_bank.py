@@ -4,7 +4,7 @@ from unittest.mock import PropertyMock, patch
 import pytest
 
 from monopoly.banks.base import BankBase
-from monopoly.banks.detector import BankDetector
+from monopoly.banks.detector import BankDetector, TextMatcher
 from monopoly.config import StatementConfig
 from monopoly.constants import EntryType
 from monopoly.identifiers import MetadataIdentifier, TextIdentifier
@@ -93,9 +93,9 @@ def test_detect_bank_not_identified(metadata_analyzer: BankDetector):
     assert not metadata_analyzer.detect_bank(mock_banks_list)
 
 
-@patch.object(PdfDocument, "raw_text", new_callable=PropertyMock)
-def test_detect_bank_with_text_identifier(mock_raw_text, metadata_analyzer: BankDetector):
-    mock_raw_text.return_value = "specific_string, other_specific_string"
+@patch.object(PdfDocument, "iter_page_texts")
+def test_detect_bank_with_text_identifier(mock_page_texts, metadata_analyzer: BankDetector):
+    mock_page_texts.return_value = ["specific_string, other_specific_string"]
     metadata_analyzer.metadata_identifier = MetadataIdentifier(creator="foo", producer="bar")
 
     mock_banks_list = [MockBankTwo, MockBankWithMultipleTextIdentifier]
@@ -104,9 +104,9 @@ def test_detect_bank_with_text_identifier(mock_raw_text, metadata_analyzer: Bank
     assert bank.__name__ == MockBankWithMultipleTextIdentifier.__name__
 
 
-@patch.object(PdfDocument, "raw_text", new_callable=PropertyMock)
-def test_detect_bank_with_not_matching_text_identifier(mock_raw_text, monkeypatch, metadata_analyzer: BankDetector):
-    mock_raw_text.return_value = "not_a_match"
+@patch.object(PdfDocument, "iter_page_texts")
+def test_detect_bank_with_not_matching_text_identifier(mock_page_texts, monkeypatch, metadata_analyzer: BankDetector):
+    mock_page_texts.return_value = ["not_a_match"]
     metadata_analyzer.metadata_identifier = MetadataIdentifier(creator="foo", producer="bar")
 
     mock_banks_list = [MockBankTwo, MockBankWithMultipleTextIdentifier]
@@ -115,9 +115,9 @@ def test_detect_bank_with_not_matching_text_identifier(mock_raw_text, monkeypatc
     assert not metadata_analyzer.detect_bank(mock_banks_list)
 
 
-@patch.object(PdfDocument, "raw_text", new_callable=PropertyMock)
-def test_detect_bank_with_only_text_identifier(mock_raw_text, metadata_analyzer: BankDetector):
-    mock_raw_text.return_value = "foo baz bar"
+@patch.object(PdfDocument, "iter_page_texts")
+def test_detect_bank_with_only_text_identifier(mock_page_texts, metadata_analyzer: BankDetector):
+    mock_page_texts.return_value = ["foo baz bar"]
     metadata_analyzer.metadata_identifier = MetadataIdentifier(creator="foo", producer="bar")
 
     mock_banks_list = [
@@ -127,3 +127,110 @@ def test_detect_bank_with_only_text_identifier(mock_raw_text, metadata_analyzer:
 
     bank = metadata_analyzer.detect_bank(mock_banks_list)
     assert bank.__name__ == MockBankWithOnlyTextIdentifier.__name__
+
+
+@patch.object(PdfDocument, "iter_page_texts")
+def test_detect_bank_checks_metadata_before_text(mock_page_texts, metadata_analyzer: BankDetector):
+    metadata_analyzer.metadata_identifier = MetadataIdentifier(creator="asdf", producer="qwerty")
+
+    assert not metadata_analyzer.detect_bank([MockBankWithMultipleTextIdentifier])
+    mock_page_texts.assert_not_called()
+
+
+def test_text_identifier_stops_at_first_match(metadata_analyzer: BankDetector):
+    document = metadata_analyzer.document
+    first_page_text = document[0].get_text()
+    identifier = TextIdentifier(first_page_text.split()[0])
+
+    assert identifier.matches(metadata_analyzer)
+    assert len(document._page_texts) == 1
+    assert "raw_text" not in document.__dict__
+
+
+@patch.object(PdfDocument, "iter_page_texts")
+def test_text_identifier_matches_across_pages(mock_page_texts, metadata_analyzer: BankDetector):
+    mock_page_texts.return_value = ["", "foo specific_", "string bar"]
+
+    assert TextIdentifier("specific_string").matches(metadata_analyzer)
+    assert not TextIdentifier("other_specific_string").matches(metadata_analyzer)
+
+
+def linear_detect_bank(detector: BankDetector, banks):
+    for bank in banks:
+        if any(detector.identifiers_match(group) for group in bank.identifiers):
+            return bank
+    return None
+
+
+def get_group_metadata(banks):
+    for bank in banks:
+        for group in bank.identifiers:
+            for identifier in group:
+                if isinstance(identifier, MetadataIdentifier):
+                    yield identifier
+
+
+@patch.object(PdfDocument, "iter_page_texts")
+def test_indexed_detection_matches_linear_scan(mock_page_texts, pdf_document):
+    from monopoly.banks import banks
+
+    page_texts = [
+        [],
+        ["Chase", "HSBC", "OCBC"],
+        [
+            identifier.text
+            for bank in banks
+            for group in bank.identifiers
+            for identifier in group
+            if isinstance(identifier, TextIdentifier)
+        ],
+    ]
+    metadata = [*get_group_metadata(banks), MetadataIdentifier(), MetadataIdentifier(creator="foo", producer="bar")]
+
+    for texts in page_texts:
+        mock_page_texts.return_value = texts
+        for metadata_identifier in metadata:
+            linear_detector = BankDetector(pdf_document)
+            linear_detector.metadata_identifier = metadata_identifier
+            indexed_detector = BankDetector(pdf_document)
+            indexed_detector.metadata_identifier = metadata_identifier
+
+            expected = linear_detect_bank(linear_detector, banks)
+            assert indexed_detector.detect_bank(banks) is expected
+
+
+def test_detection_index_skips_non_candidates(metadata_analyzer: BankDetector):
+    metadata_analyzer.metadata_identifier = MetadataIdentifier(
+        creator="Adobe Acrobat 23.3", producer="Adobe Acrobat Pro (64-bit)"
+    )
+
+    with patch.object(BankDetector, "identifiers_match", autospec=True, return_value=True) as mock_match:
+        bank = metadata_analyzer.detect_bank([MockBankOne, MockBankThree, MockBankTwo])
+
+    assert bank is MockBankTwo
+    mock_match.assert_called_once_with(metadata_analyzer, MockBankTwo.identifiers[0])
+
+
+def test_text_matcher_finds_overlapping_texts():
+    matcher = TextMatcher(["Scotia", "Scotiabank", "bank", "DBS", "OCBC", ""])
+    page_texts = ["Visit www.scotiabank.com", "", "Scotiabank DB", "S OCB"]
+
+    assert list(matcher.iter_matches(page_texts)) == [
+        {"bank"},
+        {"Scotia", "Scotiabank", "bank"},
+        # the end of the previous page is scanned again
+        {"bank", "DBS"},
+    ]
+    assert "" not in matcher
+
+
+@patch.object(PdfDocument, "iter_page_texts")
+def test_text_identifiers_scan_document_once(mock_page_texts, metadata_analyzer: BankDetector):
+    mock_page_texts.return_value = iter(["foo", "bar", "baz"])
+    metadata_analyzer.metadata_identifier = MetadataIdentifier(creator="foo", producer="bar")
+
+    bank = metadata_analyzer.detect_bank([MockBankWithMultipleTextIdentifier, MockBankWithOnlyTextIdentifier])
+
+    assert bank is MockBankWithOnlyTextIdentifier
+    assert metadata_analyzer.found_texts == {"foo", "bar", "baz"}
+    mock_page_texts.assert_called_once()
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+from monopoly.banks import banks
+from monopoly.banks.registry import BUILTIN_BANKS, ENTRY_POINT_GROUP, load_banks
+from monopoly.examples.example_bank import ExampleBank
+
+
+def get_modules_after_import(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(output.splitlines())
+
+
+def test_import_does_not_load_banks():
+    modules = get_modules_after_import("import monopoly.banks")
+
+    assert not {module for module in modules if module.startswith(tuple(BUILTIN_BANKS.values()))}
+    assert not {"monopoly.pdf", "pymupdf", "pdftotext", "pydantic"} & modules
+
+
+def test_bank_is_imported_on_access():
+    modules = get_modules_after_import("from monopoly.banks import Dbs")
+
+    assert "monopoly.banks.dbs" in modules
+    assert "monopoly.banks.ocbc" not in modules
+
+
+def test_banks_are_in_registry_order():
+    assert [bank.__name__ for bank in banks] == list(BUILTIN_BANKS)
+
+
+def test_load_entry_point_banks():
+    entry_points = [
+        EntryPoint(name="example", value="monopoly.examples.example_bank:ExampleBank", group=ENTRY_POINT_GROUP),
+        EntryPoint(name="not_a_bank", value="monopoly.config:PdfConfig", group=ENTRY_POINT_GROUP),
+        EntryPoint(name="missing", value="missing.module:MissingBank", group=ENTRY_POINT_GROUP),
+    ]
+
+    with patch("importlib.metadata.entry_points", return_value=entry_points) as mock_entry_points:
+        loaded_banks = load_banks()
+
+    mock_entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+    assert loaded_banks == [*banks, ExampleBank]
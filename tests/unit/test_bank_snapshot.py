@@ -0,0 +1,56 @@
+import json
+import subprocess
+import sys
+
+from monopoly.banks import banks
+from monopoly.banks.detector import get_detection_index
+from monopoly.banks.snapshot import SNAPSHOT_PATH, build_builtin_snapshot, load_snapshot
+
+
+def test_snapshot_is_up_to_date():
+    with open(SNAPSHOT_PATH, encoding="utf8") as file:
+        snapshot = json.load(file)
+
+    assert snapshot == build_builtin_snapshot(), "run `python -m monopoly.banks.snapshot` to rebuild the snapshot"
+
+
+def test_snapshot_entries_match_banks():
+    entries = load_snapshot()
+
+    assert [(entry.__name__, entry.name, entry.identifiers) for entry in entries] == [
+        (bank.__name__, bank.name, bank.identifiers) for bank in banks
+    ]
+    assert all(entry.load() is bank for entry, bank in zip(entries, banks))
+    assert get_detection_index(entries).fingerprint == get_detection_index(tuple(banks)).fingerprint
+
+
+def test_load_snapshot_ignores_invalid_files(tmp_path):
+    outdated_path = tmp_path / "outdated.json"
+    outdated_path.write_text(json.dumps({"version": 0, "banks": []}))
+
+    assert load_snapshot(tmp_path / "missing.json") is None
+    assert load_snapshot(outdated_path) is None
+
+
+def test_detection_only_imports_detected_bank():
+    code = """
+import sys
+from monopoly.banks import BankDetector
+from monopoly.banks.registry import get_detection_banks, load_detected_bank
+from monopoly.identifiers import MetadataIdentifier
+from monopoly.pdf import PdfDocument
+
+detector = BankDetector(PdfDocument(file_path="src/monopoly/examples/example_statement.pdf"))
+detector.metadata_identifier = MetadataIdentifier(
+    format="PDF 1.7", title="SLK_Vermoegensinfo_Group", creator="Designer", producer="PDFlib+PDI"
+)
+bank = load_detected_bank(detector.detect_bank(get_detection_banks()))
+print(bank.__name__)
+print("\\n".join(module for module in sys.modules if module.startswith("monopoly.banks.")))
+"""
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    bank_name, *modules = output.splitlines()
+
+    assert bank_name == "ZurcherKantonalBank"
+    assert "monopoly.banks.zkb" in modules
+    assert "monopoly.banks.dbs" not in modules
@@ -0,0 +1,168 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import monopoly
+from monopoly.banks import banks
+from monopoly.banks.base import BankBase
+from monopoly.banks.detector import BankDetector, get_detection_index
+from monopoly.cache import DetectionCache, PageCache
+from monopoly.examples.example_bank import ExampleBank
+from monopoly.identifiers import MetadataIdentifier
+from monopoly.pdf import PdfDocument, PdfParser
+
+
+class MetadataBank(BankBase):
+    name = "metadata"
+    statement_configs = ExampleBank.statement_configs
+    identifiers = [[MetadataIdentifier(creator="Adobe Acrobat 23.3")]]
+
+
+@pytest.fixture
+def page_cache(tmp_path):
+    return PageCache(tmp_path, max_size=1024)
+
+
+def test_get_missing_key(page_cache: PageCache):
+    assert page_cache.get("missing") is None
+
+
+def test_set_and_get(page_cache: PageCache):
+    page_cache.set("foo", ["page 1", "page 2"])
+    assert page_cache.get("foo") == ["page 1", "page 2"]
+
+
+def test_corrupt_entry_is_ignored(page_cache: PageCache):
+    page_cache.set("foo", ["page 1"])
+    (page_cache.directory / "foo.json").write_text("{not json")
+    assert page_cache.get("foo") is None
+
+
+def test_evicts_least_recently_used(page_cache: PageCache):
+    value = ["x" * 400]
+    for i, key in enumerate(["a", "b"]):
+        page_cache.set(key, value)
+        os.utime(page_cache.directory / f"{key}.json", (i, i))
+
+    # reading "a" makes "b" the least recently used entry
+    assert page_cache.get("a") == value
+    page_cache.set("c", value)
+
+    assert page_cache.get("a") == value
+    assert page_cache.get("b") is None
+    assert page_cache.get("c") == value
+
+
+def test_scans_directory_only_to_evict(page_cache: PageCache):
+    with patch("monopoly.cache.os.scandir", wraps=os.scandir) as scandir:
+        for key in ["a", "b", "a", "b"]:
+            page_cache.set(key, ["x" * 400])
+        assert scandir.call_count == 1
+
+        page_cache.set("c", ["x" * 400])
+        assert scandir.call_count == 2
+
+    assert page_cache.get("a") is None
+    assert page_cache.get("b") == page_cache.get("c") == ["x" * 400]
+
+
+def test_clear(page_cache: PageCache):
+    page_cache.set("foo", ["page 1"])
+    page_cache.clear()
+    assert page_cache.get("foo") is None
+
+
+def test_make_key_depends_on_config():
+    key = PageCache.make_key(b"pdf", slice(None), None, False, None)
+
+    assert key == PageCache.make_key(b"pdf", slice(None), None, False, None)
+    assert key != PageCache.make_key(b"other pdf", slice(None), None, False, None)
+    assert key != PageCache.make_key(b"pdf", slice(0, 1), None, False, None)
+    assert key != PageCache.make_key(b"pdf", slice(None), (0, 0, 100, 100), False, None)
+    assert key != PageCache.make_key(b"pdf", slice(None), None, True, None)
+    assert key != PageCache.make_key(b"pdf", slice(None), None, False, "gemini")
+
+
+def test_make_key_depends_on_version(monkeypatch):
+    key = PageCache.make_key(b"pdf", slice(None), None, False, None)
+    monkeypatch.setattr(monopoly, "__version__", "0.0.0")
+
+    assert key != PageCache.make_key(b"pdf", slice(None), None, False, None)
+
+
+def test_parser_reuses_cached_pages(tmp_path):
+    document = PdfDocument(file_path="src/monopoly/examples/example_statement.pdf")
+    cache = PageCache(tmp_path)
+    expected = [page.raw_text for page in PdfParser(ExampleBank, document, cache=cache).pages]
+
+    with patch.object(PdfParser, "_iter_pages") as mock_iter_pages:
+        parser = PdfParser(ExampleBank, document, cache=cache)
+        assert [page.raw_text for page in parser.pages] == expected
+        mock_iter_pages.assert_not_called()
+
+
+@pytest.fixture
+def detection_cache(tmp_path):
+    return DetectionCache(tmp_path)
+
+
+def test_detection_cache_stores_metadata_only_results(pdf_document, detection_cache: DetectionCache):
+    detector = BankDetector(pdf_document)
+    assert detector.detect_bank([MetadataBank], cache=detection_cache) is MetadataBank
+    assert detector.cache_hit is False
+
+    detector = BankDetector(pdf_document)
+    with patch.object(BankDetector, "identifiers_match") as mock_identifiers_match:
+        assert detector.detect_bank([MetadataBank], cache=detection_cache) is MetadataBank
+        mock_identifiers_match.assert_not_called()
+    assert detector.cache_hit is True
+
+
+def test_detection_cache_checks_earlier_text_groups(pdf_document, detection_cache: DetectionCache):
+    # a document with the same metadata, but without the text of the earlier bank
+    with patch.object(PdfDocument, "iter_page_texts", side_effect=lambda: iter(["no identifiers here"])):
+        detector = BankDetector(pdf_document)
+        assert detector.detect_bank([ExampleBank, MetadataBank], cache=detection_cache) is MetadataBank
+        assert detector.cache_hit is False
+
+    uncached = BankDetector(pdf_document).detect_bank([ExampleBank, MetadataBank])
+    detector = BankDetector(pdf_document)
+    assert detector.detect_bank([ExampleBank, MetadataBank], cache=detection_cache) is uncached is ExampleBank
+    assert detector.cache_hit is True
+
+
+def test_detection_cache_key_depends_on_identifiers(pdf_document):
+    metadata = {"creator": "Adobe Acrobat 23.3"}
+    key = DetectionCache.make_key(get_detection_index((MetadataBank,)).fingerprint, metadata)
+
+    assert key == DetectionCache.make_key(get_detection_index((MetadataBank,)).fingerprint, metadata)
+    assert key != DetectionCache.make_key(get_detection_index((MetadataBank,)).fingerprint, {"creator": "other"})
+    assert key != DetectionCache.make_key(get_detection_index((MetadataBank, ExampleBank)).fingerprint, metadata)
+
+    class ChangedMetadataBank(BankBase):
+        name = "metadata"
+        statement_configs = ExampleBank.statement_configs
+        identifiers = [[MetadataIdentifier(creator="Adobe Acrobat")]]
+
+    ChangedMetadataBank.__qualname__ = MetadataBank.__qualname__
+    ChangedMetadataBank.__module__ = MetadataBank.__module__
+    assert key != DetectionCache.make_key(get_detection_index((ChangedMetadataBank,)).fingerprint, metadata)
+
+
+metadata_only_groups = {
+    f"{bank.__name__}-{i}": (bank, group[0])
+    for bank in banks
+    for i, group in enumerate(bank.identifiers)
+    if all(isinstance(identifier, MetadataIdentifier) for identifier in group)
+}
+
+
+@pytest.mark.parametrize(("bank", "metadata"), metadata_only_groups.values(), ids=metadata_only_groups.keys())
+def test_detection_cache_stores_metadata_only_results_for_banks(pdf_document, detection_cache, bank, metadata):
+    with patch.object(PdfDocument, "iter_page_texts", side_effect=lambda: iter(["no identifiers here"])):
+        for cache_hit in (False, True):
+            detector = BankDetector(pdf_document)
+            detector.metadata_identifier = metadata
+            assert detector.detect_bank(banks, cache=detection_cache) is bank
+            assert detector.cache_hit is cache_hit
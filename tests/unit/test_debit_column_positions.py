@@ -0,0 +1,60 @@
+import re
+from unittest.mock import patch
+
+import pytest
+
+from monopoly.config import StatementConfig
+from monopoly.constants import EntryType
+from monopoly.pdf import PdfPage
+from monopoly.statements import DebitStatement
+from monopoly.statements.debit_statement import ColumnPositions
+
+pages = [
+    PdfPage("DATE   DESCRIPTION   WITHDRAWAL   DEPOSIT\n01/10  COFFEE        4.50"),
+    PdfPage("Terms and conditions\nDATE   DESCRIPTION        WITHDRAWAL   DEPOSIT"),
+    PdfPage("Terms and conditions"),
+]
+
+
+@pytest.fixture
+def config():
+    return StatementConfig(
+        statement_type=EntryType.DEBIT,
+        transaction_pattern=re.compile(r"(?P<description>\w+)\s+(?P<amount>\d+\.\d{2})"),
+        statement_date_pattern=re.compile(""),
+        header_pattern=re.compile("DATE.*DESCRIPTION"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (
+            "date   description   withdrawal   deposit",
+            [ColumnPositions(31, 41), ColumnPositions(36, 46), ColumnPositions(-1, -1)],
+        ),
+        (
+            "date   description   withdrawal",
+            [ColumnPositions(31, False), ColumnPositions(36, False), ColumnPositions(-1, False)],
+        ),
+        ("date   description", [ColumnPositions(False, False)] * 3),
+    ],
+)
+def test_get_column_positions(config, header, expected):
+    statement = DebitStatement(pages, "test", config, header)
+
+    assert [statement.get_column_positions(page_number) for page_number in range(len(pages))] == expected
+    assert statement.get_withdrawal_pos(1) == expected[1].withdrawal
+    assert statement.get_deposit_pos(1) == expected[1].deposit
+
+
+def test_header_lines_found_once_per_page(config):
+    statement = DebitStatement(pages, "test", config, "date   description   withdrawal   deposit")
+
+    with patch.object(DebitStatement, "get_header_lines", wraps=statement.get_header_lines) as get_header_lines:
+        for _ in range(3):
+            statement.get_withdrawal_pos(0)
+            statement.get_deposit_pos(0)
+        statement.get_deposit_pos(1)
+
+    assert [call.args for call in get_header_lines.call_args_list] == [(0,), (1,)]
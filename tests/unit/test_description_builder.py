@@ -0,0 +1,57 @@
+import re
+from unittest.mock import Mock, patch
+
+import pytest
+
+from monopoly.config import MultilineConfig
+from monopoly.statements.base import DescriptionBuilder, LineFeatures, MatchContext
+
+pattern = re.compile(r"(?P<transaction_date>\d{2}/\d{2})\s+(?P<description>.*?)\s+(?P<amount>\d+\.\d{2})$")
+lines = [
+    "01/02     COFFEE                 1.00",
+    "          SINGAPORE",
+    "02/02     TEA                    2.00",
+    "          REF 123",
+    "                                      SG",
+    "03/02     CAKE                   3.00",
+    "          Total                                       6.00",
+    "",
+    "          THANK YOU",
+]
+config = MultilineConfig(multiline_descriptions=True, description_margin=3)
+
+
+def build(idx: int, transaction_lines: set[int] | None = None, line_pattern: re.Pattern = pattern) -> str:
+    description = pattern.search(lines[idx]).group("description")
+    context = MatchContext(lines[idx], lines, idx, description, config, transaction_lines)
+    return DescriptionBuilder(context, line_pattern).build()
+
+
+@pytest.mark.parametrize("transaction_lines", [None, {0, 2, 5}])
+def test_build_multiline_descriptions(transaction_lines):
+    descriptions = [build(idx, transaction_lines) for idx in (0, 2, 5)]
+    assert descriptions == ["COFFEE SINGAPORE", "TEA REF 123", "CAKE"]
+
+
+def test_build_with_known_transaction_lines():
+    line_pattern = Mock(spec=re.Pattern)
+
+    assert build(0, {0, 2, 5}, line_pattern) == "COFFEE SINGAPORE"
+    line_pattern.search.assert_not_called()
+
+
+def test_line_features_are_shared_across_a_page():
+    transaction_lines = {0, 2, 5}
+    line_features = LineFeatures(lines)
+    descriptions = []
+    for idx in sorted(transaction_lines):
+        description = pattern.search(lines[idx]).group("description")
+        context = MatchContext(lines[idx], lines, idx, description, config, transaction_lines, line_features)
+        descriptions.append(DescriptionBuilder(context, pattern).build())
+
+    assert descriptions == ["COFFEE SINGAPORE", "TEA REF 123", "CAKE"]
+    assert line_features.start_pos(7) == -1
+    assert line_features.spans(6) == (15, 54)
+    with patch.object(LineFeatures, "WORDS_PATTERN") as words_pattern:
+        assert line_features.spans(6) == (15, 54)
+    words_pattern.search.assert_not_called()
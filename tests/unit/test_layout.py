@@ -0,0 +1,30 @@
+from pymupdf import Document
+
+from monopoly.layout import get_layout_text
+
+
+def test_get_layout_text_preserves_columns():
+    document = Document()
+    page = document.new_page()
+    page.insert_text((72, 72), "01 OCT")
+    page.insert_text((200, 72), "COFFEE SHOP")
+    page.insert_text((400, 72), "4.50")
+    page.insert_text((72, 90), "02 OCT")
+    page.insert_text((200, 90), "BAKERY")
+    page.insert_text((400, 90), "12.00")
+
+    lines = get_layout_text(page).splitlines()
+
+    assert [line.split() for line in lines] == [
+        ["01", "OCT", "COFFEE", "SHOP", "4.50"],
+        ["02", "OCT", "BAKERY", "12.00"],
+    ]
+    assert lines[0].index("COFFEE") == lines[1].index("BAKERY")
+    assert lines[0].index("4.50") == lines[1].index("12.00")
+
+
+def test_get_layout_text_empty_page():
+    document = Document()
+    page = document.new_page()
+
+    assert get_layout_text(page) == ""
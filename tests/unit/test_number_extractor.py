@@ -3,188 +3,124 @@
 import pytest
 
 from monopoly.pdf import PdfPage
-from monopoly.statements.number_extractor import NumberExtractor
+from monopoly.statements.number_extractor import DECIMAL_PATTERN, CentIndex, NumberExtractor, to_cents
 
 
-class TestNumberExtractorGetDecimalNumbers:
-    """Tests for NumberExtractor._get_decimal_numbers() method."""
-
-    def test_extracts_decimal_numbers(self):
-        """Test basic decimal number extraction."""
-        lines = [
-            "These are some sample lines 123.45 and 67.89",
-            "Another line with a decimal number 0.56 but not here 123",
-            "No decimals in this line 45, maybe here 10.0 or not",
-        ]
-        extractor = NumberExtractor(pages=[])
-
-        result = extractor._get_decimal_numbers(lines)
-
-        assert result == {123.45, 67.89, 0.56, 10.0}
-
-    def test_handles_comma_formatted_numbers(self):
-        """Test extraction of comma-formatted numbers."""
-        lines = ["Total amount: 1,234.56", "Another: 10,000.00"]
-        extractor = NumberExtractor(pages=[])
-
-        result = extractor._get_decimal_numbers(lines)
-
-        assert 1234.56 in result
-        assert 10000.00 in result
+class TestNumberExtractorPatterns:
+    """Tests for NumberExtractor regex pattern properties."""
 
-    def test_ignores_integers(self):
-        """Test that plain integers without decimals are ignored."""
-        lines = ["Integer only: 100", "Another integer: 50"]
+    def test_number_pattern_matches_digits_and_separators(self):
+        """Test that number pattern matches expected formats."""
         extractor = NumberExtractor(pages=[])
+        pattern = extractor._number_pattern
 
-        result = extractor._get_decimal_numbers(lines)
-
-        assert result == set()
-
-    def test_handles_empty_lines(self):
-        """Test handling of empty input."""
-        extractor = NumberExtractor(pages=[])
+        assert pattern.search("123.45")
+        assert pattern.search("1,234.56")
+        assert pattern.search("100")
 
-        result = extractor._get_decimal_numbers([])
+    def test_decimal_pattern_requires_decimal_point(self):
+        """Test that decimal pattern requires decimal point at end."""
+        pattern = DECIMAL_PATTERN
 
-        assert result == set()
+        assert pattern.match("123.45")
+        assert pattern.match("0.5")
+        assert not pattern.match("123")
+        assert not pattern.match("123.45.67")
 
-    def test_extracts_multiple_numbers_per_line(self):
-        """Test extraction of multiple numbers on the same line."""
-        lines = ["Transaction: 50.00 Balance: 1,500.75 Fee: 2.50"]
+    def test_subtotal_pattern_matches_subtotal_lines(self):
+        """Test that subtotal pattern matches 'sub total' lines."""
         extractor = NumberExtractor(pages=[])
+        pattern = extractor._subtotal_pattern
 
-        result = extractor._get_decimal_numbers(lines)
-
-        assert result == {50.00, 1500.75, 2.50}
-
-
-class TestNumberExtractorGetSubtotalSum:
-    """Tests for NumberExtractor._get_subtotal_sum() method."""
+        assert pattern.search("sub total 100.00")
+        assert pattern.search("SUB TOTAL 1,234.56")
+        assert pattern.search("Sub Total amount 50.25")
+        assert not pattern.search("total 100.00")  # 'sub' required
 
-    def test_sums_subtotals(self):
-        """Test that subtotals are correctly summed."""
-        pages = [
-            PdfPage(raw_text="sub total 100.00\nother line\nsub total 50.25"),
-        ]
-        extractor = NumberExtractor(pages)
 
-        result = extractor._get_subtotal_sum()
+class TestToCents:
+    """Tests for the to_cents() function."""
 
-        assert result == 150.25
+    @pytest.mark.parametrize(
+        ("number", "expected"),
+        [
+            ("123.45", 12345),
+            ("1,234.5", 123450),
+            ("0.05", 5),
+            ("30.0", 3000),
+            ("10.100", 1010),
+            (" 99.99 ", 9999),
+            ("1,234.", 123400),
+            ("1,234", 123400),
+        ],
+    )
+    def test_converts_amounts(self, number, expected):
+        """Test that amounts, with or without a fraction, are converted to exact cents."""
+        assert to_cents(number) == expected
 
-    def test_handles_case_insensitive_subtotal(self):
-        """Test case-insensitive matching of 'sub total'."""
-        pages = [
-            PdfPage(raw_text="SUB TOTAL 100.00\nSub Total 50.00"),
-        ]
-        extractor = NumberExtractor(pages)
+    @pytest.mark.parametrize("number", ["1.234", "123.45.67", "(1.00)", "", "."])
+    def test_rejects_other_numbers(self, number):
+        """Test that fractions of a cent and malformed numbers are not converted."""
+        assert to_cents(number) is None
 
-        result = extractor._get_subtotal_sum()
 
-        assert result == 150.00
+class TestCentIndex:
+    """Tests for the CentIndex class."""
 
-    def test_returns_zero_when_no_subtotals(self):
-        """Test that zero is returned when no subtotals found."""
-        pages = [PdfPage(raw_text="No subtotals here\nJust regular text")]
-        extractor = NumberExtractor(pages)
+    def test_exact_lookup(self):
+        """Test that amounts are looked up exactly without a tolerance."""
+        index = CentIndex([100, 2550])
 
-        result = extractor._get_subtotal_sum()
+        assert 2550 in index
+        assert index.contains(100)
+        assert not index.contains(101)
 
-        assert result == 0.0
+    def test_lookup_with_tolerance(self):
+        """Test that amounts within the tolerance are found."""
+        index = CentIndex([100, 2550])
 
-    def test_handles_comma_formatted_subtotals(self):
-        """Test handling of comma-formatted subtotal amounts."""
-        pages = [PdfPage(raw_text="sub total 1,234.56")]
-        extractor = NumberExtractor(pages)
+        assert index.contains(2549, tolerance=1)
+        assert index.contains(2551, tolerance=1)
+        assert not index.contains(2552, tolerance=1)
+        assert not index.contains(-1000, tolerance=5)
+        assert not index.contains(3000, tolerance=5)
 
-        result = extractor._get_subtotal_sum()
 
-        assert result == 1234.56
+class TestNumberExtractorGetAllCents:
+    """Tests for NumberExtractor.get_all_cents() method."""
 
-    def test_sums_across_multiple_pages(self):
-        """Test that subtotals are summed across multiple pages."""
+    def test_combines_decimal_numbers_and_subtotal(self):
+        """Test that all cents include decimals from pages plus subtotal sum."""
         pages = [
-            PdfPage(raw_text="Page 1\nsub total 100.00"),
-            PdfPage(raw_text="Page 2\nsub total 200.00"),
-            PdfPage(raw_text="Page 3\nsub total 300.00"),
+            PdfPage(raw_text="Transaction 50.25 1.005\nsub total 100.00"),
+            PdfPage(raw_text="Another 75.50 100\nSUB TOTAL 1,000.00"),
         ]
         extractor = NumberExtractor(pages)
 
-        result = extractor._get_subtotal_sum()
-
-        assert result == 600.00
-
+        assert extractor.get_all_cents().cents == {5025, 10000, 7550, 100000, 110000}
 
-class TestNumberExtractorGetAllNumbers:
-    """Tests for NumberExtractor.get_all_numbers() method."""
-
-    def test_combines_decimal_numbers_and_subtotal(self):
-        """Test that all numbers include decimals from pages plus subtotal sum."""
-        pages = [
-            PdfPage(raw_text="Transaction 50.25\nsub total 100.00"),
-            PdfPage(raw_text="Another 75.50"),
-        ]
+    def test_sums_subtotals_without_cents(self):
+        """Test that subtotals with an empty fraction are summed."""
+        pages = [PdfPage(raw_text="sub total 1,234.\nsub total 0.50")]
         extractor = NumberExtractor(pages)
 
-        result = extractor.get_all_numbers()
-
-        # Should include: 50.25, 100.00, 75.50, and subtotal sum 100.00
-        assert 50.25 in result
-        assert 100.00 in result
-        assert 75.50 in result
+        assert 123450 in extractor.get_all_cents()
 
     def test_handles_empty_pages(self):
-        """Test handling when pages list is empty."""
-        extractor = NumberExtractor(pages=[])
+        """Test that the subtotal sum of zero is included."""
+        assert NumberExtractor(pages=[]).get_all_cents().cents == {0}
 
-        result = extractor.get_all_numbers()
+    def test_ignores_integers(self):
+        """Test that plain integers without decimals are ignored."""
+        pages = [PdfPage(raw_text="Integer only: 100\nAnother integer: 50")]
 
-        # Should contain at least the subtotal sum (0.0)
-        assert 0.0 in result
+        assert NumberExtractor(pages).get_all_cents().cents == {0}
 
-    def test_returns_set_type(self):
-        """Test that result is a set (no duplicates)."""
+    def test_sums_subtotals_across_pages(self):
+        """Test that subtotals are matched case-insensitively and summed across pages."""
         pages = [
-            PdfPage(raw_text="Amount: 100.00\nSame amount: 100.00"),
+            PdfPage(raw_text="SUB TOTAL 100.00\nother line"),
+            PdfPage(raw_text="Sub Total 1,234.56"),
         ]
-        extractor = NumberExtractor(pages)
-
-        result = extractor.get_all_numbers()
-
-        assert isinstance(result, set)
-        # 100.00 should only appear once
-        assert list(result).count(100.00) == 1 or 100.00 in result
-
-
-class TestNumberExtractorPatterns:
-    """Tests for NumberExtractor regex pattern properties."""
-
-    def test_number_pattern_matches_digits_and_separators(self):
-        """Test that number pattern matches expected formats."""
-        extractor = NumberExtractor(pages=[])
-        pattern = extractor._number_pattern
 
-        assert pattern.search("123.45")
-        assert pattern.search("1,234.56")
-        assert pattern.search("100")
-
-    def test_decimal_pattern_requires_decimal_point(self):
-        """Test that decimal pattern requires decimal point at end."""
-        extractor = NumberExtractor(pages=[])
-        pattern = extractor._decimal_pattern
-
-        assert pattern.match("123.45")
-        assert pattern.match("0.5")
-        assert not pattern.match("123")
-        assert not pattern.match("123.45.67")
-
-    def test_subtotal_pattern_matches_subtotal_lines(self):
-        """Test that subtotal pattern matches 'sub total' lines."""
-        extractor = NumberExtractor(pages=[])
-        pattern = extractor._subtotal_pattern
-
-        assert pattern.search("sub total 100.00")
-        assert pattern.search("SUB TOTAL 1,234.56")
-        assert pattern.search("Sub Total amount 50.25")
-        assert not pattern.search("total 100.00")  # 'sub' required
+        assert 133456 in NumberExtractor(pages).get_all_cents()
@@ -10,6 +10,9 @@ class MockPdfDocument:
         self.metadata_identifier = MetadataIdentifier(**metadata)
         self.raw_text = raw_text
 
+    def iter_page_texts(self):
+        yield self.raw_text
+
 
 @pytest.fixture
 def mock_bank() -> Mock:
@@ -0,0 +1,88 @@
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from monopoly.config import DateOrder, MultilineConfig, PdfConfig, StatementConfig
+from monopoly.constants import EntryType
+from monopoly.handler import StatementHandler
+from monopoly.pdf import PdfPage
+from monopoly.statements.page_filter import PageFilter
+
+
+@pytest.fixture
+def statement_config():
+    return StatementConfig(
+        statement_type=EntryType.CREDIT,
+        header_pattern=re.compile(r"DATE\s+DESCRIPTION\s+AMOUNT"),
+        transaction_pattern=re.compile(r"(?P<transaction_date>\d{2} \w{3})\s+(?P<description>.*?)\s+(?P<amount>\d+)"),
+        statement_date_pattern=re.compile(r"Statement Date: (\d{2} \w{3} \d{4})"),
+        transaction_date_order=DateOrder("DMY"),
+        prev_balance_pattern=re.compile(r"PREVIOUS BALANCE"),
+    )
+
+
+@pytest.fixture
+def page_filter(statement_config):
+    return PageFilter([statement_config])
+
+
+@pytest.mark.parametrize(
+    "raw_text",
+    [
+        "01 OCT  COFFEE SHOP  4.50",
+        "01 OCT  COFFEE SHOP  1,200.",
+        "01 OCT  COFFEE SHOP  .50",
+        "DATE  DESCRIPTION  AMOUNT",
+        "Statement Date: 01 Oct 2024",
+        "PREVIOUS BALANCE",
+    ],
+)
+def test_relevant_pages(page_filter: PageFilter, raw_text: str):
+    assert page_filter.is_relevant(PdfPage(f"Terms and conditions\n{raw_text}\nApply."))
+
+
+def test_boilerplate_page(page_filter: PageFilter):
+    page = PdfPage("Terms and conditions\nInterest is charged from 1 Oct 2024\nCall 1800 123 4567")
+    assert not page_filter.is_relevant(page)
+
+
+def test_multiline_statement_date():
+    config = StatementConfig(
+        statement_type=EntryType.CREDIT,
+        header_pattern=re.compile(r"DATE\s+DESCRIPTION\s+AMOUNT"),
+        transaction_pattern=re.compile(r"(?P<amount>\d+)"),
+        statement_date_pattern=re.compile(r"Statement Date (\d{2} \w{3} \d{4})"),
+        multiline_config=MultilineConfig(multiline_statement_date=True),
+    )
+    page = PdfPage("Statement Date\n01 Oct 2024")
+
+    assert PageFilter([config]).is_relevant(page)
+
+
+@pytest.mark.parametrize(
+    "prune_pages, bank_prune_pages, expected_pages, expected_pruned",
+    [
+        (True, True, 2, 1),
+        (False, True, 3, 0),
+        (True, False, 3, 0),
+        (True, None, 3, 0),
+    ],
+)
+def test_handler_prunes_pages(
+    statement_config, prune_pages: bool, bank_prune_pages: bool | None, expected_pages: int, expected_pruned: int
+):
+    class MockBank:
+        statement_configs = [statement_config]
+        pdf_config = PdfConfig() if bank_prune_pages is None else PdfConfig(prune_pages=bank_prune_pages)
+
+    parser = Mock(bank=MockBank, prune_pages=prune_pages)
+    parser.pages = [
+        PdfPage("DATE  DESCRIPTION  AMOUNT\n01 OCT  COFFEE SHOP  4.50"),
+        PdfPage("Terms and conditions"),
+        PdfPage("02 OCT  BAKERY  12.00"),
+    ]
+    handler = StatementHandler(parser)
+
+    assert len(handler.pages) == expected_pages
+    assert handler.pruned_pages == expected_pruned
@@ -0,0 +1,51 @@
+"""
+Fuzzes the transaction patterns of every bank and of the generic parser for catastrophic backtracking.
+
+Each pattern is searched against adversarial and realistic lines, and fails if
+any single search exceeds the time budget. Run `task fuzz` to print the slowest
+line for each bank's patterns.
+"""
+
+from time import thread_time
+
+import pytest
+from test_utils.lines import generate_adversarial_lines, generate_realistic_lines
+from test_utils.patterns import TransactionPattern, get_bank_patterns, get_generic_patterns
+
+LINE_LENGTH = 120
+TIME_BUDGET = 0.1
+
+lines = generate_adversarial_lines(LINE_LENGTH) + generate_realistic_lines(100)
+test_cases = [
+    pytest.param(transaction_pattern, id=transaction_pattern.id)
+    for transaction_pattern in get_bank_patterns() + get_generic_patterns()
+]
+
+
+def time_search(transaction_pattern: TransactionPattern, line: str) -> float:
+    # CPU time of the current thread, so that other tests running in parallel do not count towards the budget
+    start = thread_time()
+    transaction_pattern.pattern.search(line)
+    return thread_time() - start
+
+
+def get_slowest_search(transaction_pattern: TransactionPattern) -> tuple[float, str]:
+    """Return the slowest search time and its line, stopping early once the budget is exceeded."""
+    slowest = (0.0, "")
+    for line in lines:
+        elapsed = time_search(transaction_pattern, line)
+        if elapsed > TIME_BUDGET:
+            # retry, to rule out a one-off delay
+            elapsed = min(elapsed, time_search(transaction_pattern, line))
+        slowest = max(slowest, (elapsed, line))
+        if slowest[0] > TIME_BUDGET:
+            break
+    return slowest
+
+
+@pytest.mark.parametrize("transaction_pattern", test_cases)
+def test_pattern_backtracking(transaction_pattern: TransactionPattern):
+    elapsed, line = get_slowest_search(transaction_pattern)
+    print(f"\n{transaction_pattern.id:<40} slowest={elapsed * 1000:8.2f}ms line={line!r}")
+
+    assert elapsed < TIME_BUDGET, f"{transaction_pattern.id} took {elapsed * 1000:.0f}ms to search {line!r}"
@@ -0,0 +1,44 @@
+import pytest
+
+from monopoly.pdf import CompactPdfPage, PdfPage
+
+
+@pytest.mark.parametrize(
+    "raw_text",
+    [
+        "",
+        "\n",
+        "single line",
+        "01 OCT  COFFEE  4.50\n02 OCT  BAKERY  12.00",
+        "01 OCT  COFFEE  4.50\n\n\n02 OCT  BAKERY  12.00\n",
+    ],
+)
+def test_compact_page_lines_match_split(raw_text: str):
+    expected = PdfPage(raw_text).lines
+    lines = CompactPdfPage(raw_text).lines
+
+    assert len(lines) == len(expected)
+    assert list(lines) == expected
+    assert [lines[i] for i in range(-len(expected), len(expected))] == expected * 2
+    assert lines[1:] == expected[1:]
+    assert lines[-3:-1] == expected[-3:-1]
+    assert lines[::-1] == expected[::-1]
+    assert lines[5:100] == expected[5:100]
+
+
+def test_compact_page_lines_index_error():
+    lines = CompactPdfPage("foo\nbar").lines
+
+    with pytest.raises(IndexError):
+        lines[2]
+    with pytest.raises(IndexError):
+        lines[-3]
+
+
+def test_compact_page_lines_sequence_methods():
+    lines = CompactPdfPage("foo\nbar\nfoo").lines
+
+    assert "bar" in lines
+    assert lines.index("bar") == 1
+    assert lines.count("foo") == 2
+    assert list(reversed(lines)) == ["foo", "bar", "foo"]
@@ -0,0 +1,110 @@
+import re
+
+import pytest
+from test_utils.lines import generate_adversarial_lines, generate_realistic_lines
+from test_utils.patterns import get_bank_patterns, get_generic_patterns
+
+from monopoly.regex_engine import RegexEngine, Re2Pattern, compile_pattern, get_engine, translate
+
+transaction_patterns = get_bank_patterns() + get_generic_patterns()
+lines = [
+    *generate_realistic_lines(500),
+    *generate_adversarial_lines(60),
+    "01 Jan  CAFÉ DU MONDE  12.34",
+    "01 Jan  COFFEE  12.34",
+    "",
+]
+
+
+@pytest.fixture
+def re2_engine():
+    pytest.importorskip("re2")
+    return get_engine("re2")
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        (r"\d+\s+\S", r"\d+[\t\n\v\f\r\x1c-\x1f ]+[^\t\n\v\f\r\x1c-\x1f ]"),
+        (r"[\s,]", r"[\t\n\v\f\r\x1c-\x1f ,]"),
+        (r"(?P<amount>\d+)$", r"(?P<amount>\d+)(?:\n?\z)"),
+        (r"(?i:jan|feb)\Z", r"(?i:jan|feb)\z"),
+        (r"[]$]", r"[]$]"),
+    ],
+)
+def test_translate(pattern, expected):
+    assert translate(re.compile(pattern)) == expected
+
+
+def test_translate_flags():
+    assert translate(re.compile("date$", re.IGNORECASE | re.MULTILINE)) == "(?im)date$"
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r"^(?!.*Opening Balance).*",
+        r"(?<=\s)\d+",
+        r"(?P<day>\d+)-(?P=day)",
+        r"(\d)\1",
+        r"(?i)date",
+        r"\d{,2}",
+        r"[\S,]",
+    ],
+)
+def test_translate_unsupported(pattern):
+    assert translate(re.compile(pattern)) is None
+
+
+def test_unsupported_pattern_falls_back_to_re(re2_engine):
+    pattern = re.compile(r"^(?!.*Opening Balance).*")
+    assert compile_pattern(pattern, re2_engine) is pattern
+
+
+def test_default_engine_runs_re():
+    pattern = re.compile(r"\d+")
+    assert compile_pattern(pattern, RegexEngine()) is pattern
+    assert compile_pattern(r"\d+", RegexEngine()) == pattern
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown regex engine"):
+        get_engine("pcre")
+
+
+@pytest.mark.parametrize("transaction_pattern", transaction_patterns, ids=lambda pattern: pattern.id)
+def test_re2_matches_are_identical(re2_engine, transaction_pattern):
+    pattern = transaction_pattern.pattern
+    compiled = compile_pattern(pattern, re2_engine)
+    if not isinstance(compiled, Re2Pattern):
+        pytest.skip("pattern runs on re")
+
+    for line in lines:
+        expected = pattern.search(line)
+        match = compiled.search(line)
+        assert (match and (match.span(), match.groupdict())) == (expected and (expected.span(), expected.groupdict()))
+        if expected:
+            assert match.groups() == expected.groups()
+            assert [match.span(name) for name in pattern.groupindex] == [
+                expected.span(name) for name in pattern.groupindex
+            ]
+        assert [m.span() for m in compiled.finditer(line)] == [m.span() for m in pattern.finditer(line)]
+
+
+def test_re2_match(re2_engine):
+    pattern = re.compile(r"(?P<date>\d+/\d+)\s+(?P<amount>\d+\.\d{2})(?P<polarity> CR)?")
+    match = compile_pattern(pattern, re2_engine).search("foo 12/01  4.50")
+
+    assert match.re is pattern
+    assert match.group() == "12/01  4.50"
+    assert match["amount"] == match.group("amount") == "4.50"
+    assert match.span("amount") == match.span(2) == (11, 15)
+    assert (match.start("date"), match.end("date")) == (4, 9)
+    assert match.groupdict() == {"date": "12/01", "amount": "4.50", "polarity": None}
+
+
+def test_re2_pattern_matches_non_ascii_strings_on_re(re2_engine):
+    compiled = compile_pattern(r"(?P<amount>\d+\.\d{2})", re2_engine)
+
+    assert isinstance(compiled.search("café 4.50"), re.Match)
+    assert compiled.search("café 4.50").span("amount") == (5, 9)
@@ -1,6 +1,9 @@
+from dataclasses import replace
+
 import pytest
 from pymupdf import Document
 
+from monopoly.pdf import PdfPage
 from monopoly.statements import CreditStatement, DebitStatement
 from monopoly.statements.base import SafetyCheckError
 from monopoly.statements.transaction import Transaction
@@ -93,3 +96,31 @@ def test_safety_check_does_not_pass_when_total_not_in_document(credit_statement:
     # Old logic would wrongly return True — corrected logic should raise an error.
     with pytest.raises(SafetyCheckError):
         credit_statement.perform_safety_check()
+
+
+@pytest.mark.parametrize(("tolerance", "passes"), [(0, False), (1, True)])
+def test_credit_safety_check_tolerance(credit_statement: CreditStatement, tolerance, passes):
+    credit_statement.pages[0] = PdfPage(raw_text="Statement Page 1\ntotal amount 30.01")
+    credit_statement.config = replace(credit_statement.config, safety_check_tolerance=tolerance)
+    credit_statement.transactions = [
+        Transaction(transaction_date="01/01", description="A", amount=10.1, polarity="CR"),
+        Transaction(transaction_date="02/01", description="B", amount=19.9, polarity="CR"),
+    ]
+
+    if passes:
+        assert credit_statement.perform_safety_check()
+    else:
+        with pytest.raises(SafetyCheckError):
+            credit_statement.perform_safety_check()
+
+
+def test_safety_check_sums_in_exact_cents(debit_statement: DebitStatement):
+    # 0.1 + 0.2 is 0.30000000000000004 as a float
+    debit_statement.pages[0] = PdfPage(raw_text="total credit 0.30 total debit 3.00")
+    debit_statement.transactions = [
+        Transaction(transaction_date="23/01", description="foo", amount=0.1, polarity="CR"),
+        Transaction(transaction_date="24/01", description="bar", amount=0.2, polarity="CR"),
+        *[Transaction(transaction_date="25/01", description="baz", amount=0.3) for _ in range(10)],
+    ]
+
+    assert debit_statement.perform_safety_check()
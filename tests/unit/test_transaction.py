@@ -1,4 +1,18 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+from test_utils.statements import create_statement, get_bank_configs, synthesize_statement
+
 from monopoly.statements import Transaction
+from monopoly.statements.transaction import (
+    RawTransaction,
+    TransactionSettings,
+    build_transactions,
+    get_transaction_settings,
+)
+
+synthetic_cases = get_bank_configs()
 
 
 def test_transaction_handles_comma():
@@ -13,3 +27,78 @@ def test_transaction_handles_whitespace():
         amount="123,123.12",
     )
     assert transaction.description == "foo, bar"
+
+
+@pytest.mark.parametrize(
+    "raw_transaction",
+    [
+        RawTransaction(description="  foo   bar ", amount="1,234.50", transaction_date="01/02"),
+        RawTransaction(description="foo", amount="(12.00)", transaction_date="01/02", polarity="DR"),
+        RawTransaction(description="foo", amount="1'234.00", transaction_date="01/02", polarity="CR"),
+        RawTransaction(description="foo", amount="5.00", transaction_date="01/02", polarity="+", balance="1,000.00"),
+        RawTransaction(description="foo", amount="0.00", transaction_date="01/02", polarity="CR"),
+        RawTransaction(description="foo", amount="-0", transaction_date="01/02"),
+    ],
+)
+@pytest.mark.parametrize("auto_polarity", [True, False])
+def test_transaction_from_raw(raw_transaction: RawTransaction, auto_polarity: bool):
+    expected = Transaction(**raw_transaction.as_dict(), auto_polarity=auto_polarity)
+    transaction = Transaction.from_raw(raw_transaction, auto_polarity=auto_polarity)
+
+    assert transaction == expected
+    assert repr(transaction) == repr(expected)
+
+
+@pytest.mark.parametrize(
+    "raw_transaction",
+    [
+        RawTransaction(description="foo", amount="", transaction_date="01/02"),
+        RawTransaction(description="foo", amount="1.2.3", transaction_date="01/02"),
+        RawTransaction(description="foo", amount="1.00", transaction_date=None),
+    ],
+)
+def test_transaction_from_raw_validates_untrusted_values(raw_transaction: RawTransaction):
+    with pytest.raises(ValidationError):
+        Transaction.from_raw(raw_transaction)
+
+
+def test_build_transactions_strict(set_strict_transactions):
+    raw_transactions = [RawTransaction(description="foo", amount="1.00", transaction_date="01/02")]
+
+    with patch.object(Transaction, "from_raw") as from_raw:
+        set_strict_transactions("true")
+        assert build_transactions(raw_transactions) == [Transaction(**raw_transactions[0].as_dict())]
+        from_raw.assert_not_called()
+
+        set_strict_transactions("false")
+        build_transactions(raw_transactions)
+        from_raw.assert_called_once()
+
+
+def test_build_transactions_reads_settings_once(set_strict_transactions):
+    raw_transactions = [RawTransaction(description="foo", amount="1.00", transaction_date="01/02")]
+    set_strict_transactions("false")
+
+    with patch(
+        "monopoly.statements.transaction.TransactionSettings", wraps=TransactionSettings
+    ) as transaction_settings:
+        build_transactions(raw_transactions)
+        build_transactions(raw_transactions)
+
+    transaction_settings.assert_called_once()
+    assert get_transaction_settings.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("config", synthetic_cases.values(), ids=synthetic_cases.keys())
+def test_fast_path_matches_validation_on_synthetic_statements(config, set_strict_transactions):
+    synthetic = synthesize_statement(config, page_count=2)
+
+    results = []
+    for strict in ("true", "false"):
+        set_strict_transactions(strict)
+        statement = create_statement(config, synthetic)
+        results.append(statement.get_transactions())
+
+    expected, transactions = results
+    assert transactions == expected
+    assert str(transactions) == str(expected)
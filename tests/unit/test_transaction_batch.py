@@ -0,0 +1,207 @@
+import random
+from copy import deepcopy
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from pydantic import ValidationError
+
+from monopoly.banks import Ocbc
+from monopoly.pdf import PdfPage
+from monopoly.pipeline import Pipeline
+from monopoly.statements import CreditStatement, DebitStatement, Transaction
+from monopoly.statements.base import SafetyCheckError
+from monopoly.statements.transaction import RawTransaction, build_transactions
+from monopoly.statements.number_extractor import CentIndex
+
+np = pytest.importorskip("numpy")
+
+from monopoly.statements.transaction_batch import TransactionBatch  # noqa: E402
+
+transactions = [
+    Transaction(transaction_date="23/01", description="COFFEE", amount="4.50"),
+    Transaction(transaction_date="24/01", description="SALARY", amount="1,000.00", polarity="CR", balance="1,200.00"),
+    Transaction(transaction_date="25/01", description="COFFEE", amount="4.50"),
+    Transaction(transaction_date="26/01", description="REFUND", amount="(2.00)", auto_polarity=False),
+]
+
+
+def test_from_transactions():
+    batch = TransactionBatch.from_transactions(transactions)
+
+    assert len(batch) == 4
+    assert batch.dates.tolist() == ["23/01", "24/01", "25/01", "26/01"]
+    assert batch.description_values == ("COFFEE", "SALARY", "REFUND")
+    assert batch.description_codes.tolist() == [0, 1, 0, 2]
+    assert batch.descriptions.tolist() == ["COFFEE", "SALARY", "COFFEE", "REFUND"]
+    assert batch.amounts.dtype == np.float64
+    assert batch.amounts.tolist() == [-4.5, 1000.0, -4.5, 2.0]
+    assert batch.cents.tolist() == [-450, 100000, -450, 200]
+    assert batch.balances.tolist() == [0.0, 1200.0, 0.0, 0.0]
+    assert batch.debits.tolist() == [False, True, False, True]
+    assert batch.credits.tolist() == [True, False, True, False]
+
+
+def test_to_transactions():
+    batch = TransactionBatch.from_transactions(transactions)
+
+    assert batch.to_transactions() == transactions
+    assert [t.auto_polarity for t in batch.to_transactions()] == [True, True, True, False]
+
+
+raw_transactions = [
+    RawTransaction(transaction_date="23/01", description="COFFEE  BEAN", amount="4.50"),
+    RawTransaction(transaction_date="24/01", description="SALARY", amount="1,000.00", polarity="CR", balance="1,200"),
+    RawTransaction(transaction_date="25/01", description="CASHBACK", amount="(2.00)"),
+    RawTransaction(transaction_date="26/01", description="REFUND", amount="3.00", polarity="+"),
+    RawTransaction(transaction_date="27/01", description="FEE WAIVER", amount="-0.00"),
+    RawTransaction(transaction_date="28/01", description="COFFEE BEAN", amount="1'234.56 "),
+]
+
+
+@pytest.mark.parametrize("auto_polarity", [True, False])
+def test_from_raw(auto_polarity):
+    batch = TransactionBatch.from_raw(raw_transactions, auto_polarity=auto_polarity)
+    expected = build_transactions(raw_transactions, auto_polarity=auto_polarity, strict=True)
+
+    assert batch.to_transactions() == expected
+    assert batch.description_values == ("COFFEE BEAN", "SALARY", "CASHBACK", "REFUND", "FEE WAIVER")
+    assert [t.polarity for t in batch.to_transactions()] == [t.polarity for t in expected]
+    assert [str(t.amount) for t in batch.to_transactions()] == [str(t.amount) for t in expected]
+    assert batch.balances.tolist() == [t.balance for t in expected]
+
+
+def test_from_raw_validates_untrusted_values():
+    untrusted = [RawTransaction(transaction_date=None, description="FOO", amount="1.00")]
+    with pytest.raises(ValidationError):
+        TransactionBatch.from_raw(untrusted)
+
+    invalid = [*raw_transactions, RawTransaction(transaction_date="01/01", description="FOO", amount="1.2.3")]
+    with pytest.raises(ValidationError):
+        TransactionBatch.from_raw(invalid)
+
+
+def test_concat():
+    first = TransactionBatch.from_transactions(transactions[:2])
+    second = TransactionBatch.from_transactions(transactions[2:])
+
+    batch = first.concat(second)
+
+    assert batch.to_transactions() == transactions
+    assert batch.description_values == ("COFFEE", "SALARY", "REFUND")
+
+
+def test_get_transactions(statement, monkeypatch):
+    monkeypatch.setattr(statement.config, "transaction_pattern", Ocbc.credit.transaction_pattern)
+    monkeypatch.setattr(statement.config, "transaction_batch", True)
+    statement.pages = [PdfPage("19/06 YA KUN KAYA TOAST 3.20\n20/06 FAIRPRICE FINEST 9.90 CR")]
+
+    result = statement.get_transactions()
+
+    assert result == [
+        Transaction(transaction_date="19/06", description="YA KUN KAYA TOAST", amount=-3.2),
+        Transaction(transaction_date="20/06", description="FAIRPRICE FINEST", amount=9.9, polarity="CR"),
+    ]
+    assert statement.transaction_batch.to_transactions() == result
+
+
+def test_get_transactions_with_prev_month_balance(credit_statement, monkeypatch):
+    monkeypatch.setattr(credit_statement.config, "transaction_pattern", Ocbc.credit.transaction_pattern)
+    monkeypatch.setattr(credit_statement.config, "transaction_batch", True)
+    monkeypatch.setattr(credit_statement.config, "prev_balance_pattern", Ocbc.credit.prev_balance_pattern)
+    credit_statement.pages = [PdfPage("LAST MONTH'S BALANCE 100.00\n19/06 YA KUN KAYA TOAST 3.20")]
+
+    result = credit_statement.get_transactions()
+
+    assert [t.description for t in result] == ["LAST MONTH'S BALANCE", "YA KUN KAYA TOAST"]
+    assert credit_statement.transaction_batch.to_transactions() == result
+    assert credit_statement.get_cent_totals() == (0, -10320)
+
+
+def test_rows():
+    batch = TransactionBatch.from_transactions(transactions)
+    assert next(batch.rows()) == ["23/01", "COFFEE", -4.5, 0]
+
+
+def test_empty_batch():
+    batch = TransactionBatch.from_transactions([])
+
+    assert len(batch) == 0
+    assert (batch.total(), batch.debit_total(), batch.credit_total()) == (0.0, 0.0, 0.0)
+    assert batch.to_transactions() == []
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_totals_match_sums(seed):
+    rng = random.Random(seed)
+    amounts = [f"{rng.uniform(-5000, 5000):.2f}" for _ in range(rng.randint(1, 2000))]
+    random_transactions = [
+        Transaction(transaction_date="01/01", description="foo", amount=amount, polarity="CR") for amount in amounts
+    ]
+    batch = TransactionBatch.from_transactions(random_transactions)
+    amounts = [t.amount for t in random_transactions]
+
+    assert round(batch.total(), 2) == round(sum(amounts), 2)
+    assert round(abs(batch.debit_total()), 2) == round(abs(sum(a for a in amounts if a > 0)), 2)
+    assert round(abs(batch.credit_total()), 2) == round(abs(sum(a for a in amounts if a < 0)), 2)
+
+
+@pytest.mark.parametrize(
+    ("numbers", "passes"),
+    [({99200}, True), ({100100, 900}, True), ({100100}, False)],
+)
+@pytest.mark.parametrize("batch", [True, False])
+def test_credit_safety_check(credit_statement: CreditStatement, monkeypatch, numbers, passes, batch):
+    monkeypatch.setattr(credit_statement.config, "transaction_batch", batch)
+    credit_statement.transactions = transactions[:3] + [
+        Transaction(transaction_date="27/01", description="CAKE", amount="1.00", polarity="CR")
+    ]
+
+    with patch.object(CreditStatement, "get_cent_index_from_document", return_value=CentIndex(numbers)):
+        if passes:
+            assert credit_statement.perform_safety_check()
+        else:
+            with pytest.raises(SafetyCheckError):
+                credit_statement.perform_safety_check()
+
+
+@pytest.mark.parametrize("batch", [True, False])
+def test_debit_safety_check(debit_statement: DebitStatement, monkeypatch, batch):
+    monkeypatch.setattr(debit_statement.config, "transaction_batch", batch)
+    debit_statement.transactions = transactions
+
+    with patch.object(DebitStatement, "get_cent_index_from_document", return_value=CentIndex({100200, 900})):
+        assert debit_statement.perform_safety_check()
+    with patch.object(DebitStatement, "get_cent_index_from_document", return_value=CentIndex({100200})):
+        with pytest.raises(SafetyCheckError):
+            debit_statement.perform_safety_check()
+
+
+def test_map_dates():
+    batch = TransactionBatch.from_transactions([*transactions[:3], transactions[0]])
+    converted = []
+
+    def convert_date(date):
+        converted.append(date)
+        return f"2024-01-{date[:2]}"
+
+    mapped = batch.map_dates(convert_date)
+
+    assert mapped.dates.tolist() == ["2024-01-23", "2024-01-24", "2024-01-25", "2024-01-23"]
+    assert sorted(converted) == ["23/01", "24/01", "25/01"]
+    assert batch.dates.tolist() == ["23/01", "24/01", "25/01", "23/01"]
+
+
+def test_transform_batch(statement, monkeypatch):
+    monkeypatch.setattr(statement.config, "transaction_date_format", "%d/%m")
+    statement.statement_date = datetime(2024, 1, 31)
+    statement.transactions = deepcopy(transactions)
+    expected = Pipeline.transform(statement)
+    statement.transactions = deepcopy(transactions)
+
+    batch = Pipeline.transform_batch(statement)
+
+    assert batch.dates.tolist() == ["2024-01-23", "2024-01-24", "2024-01-25", "2024-01-26"]
+    assert statement.transaction_batch is batch
+    assert statement.transactions == batch.to_transactions() == expected